@@ -1,20 +1,91 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional
+import asyncio
 import os
+import secrets
+import threading
 from dotenv import load_dotenv
 
+from calendar_assistant.models.calendar_event import CalendarEvent
 from calendar_assistant.models.google_calendar_model import GoogleCalendarModel
-from calendar_assistant.models.supervisor_model import SupervisorModel
+from calendar_assistant.models.intent_router import IntentRouter
+from calendar_assistant.models.push_notifications import NotificationReceiver
+from calendar_assistant.models.write_queue import OfflineWriteQueue
+from calendar_assistant.models.timezone_service import timezone_service
+from calendar_assistant.models.async_google_calendar_model import (
+    AsyncGoogleCalendarModel,
+)
 
 
 class AppController:
+    # Coalesce bursts of change notifications into one refresh
+    PUSH_DEBOUNCE_SECONDS = 1.0
+    # Reopen notification channels this long before they expire
+    CHANNEL_RENEW_MARGIN = timedelta(minutes=10)
+
     def __init__(self):
-        self.google_calendar = GoogleCalendarModel()
-        self.supervisor = None
-        self._init_model()
+        # "fast" (default) defers the Google service and the LLM agent until
+        # first use or warm_up(); "eager" builds both before the UI starts.
+        self.startup_mode = os.getenv("CALENDAR_STARTUP_MODE", "fast").lower()
+        lazy = self.startup_mode != "eager"
+
+        self.google_calendar = GoogleCalendarModel(lazy=lazy)
+        # Writes are journaled and flushed in the background, so chat turns
+        # never wait on them and survive being offline.
+        self.write_queue = None
+        if os.getenv("CALENDAR_OFFLINE_WRITES", "1") != "0":
+            self.write_queue = OfflineWriteQueue(self.google_calendar)
+            self.write_queue.start()
+        # Non-blocking wrapper used by every async code path
+        self.calendar = AsyncGoogleCalendarModel(
+            self.google_calendar, write_queue=self.write_queue
+        )
+        # Simple create/list/delete requests skip the LLM agent
+        self.intent_router = None
+        if os.getenv("CALENDAR_FAST_PATH", "1") != "0":
+            self.intent_router = IntentRouter(self.calendar)
+        self._supervisor = None
+        self._supervisor_initialized = False
+        self._supervisor_lock = threading.Lock()
+        # Last successfully fetched events per (year, month), shown on errors
+        self._last_month_events: Dict[tuple, List[CalendarEvent]] = {}
+
+        # Push notifications (see start_push_notifications)
+        self._push_receiver: Optional[NotificationReceiver] = None
+        self._push_address = ""
+        self._push_token = ""
+        self._push_refresh: Optional[Callable[[], Awaitable[None]]] = None
+        self._push_refresh_task: Optional[asyncio.Task] = None
+        self._channel_renewal_task: Optional[asyncio.Task] = None
+
+        if not lazy:
+            self._init_model()
+
+    @property
+    def supervisor(self):
+        """The supervisor model, created on first access in fast startup mode."""
+        if not self._supervisor_initialized:
+            self._init_model()
+        return self._supervisor
+
+    async def get_supervisor(self):
+        """Get the supervisor model, building it off the event loop if needed."""
+        return await asyncio.to_thread(lambda: self.supervisor)
+
+    async def warm_up(self):
+        """Build the Google service and the agent in the background."""
+        await asyncio.gather(self.calendar.ensure_service(), self.get_supervisor())
 
     def _init_model(self):
         """Initialize the supervisor model if OpenAI API key is available."""
+        with self._supervisor_lock:
+            if self._supervisor_initialized:
+                return
+            self._create_supervisor()
+            self._supervisor_initialized = True
+
+    def _create_supervisor(self):
+        """Create the supervisor model if the OpenAI API key is available."""
         load_dotenv()
         api_key = os.getenv("OPENAI_API_KEY")
         model_name = os.getenv("OPENAI_MODEL", "gpt-4.1-nano")
@@ -23,18 +94,138 @@ class AppController:
             os.environ["OPENAI_API_KEY"] = api_key
             os.environ["OPENAI_MODEL"] = model_name
 
+            # Imported here because LangChain is slow to import and is not
+            # needed to show the first frame.
+            from calendar_assistant.models.supervisor_model import SupervisorModel
+
             # Initialize the supervisor model, now passing google_calendar
-            self.supervisor = SupervisorModel(
-                google_calendar_model=self.google_calendar, model_name=model_name
+            self._supervisor = SupervisorModel(
+                google_calendar_model=self.google_calendar,
+                model_name=model_name,
+                async_calendar_model=self.calendar,
             )
         else:
             print("⚠️ OpenAI API key not found. Supervisor model not initialized.")
 
+    async def start_push_notifications(
+        self, on_change: Callable[[], Awaitable[None]]
+    ) -> bool:
+        """
+        Refresh on Google push notifications instead of waiting for a chat turn.
+
+        Enabled by setting ``GOOGLE_PUSH_ADDRESS`` to a public HTTPS URL that
+        forwards to the local receiver on ``GOOGLE_PUSH_HOST``:``GOOGLE_PUSH_PORT``
+        (default 127.0.0.1:8765). A watch channel is opened for every selected
+        calendar, and ``on_change`` is awaited (debounced) whenever one of
+        them reports a change. Returns True if notifications are active.
+        """
+        address = os.getenv("GOOGLE_PUSH_ADDRESS")
+        if not address or not await self.calendar.ensure_service():
+            return False
+
+        loop = asyncio.get_running_loop()
+        self._push_refresh = on_change
+        self._push_receiver = NotificationReceiver(
+            # Called on the receiver's thread; hop back onto the event loop
+            on_change=lambda calendar_id: loop.call_soon_threadsafe(
+                self._schedule_push_refresh
+            ),
+            host=os.getenv("GOOGLE_PUSH_HOST", "127.0.0.1"),
+            port=int(os.getenv("GOOGLE_PUSH_PORT", "8765")),
+        )
+        self._push_receiver.start()
+        self._push_token = secrets.token_urlsafe(24)
+        self._push_address = address
+
+        opened = 0
+        for calendar_id in await self.calendar.get_selected_calendar_ids():
+            if await self._open_channel(calendar_id):
+                opened += 1
+
+        if not opened:
+            self._push_receiver.stop()
+            self._push_receiver = None
+            return False
+
+        self._channel_renewal_task = asyncio.create_task(self._renew_channels())
+        return True
+
+    def shutdown(self):
+        """Stop background work on exit, flushing queued writes if possible."""
+        self.stop_push_notifications()
+        if self.intent_router is not None and self.intent_router.get_stats()["total"]:
+            print(self.intent_router.summary())
+        if self._supervisor is not None and self._supervisor.cache is not None:
+            stats = self._supervisor.cache.get_stats()
+            if stats["hits"] or stats["plan_hits"]:
+                print(
+                    f"⚡ Answered {stats['hits']} requests from the agent cache and "
+                    f"{stats['plan_hits']} by replaying cached tool plans"
+                )
+        if self.write_queue is not None:
+            self.write_queue.stop()
+        self.calendar.shutdown()
+
+    def stop_push_notifications(self):
+        """Close notification channels and the receiver (blocking; call on exit)."""
+        for task in (self._channel_renewal_task, self._push_refresh_task):
+            if task is not None:
+                task.cancel()
+        self.google_calendar.stop_all_channels()
+        if self._push_receiver is not None:
+            self._push_receiver.stop()
+            self._push_receiver = None
+
+    async def _open_channel(self, calendar_id: str) -> bool:
+        """Open a watch channel for a calendar and accept its notifications."""
+        channel = await self.calendar.watch_events(
+            calendar_id, self._push_address, self._push_token
+        )
+        if channel is None:
+            return False
+        self._push_receiver.register(channel)
+        return True
+
+    def _schedule_push_refresh(self):
+        """Start a debounced refresh unless one is already pending."""
+        if self._push_refresh_task is None or self._push_refresh_task.done():
+            self._push_refresh_task = asyncio.create_task(
+                self._push_refresh_after_delay()
+            )
+
+    async def _push_refresh_after_delay(self):
+        await asyncio.sleep(self.PUSH_DEBOUNCE_SECONDS)
+        try:
+            await self._push_refresh()
+        except Exception as e:
+            print(f"Error refreshing after change notification: {e}")
+
+    async def _renew_channels(self):
+        """Replace each channel shortly before Google expires it."""
+        while True:
+            channels = list(self.google_calendar.channels.values())
+            expiring = [c for c in channels if c["expiration"] is not None]
+            if not expiring:
+                return
+
+            channel = min(expiring, key=lambda c: c["expiration"])
+            renew_at = channel["expiration"] - self.CHANNEL_RENEW_MARGIN
+            delay = (renew_at - datetime.now(timezone.utc)).total_seconds()
+            await asyncio.sleep(max(delay, 0))
+
+            # Open the replacement first so no change goes unnoticed
+            if await self._open_channel(channel["calendar_id"]):
+                self._push_receiver.unregister(channel["id"])
+                await self.calendar.stop_channel(channel)
+            else:
+                # Keep the old channel until it expires, then try again
+                await asyncio.sleep(60)
+
     # Calendar functions now solely use Google sync
-    async def get_events_for_month(self, date: datetime) -> List[Dict[str, Any]]:
+    async def get_events_for_month(self, date: datetime) -> List[CalendarEvent]:
         """Get events for a month from Google Calendar."""
         google_events = []
-        if self.google_calendar.service:
+        if await self.calendar.ensure_service():
             try:
                 start_date_dt = date.replace(
                     day=1, hour=0, minute=0, second=0, microsecond=0
@@ -44,111 +235,73 @@ class AppController:
                 else:
                     end_date_dt = start_date_dt.replace(month=date.month + 1)
 
-                google_events = self.google_calendar.get_events(
-                    start_date=start_date_dt.isoformat() + "Z",
-                    end_date=end_date_dt.isoformat() + "Z",
-                    max_results=250,
+                # Refreshes every selected calendar's local store concurrently
+                # and serves the month from them, off the event loop.
+                google_events = await self.calendar.get_synced_events_multi(
+                    start_date_dt, end_date_dt
                 )
+                self._last_month_events[(date.year, date.month)] = google_events
             except Exception as e:
                 print(f"Error fetching Google Calendar events for month: {e}")
+                # Keep showing the last good result rather than "NO EVENTS"
+                google_events = self._last_month_events.get((date.year, date.month), [])
 
         return self._deduplicate_events(google_events)
 
-    async def get_today_events(self) -> List[Dict[str, Any]]:
+    async def get_today_events(self) -> List[CalendarEvent]:
         """Get today's events from Google Calendar."""
         google_events = []
-        if self.google_calendar.service:
+        if await self.calendar.ensure_service():
             try:
-                today = datetime.now().date()
-                start_date_dt = datetime.combine(today, datetime.min.time())
-                end_date_dt = datetime.combine(
-                    today + timedelta(days=1), datetime.min.time()
+                today = timezone_service.now().date()
+                start_date_dt = timezone_service.localize(
+                    datetime.combine(today, datetime.min.time())
+                )
+                end_date_dt = timezone_service.localize(
+                    datetime.combine(today + timedelta(days=1), datetime.min.time())
                 )
 
-                google_events = self.google_calendar.get_events(
-                    start_date=start_date_dt.isoformat() + "Z",
-                    end_date=end_date_dt.isoformat() + "Z",
-                    max_results=100,
+                google_events = await self.calendar.get_events_multi(
+                    start_date=start_date_dt.isoformat(),
+                    end_date=end_date_dt.isoformat(),
+                    max_results=None,
+                    detail="summary",
                 )
             except Exception as e:
                 print(f"Error fetching today's Google Calendar events: {e}")
 
         return self._deduplicate_events(google_events)
 
-    def _deduplicate_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _deduplicate_events(self, events: List[CalendarEvent]) -> List[CalendarEvent]:
         """Remove duplicate events based on title and start time."""
         seen = set()
         unique_events = []
 
         for event in events:
-            title = event.get("title", "").lower().strip()
-            start_time = event.get("start_time", "")
-            normalized_start = self._normalize_datetime_string(start_time)
-
-            key = (title, normalized_start)
+            title = event.title.lower().strip()
+            key = (title, event.start)
 
             if key not in seen and title:
                 seen.add(key)
                 unique_events.append(event)
 
-        def get_sort_key(event_item):
-            event_start_time = event_item.get("start_time", "")
-            if isinstance(event_start_time, str):
-                try:
-                    # Parse datetime and ensure it's timezone-aware for consistent comparison
-                    dt = datetime.fromisoformat(event_start_time.replace("Z", "+00:00"))
-                    # If it doesn't have timezone info, make it UTC
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
-                    return dt
-                except ValueError:
-                    # If parsing fails, return a very early date for sorting
-                    return datetime.min.replace(
-                        tzinfo=datetime.now().astimezone().tzinfo
-                    )
-            elif hasattr(event_start_time, "isoformat"):
-                # Ensure datetime object has timezone info
-                if event_start_time.tzinfo is None:
-                    event_start_time = event_start_time.replace(
-                        tzinfo=datetime.now().astimezone().tzinfo
-                    )
-                return event_start_time
-            else:
-                # Fallback for unexpected types
-                return datetime.min.replace(tzinfo=datetime.now().astimezone().tzinfo)
-
-        unique_events.sort(key=get_sort_key)
+        unique_events.sort(key=CalendarEvent.sort_key)
         return unique_events
 
-    def _normalize_datetime_string(self, datetime_input) -> str:
-        """Normalize datetime strings or objects for better duplicate detection."""
-        if not datetime_input:
-            return ""
-
-        dt_str = ""
-        if isinstance(datetime_input, datetime):
-            dt_str = datetime_input.strftime("%Y-%m-%dT%H:%M:%S")
-        elif isinstance(datetime_input, str):
-            dt_str = datetime_input
-        else:
-            dt_str = str(datetime_input)
-
-        try:
-            parsed_dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-            return parsed_dt.strftime("%Y-%m-%dT%H:%M:%S")
-
-        except ValueError:
-            if "T" not in dt_str and len(dt_str) == 10:
-                return dt_str + "T00:00:00"
-            return dt_str
-
     async def process_chat(self, user_input: str) -> str:
         """Processes user input from the chat interface using LLM."""
-        if not self.supervisor:
+        response = await self._route_locally(user_input)
+        if response is not None:
+            return response
+
+        supervisor = await self.get_supervisor()
+        if not supervisor:
             return f"Model not initialized (missing API key). Echo: {user_input}"
 
         try:
-            response = await self.supervisor.process_message(user_input)
+            response = await supervisor.process_message(
+                user_input, cache_key=user_input
+            )
 
             return response
 
@@ -162,7 +315,12 @@ class AppController:
         self, user_input: str, conversation_history: list
     ) -> str:
         """Processes user input with conversation history for context."""
-        if not self.supervisor:
+        response = await self._route_locally(user_input, conversation_history)
+        if response is not None:
+            return response
+
+        supervisor = await self.get_supervisor()
+        if not supervisor:
             return f"Model not initialized (missing API key). Echo: {user_input}"
 
         try:
@@ -170,7 +328,13 @@ class AppController:
             context_prompt = self._build_context_prompt(
                 conversation_history, user_input
             )
-            response = await self.supervisor.process_message(context_prompt)
+            # A reply to the assistant's question depends on the conversation
+            cache_key = (
+                None if self._follows_question(conversation_history) else user_input
+            )
+            response = await supervisor.process_message(
+                context_prompt, cache_key=cache_key
+            )
 
             return response
 
@@ -180,20 +344,87 @@ class AppController:
                 f"I couldn't process that request properly. Technical detail: {str(e)}"
             )
 
+    async def stream_chat_with_history(
+        self, user_input: str, conversation_history: list
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Like process_chat_with_history, but yields the reply as it is written.
+
+        Yields the events of SupervisorModel.stream_message; the last one is
+        always {"type": "done", "text": <complete reply>}.
+        """
+        response = await self._route_locally(user_input, conversation_history)
+        if response is not None:
+            yield {"type": "done", "text": response}
+            return
+
+        supervisor = await self.get_supervisor()
+        if not supervisor:
+            yield {
+                "type": "done",
+                "text": f"Model not initialized (missing API key). Echo: {user_input}",
+            }
+            return
+
+        try:
+            context_prompt = self._build_context_prompt(
+                conversation_history, user_input
+            )
+            cache_key = (
+                None if self._follows_question(conversation_history) else user_input
+            )
+            async for event in supervisor.stream_message(
+                context_prompt, cache_key=cache_key
+            ):
+                yield event
+        except Exception as e:
+            print(f"Processing error in AppController: {e}")
+            yield {
+                "type": "done",
+                "text": f"I couldn't process that request properly. Technical detail: {str(e)}",
+            }
+
+    async def _route_locally(
+        self, user_input: str, conversation_history: Optional[list] = None
+    ) -> Optional[str]:
+        """Answer a simple request without the agent, or return None."""
+        if self.intent_router is None:
+            return None
+        # An answer to the assistant's question needs the conversation
+        if self._follows_question(conversation_history or []):
+            return None
+        try:
+            return await self.intent_router.route(user_input)
+        except Exception as e:
+            print(f"Error in fast path, using the agent: {e}")
+            return None
+
+    def _follows_question(self, conversation_history: list) -> bool:
+        """Whether the last assistant message (before the current input) asked something."""
+        previous = [
+            msg for msg in conversation_history[:-1] if msg["role"] == "assistant"
+        ]
+        if not previous:
+            return False
+        last_reply = previous[-1]["content"].rstrip()
+        return last_reply.endswith("?") or "Please specify your choice" in last_reply
+
     def _build_context_prompt(
         self, conversation_history: list, current_input: str
     ) -> str:
         """Build a contextual prompt that includes recent conversation history and current date context."""
         # Add current date and time context
-        now = datetime.now()
+        now = timezone_service.now()
         current_date_str = now.strftime("%A, %B %d, %Y")
         current_time_str = now.strftime("%I:%M %p")
-        current_timezone = now.astimezone().tzname()
+        current_timezone = now.tzname()
 
         context_lines = ["Current date and time context:"]
         context_lines.append(f"- Today is: {current_date_str}")
         context_lines.append(f"- Current time: {current_time_str} {current_timezone}")
-        context_lines.append(f"- Current datetime (ISO): {now.isoformat()}")
+        context_lines.append(
+            f"- Current datetime (ISO): {now.replace(tzinfo=None).isoformat()}"
+        )
         context_lines.append("")
 
         # Get the last few exchanges for context (excluding current input)
@@ -0,0 +1,110 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple
+
+# Words that refer back to the conversation, so the request alone does not
+# say what is meant ("delete it", "what about the second one?")
+_REFERENCES = re.compile(
+    r"\b(?:it|that|this|these|those|them|one|ones|first|second|third|last"
+    r"|previous|above|again|same|instead|also|too)\b"
+)
+
+
+def normalize_request(text: str) -> Optional[str]:
+    """
+    Reduce a request to a cache key: lowercase, without punctuation and
+    extra whitespace, so "What's on today?" and "what's on today" match.
+
+    Returns None for requests that refer back to the conversation, which
+    must not be answered from the cache.
+    """
+    normalized = " ".join(re.sub(r"[^\w'@:/-]+", " ", text.lower()).split())
+    if not normalized or _REFERENCES.search(normalized):
+        return None
+    return normalized
+
+
+class AgentCache:
+    """
+    Bounded, thread-safe LRU cache of agent answers and tool plans.
+
+    Answers are keyed on (normalized request, local date, calendar state
+    version) and expire after ``ttl`` seconds; a write anywhere bumps the
+    state version, so a cached answer never describes an older calendar.
+
+    Tool plans (the read-only tool calls the agent made for a request,
+    with their arguments) are keyed on the request and date only. When the
+    calendar has changed, a plan can be replayed against the new state and
+    its results phrased with one LLM call, instead of the agent loop
+    deciding again which tools to call.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 300, plan_ttl: float = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.plan_ttl = plan_ttl
+        self._answers: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._plans: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "plan_hits": 0, "misses": 0, "invalidations": 0}
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    def get_answer(self, request: str, day: date, version: int) -> Optional[str]:
+        """Return a fresh cached answer, marking it as used."""
+        answer = self._get(self._answers, (request, day, version))
+        with self._lock:
+            self._stats["hits" if answer is not None else "misses"] += 1
+        return answer
+
+    def put_answer(self, request: str, day: date, version: int, answer: str):
+        """Remember an answer computed at calendar state ``version``."""
+        self._put(self._answers, (request, day, version), answer, self.ttl)
+
+    def get_plan(self, request: str, day: date) -> Optional[List[Tuple[str, Any]]]:
+        """Return the cached ``(tool name, tool input)`` calls for a request."""
+        return self._get(self._plans, (request, day))
+
+    def record_plan_hit(self):
+        """Count a request answered by replaying its plan (once it succeeded)."""
+        with self._lock:
+            self._stats["plan_hits"] += 1
+
+    def put_plan(self, request: str, day: date, plan: List[Tuple[str, Any]]):
+        """Remember the read-only tool calls that answered a request."""
+        self._put(self._plans, (request, day), plan, self.plan_ttl)
+
+    def invalidate(self):
+        """Drop every cached answer, e.g. after a mutating tool ran."""
+        with self._lock:
+            self._answers.clear()
+            self._stats["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Answer hits, plan replays, misses and invalidations so far."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _get(self, entries: "OrderedDict[tuple, tuple]", key: tuple) -> Any:
+        with self._lock:
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return entry[1]
+
+    def _put(
+        self, entries: "OrderedDict[tuple, tuple]", key: tuple, value: Any, ttl: float
+    ):
+        with self._lock:
+            entries[key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
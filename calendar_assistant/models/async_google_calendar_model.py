@@ -0,0 +1,412 @@
+import asyncio
+import functools
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import List, Dict, Any, AsyncIterator, Optional
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.event_columns import EventColumns
+from calendar_assistant.models.google_calendar_model import GoogleCalendarModel
+from calendar_assistant.models.write_queue import OfflineWriteQueue
+
+
+class AsyncGoogleCalendarModel:
+    """
+    Async facade over GoogleCalendarModel.
+
+    The Google API client is blocking, so every call is run on a bounded
+    thread pool instead of the Textual event loop. GoogleCalendarModel gives
+    each worker thread its own service object, which keeps several requests
+    in flight safely while the UI stays responsive.
+    """
+
+    def __init__(
+        self,
+        google_calendar_model: GoogleCalendarModel,
+        max_workers: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        write_queue: Optional[OfflineWriteQueue] = None,
+    ):
+        self.google_calendar_model = google_calendar_model
+        # With a write queue, single-event writes are journaled and applied
+        # locally at once, then flushed to Google in the background.
+        self.write_queue = write_queue
+        self._writer = write_queue or google_calendar_model
+        self.max_workers = max_workers or int(
+            os.getenv("GOOGLE_CALENDAR_MAX_WORKERS", "4")
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="gcal"
+        )
+        # How many calendars a multi-calendar read queries at once
+        self.concurrency = concurrency or int(
+            os.getenv("GOOGLE_CALENDAR_CONCURRENCY", str(self.max_workers))
+        )
+        self._selected_calendar_ids: Optional[List[str]] = None
+
+    @property
+    def service(self):
+        """The wrapped model's service (None when not authenticated)."""
+        return self.google_calendar_model.service
+
+    async def ensure_service(self):
+        """
+        Return the service, initializing it on the worker pool if needed.
+
+        Prefer this over ``service`` in async code: with a lazily initialized
+        model the first access loads credentials and builds the client.
+        """
+        return await self._run(lambda: self.google_calendar_model.service)
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking call on the worker pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_calendars(self) -> List[Dict[str, Any]]:
+        """Get list of user's calendars."""
+        return await self._run(self.google_calendar_model.get_calendars)
+
+    async def get_events(self, **kwargs) -> List[CalendarEvent]:
+        """Get events; accepts the same arguments as GoogleCalendarModel.get_events."""
+        return await self._run(self.google_calendar_model.get_events, **kwargs)
+
+    async def iter_events(
+        self, chunk_size: int = 250, **kwargs
+    ) -> AsyncIterator[CalendarEvent]:
+        """
+        Async version of GoogleCalendarModel.iter_events.
+
+        Events are pulled from the blocking generator ``chunk_size`` at a time
+        on the worker pool, so pages are still fetched lazily.
+        """
+        iterator = self.google_calendar_model.iter_events(**kwargs)
+        while True:
+            chunk = await self._run(lambda: list(islice(iterator, chunk_size)))
+            for event in chunk:
+                yield event
+            if len(chunk) < chunk_size:
+                return
+
+    async def sync_events(self, calendar_id: str = "primary") -> Dict[str, Any]:
+        """Run an incremental (or initial full) sync for a calendar."""
+        return await self._run(self.google_calendar_model.sync_events, calendar_id)
+
+    async def get_synced_events(
+        self, start: datetime, end: datetime, calendar_id: str = "primary"
+    ) -> List[CalendarEvent]:
+        """Refresh a calendar incrementally and return its events in [start, end)."""
+        return await self._run(
+            self.google_calendar_model.get_synced_events, start, end, calendar_id
+        )
+
+    async def watch_events(
+        self,
+        calendar_id: str,
+        address: str,
+        token: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Open a push notification channel for a calendar's events."""
+        return await self._run(
+            self.google_calendar_model.watch_events,
+            calendar_id,
+            address,
+            token,
+            ttl_seconds,
+        )
+
+    async def stop_channel(self, channel: Dict[str, Any]) -> bool:
+        """Stop a notification channel."""
+        return await self._run(self.google_calendar_model.stop_channel, channel)
+
+    async def get_event(
+        self,
+        event_id: str,
+        calendar_id: str = "primary",
+        use_cache: bool = True,
+        detail: str = "full",
+    ) -> Optional[CalendarEvent]:
+        """Get a single event by ID, from the cache when recently seen."""
+        return await self._run(
+            self.google_calendar_model.get_event,
+            event_id,
+            calendar_id,
+            use_cache,
+            detail,
+        )
+
+    async def check_availability(
+        self,
+        start: datetime,
+        end: datetime,
+        calendar_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Check whether [start, end) is free.
+
+        Answered inline from the synced local stores when possible, since
+        that takes microseconds; otherwise a freebusy query runs on the pool.
+        """
+        local_availability = self.google_calendar_model.local_availability(
+            start, end, calendar_ids
+        )
+        if local_availability is not None:
+            return local_availability
+        return await self._run(
+            self.google_calendar_model.check_availability, start, end, calendar_ids
+        )
+
+    async def find_free_slot(
+        self,
+        duration: timedelta,
+        after: datetime,
+        before: Optional[datetime] = None,
+        calendar_ids: Optional[List[str]] = None,
+    ) -> Optional[datetime]:
+        """Find the earliest time from ``after`` that is free for ``duration``."""
+        return await self._run(
+            self.google_calendar_model.find_free_slot,
+            duration,
+            after,
+            before,
+            calendar_ids,
+        )
+
+    async def get_selected_calendar_ids(self, refresh: bool = False) -> List[str]:
+        """
+        Calendars that multi-calendar reads should query.
+
+        Taken from the comma-separated ``GOOGLE_CALENDAR_IDS`` if set, otherwise
+        the calendars selected in the user's Google Calendar list. Falls back to
+        the primary calendar. The result is cached until ``refresh`` is True.
+        """
+        if self._selected_calendar_ids is not None and not refresh:
+            return self._selected_calendar_ids
+
+        configured = os.getenv("GOOGLE_CALENDAR_IDS", "")
+        calendar_ids = [cid.strip() for cid in configured.split(",") if cid.strip()]
+        if not calendar_ids:
+            calendars = await self.get_calendars()
+            calendar_ids = [
+                calendar["id"]
+                for calendar in calendars
+                if calendar.get("selected") or calendar.get("primary")
+            ]
+
+        self._selected_calendar_ids = calendar_ids or ["primary"]
+        return self._selected_calendar_ids
+
+    async def get_events_multi(
+        self, calendar_ids: Optional[List[str]] = None, **kwargs
+    ) -> List[CalendarEvent]:
+        """
+        Get events from several calendars concurrently, merged by start time.
+
+        Accepts the same keyword arguments as GoogleCalendarModel.get_events.
+        """
+        calendar_ids = calendar_ids or await self.get_selected_calendar_ids()
+        return await self._fan_out(
+            calendar_ids,
+            lambda calendar_id: self.get_events(calendar_id=calendar_id, **kwargs),
+        )
+
+    async def get_synced_events_multi(
+        self,
+        start: datetime,
+        end: datetime,
+        calendar_ids: Optional[List[str]] = None,
+    ) -> List[CalendarEvent]:
+        """Refresh several calendars concurrently and merge their [start, end) events."""
+        calendar_ids = calendar_ids or await self.get_selected_calendar_ids()
+        return await self._fan_out(
+            calendar_ids,
+            lambda calendar_id: self.get_synced_events(start, end, calendar_id),
+        )
+
+    async def get_busy_stats(
+        self,
+        start: datetime,
+        end: datetime,
+        calendar_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Summarize how busy [start, end) is across several calendars.
+
+        See EventColumns.busy_stats for the result. The events come from the
+        synced stores; the aggregation runs on the pool.
+        """
+        events = await self.get_synced_events_multi(start, end, calendar_ids)
+        return await self._run(lambda: EventColumns(events).busy_stats(start, end))
+
+    async def iter_events_multi(
+        self,
+        calendar_ids: Optional[List[str]] = None,
+        chunk_size: int = 250,
+        **kwargs,
+    ) -> AsyncIterator[CalendarEvent]:
+        """
+        Async-iterate the time-ordered merge of several calendars' events.
+
+        Each calendar is read lazily with ``iter_events``, ``chunk_size``
+        events at a time, and the streams are merged as their chunks arrive:
+        the first events are yielded once every calendar has delivered its
+        first chunk, not after all pages of all calendars were fetched.
+        Accepts the same keyword arguments as GoogleCalendarModel.iter_events.
+        A calendar that fails is skipped so the others are still shown.
+        """
+        calendar_ids = calendar_ids or await self.get_selected_calendar_ids()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        streams = [
+            self.iter_events(chunk_size, calendar_id=calendar_id, **kwargs)
+            for calendar_id in calendar_ids
+        ]
+
+        async def next_event(index: int) -> Optional[CalendarEvent]:
+            async with semaphore:
+                try:
+                    return await anext(streams[index])
+                except StopAsyncIteration:
+                    return None
+                except Exception as e:
+                    print(f"Error fetching calendar '{calendar_ids[index]}': {e}")
+                    return None
+
+        heads = await asyncio.gather(*(next_event(i) for i in range(len(streams))))
+        heap = [
+            (CalendarEvent.sort_key(event), index, event)
+            for index, event in enumerate(heads)
+            if event is not None
+        ]
+        heapq.heapify(heap)
+        try:
+            while heap:
+                _, index, event = heapq.heappop(heap)
+                yield event
+                following = await next_event(index)
+                if following is not None:
+                    heapq.heappush(
+                        heap, (CalendarEvent.sort_key(following), index, following)
+                    )
+        finally:
+            for stream in streams:
+                await stream.aclose()
+
+    async def _fan_out(self, calendar_ids: List[str], fetch) -> List[CalendarEvent]:
+        """
+        Run ``fetch(calendar_id)`` for every calendar, at most ``concurrency``
+        at a time, and merge the already time-ordered results.
+
+        A calendar that fails is skipped so the others are still shown.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch_one(calendar_id: str) -> List[CalendarEvent]:
+            async with semaphore:
+                try:
+                    return await fetch(calendar_id)
+                except Exception as e:
+                    print(f"Error fetching calendar '{calendar_id}': {e}")
+                    return []
+
+        results = await asyncio.gather(
+            *(fetch_one(calendar_id) for calendar_id in calendar_ids)
+        )
+        return list(heapq.merge(*results, key=CalendarEvent.sort_key))
+
+    async def create_event(
+        self, event_data: Dict[str, Any], calendar_id: str = "primary"
+    ) -> Optional[CalendarEvent]:
+        """Create an event in Google Calendar."""
+        return await self._run(self._writer.create_event, event_data, calendar_id)
+
+    async def update_event(
+        self, event_id: str, event_data: Dict[str, Any], calendar_id: str = "primary"
+    ) -> Optional[CalendarEvent]:
+        """Update an existing event in Google Calendar."""
+        if self.write_queue is not None:
+            # Queued as a patch of every field given
+            return await self.patch_event(event_id, event_data, calendar_id)
+        return await self._run(
+            self.google_calendar_model.update_event, event_id, event_data, calendar_id
+        )
+
+    async def patch_event(
+        self, event_id: str, changes: Dict[str, Any], calendar_id: str = "primary"
+    ) -> Optional[CalendarEvent]:
+        """Partially update an event, sending only the changed fields."""
+        return await self._run(self._writer.patch_event, event_id, changes, calendar_id)
+
+    def get_cached_event(
+        self, event_id: str, calendar_id: str = "primary"
+    ) -> Optional[CalendarEvent]:
+        """Return a recently seen copy of an event (no request, so not async)."""
+        return self.google_calendar_model.get_cached_event(event_id, calendar_id)
+
+    async def delete_event(self, event_id: str, calendar_id: str = "primary") -> bool:
+        """Delete an event from Google Calendar."""
+        return await self._run(self._writer.delete_event, event_id, calendar_id)
+
+    async def batch_create_events(
+        self, events_data: List[Dict[str, Any]], calendar_id: str = "primary"
+    ) -> List[Dict[str, Any]]:
+        """Create many events through the batch endpoint."""
+        return await self._run(
+            self.google_calendar_model.batch_create_events, events_data, calendar_id
+        )
+
+    async def batch_patch_events(
+        self, changes_by_id: Dict[str, Dict[str, Any]], calendar_id: str = "primary"
+    ) -> List[Dict[str, Any]]:
+        """Partially update many events through the batch endpoint."""
+        return await self._run(
+            self.google_calendar_model.batch_patch_events, changes_by_id, calendar_id
+        )
+
+    async def batch_delete_events(
+        self, event_ids: List[str], calendar_id: str = "primary"
+    ) -> List[Dict[str, Any]]:
+        """Delete many events through the batch endpoint."""
+        return await self._run(
+            self.google_calendar_model.batch_delete_events, event_ids, calendar_id
+        )
+
+    async def import_ics(
+        self, path: str, calendar_id: str = "primary"
+    ) -> Dict[str, Any]:
+        """Stream an .ics file into a calendar through the batch endpoint."""
+        return await self._run(self.google_calendar_model.import_ics, path, calendar_id)
+
+    async def export_ics(
+        self,
+        path: str,
+        calendar_id: str = "primary",
+        start_date: str = None,
+        end_date: str = None,
+    ) -> Dict[str, Any]:
+        """Stream a calendar's events in a time range to an .ics file."""
+        return await self._run(
+            self.google_calendar_model.export_ics,
+            path,
+            calendar_id,
+            start_date,
+            end_date,
+        )
+
+    async def quick_add_event(
+        self, text: str, calendar_id: str = "primary"
+    ) -> Optional[CalendarEvent]:
+        """Create an event using Google's Quick Add feature."""
+        return await self._run(
+            self.google_calendar_model.quick_add_event, text, calendar_id
+        )
+
+    def shutdown(self):
+        """Stop the worker pool without waiting for queued calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.google_calendar_model.shutdown()
@@ -0,0 +1,106 @@
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+from calendar_assistant.models.timezone_service import timezone_service
+
+# Sorts before every real event
+EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
+class CalendarEvent:
+    """
+    A calendar event as used by every layer of the app.
+
+    Built once from the Google API payload, with ``start`` and ``end``
+    parsed into timezone-aware datetimes at ingest so views, sorting and the
+    agent tools never re-parse ISO strings. ``__slots__`` keeps per-event
+    memory low for large calendars.
+    """
+
+    id: str
+    title: str
+    start: Optional[datetime]
+    end: Optional[datetime]
+    description: str = ""
+    location: str = ""
+    attendees: str = ""
+    html_link: str = ""
+    calendar_id: str = "primary"
+    all_day: bool = False
+    etag: str = ""
+    # "Show as available": does not make the user busy
+    transparent: bool = False
+
+    @classmethod
+    def from_google(
+        cls, google_event: Dict[str, Any], calendar_id: str = "primary"
+    ) -> "CalendarEvent":
+        """Convert a Google Calendar API event resource."""
+        start, all_day = _parse_google_time(google_event.get("start", {}))
+        end, _ = _parse_google_time(google_event.get("end", {}))
+
+        attendees = ""
+        if "attendees" in google_event:
+            attendee_emails = [
+                attendee.get("email", "") for attendee in google_event["attendees"]
+            ]
+            attendees = ", ".join(filter(None, attendee_emails))
+
+        return cls(
+            id=google_event.get("id", ""),
+            title=google_event.get("summary", ""),
+            start=start,
+            end=end,
+            description=google_event.get("description", ""),
+            location=google_event.get("location", ""),
+            attendees=attendees,
+            html_link=google_event.get("htmlLink", ""),
+            calendar_id=calendar_id,
+            all_day=all_day,
+            etag=google_event.get("etag", ""),
+            transparent=google_event.get("transparency") == "transparent",
+        )
+
+    @property
+    def google_id(self) -> str:
+        """The Google Calendar event ID (same as ``id``)."""
+        return self.id
+
+    @property
+    def start_time(self) -> str:
+        """Start as an ISO 8601 string, or "" if unknown."""
+        return self.start.isoformat() if self.start else ""
+
+    @property
+    def end_time(self) -> str:
+        """End as an ISO 8601 string, or "" if unknown."""
+        return self.end.isoformat() if self.end else ""
+
+    def sort_key(self) -> datetime:
+        """Key for ordering events by start time; unknown starts sort first."""
+        return self.start or EARLIEST
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in the app's local event format, e.g. for serialization."""
+        data = asdict(self)
+        data["start_time"] = self.start_time
+        data["end_time"] = self.end_time
+        del data["start"], data["end"]
+        return data
+
+
+def _parse_google_time(value: Dict[str, Any]) -> tuple:
+    """Parse a Google start/end object into (aware datetime, is_all_day)."""
+    try:
+        if "dateTime" in value:
+            start = datetime.fromisoformat(value["dateTime"].replace("Z", "+00:00"))
+            return start, False
+        if "date" in value:
+            # All-day events start at local midnight
+            day_start = datetime.fromisoformat(value["date"])
+            return timezone_service.localize(day_start), True
+    except ValueError:
+        pass
+    return None, False
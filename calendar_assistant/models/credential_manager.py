@@ -0,0 +1,183 @@
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+
+class CredentialManager:
+    """
+    Loads the OAuth credentials and keeps them fresh in the background.
+
+    Google access tokens live for an hour. google-auth refreshes an expired
+    token inside the next request, so the call that happens to come first
+    after expiry pays the refresh round trip, and concurrent callers may
+    each refresh. Instead, a daemon thread refreshes the shared Credentials
+    object ``REFRESH_MARGIN`` before expiry, which is earlier than
+    google-auth's own threshold, so API requests always see a valid token.
+
+    Refreshes are serialized by a lock and skipped if another caller has
+    just refreshed. The token file is replaced atomically, so a crash while
+    saving never leaves a truncated token.json behind.
+    """
+
+    # Refresh this long before expiry (google-auth refreshes inline at 3m45s)
+    REFRESH_MARGIN = timedelta(minutes=5)
+    # Re-check at least this often, e.g. after the machine was asleep
+    MAX_WAIT = timedelta(minutes=1)
+    # Wait before retrying a failed refresh
+    RETRY_DELAY = timedelta(seconds=30)
+
+    def __init__(self, token_file: str, credentials_file: str, scopes: List[str]):
+        self.token_file = token_file
+        self.credentials_file = credentials_file
+        self.scopes = scopes
+        self.credentials: Optional[Credentials] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_error = ""
+
+    def load(self) -> Optional[Credentials]:
+        """
+        Get valid credentials, refreshing or running the OAuth flow if needed.
+
+        Blocks (a refresh or a browser sign-in), so call it at startup or
+        from a worker thread, not from a user request.
+        """
+        creds = None
+
+        # Load existing token if available
+        if os.path.exists(self.token_file):
+            creds = Credentials.from_authorized_user_file(self.token_file, self.scopes)
+
+        # If no valid credentials, initiate OAuth flow
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                try:
+                    creds.refresh(Request())
+                    print("✓ Refreshed expired credentials")
+                except Exception as e:
+                    print(f"Error refreshing credentials: {e}")
+                    creds = None
+
+            if not creds:
+                if os.path.exists(self.credentials_file):
+                    try:
+                        flow = InstalledAppFlow.from_client_secrets_file(
+                            self.credentials_file, self.scopes
+                        )
+                        creds = flow.run_local_server(port=0)
+                        print("✓ Completed OAuth flow")
+                    except Exception as e:
+                        print(f"Error during OAuth flow: {e}")
+                        return None
+                else:
+                    print(f"Credentials file not found: {self.credentials_file}")
+                    return None
+
+            # Save credentials for next run
+            if creds:
+                self._save(creds)
+                print("✓ Saved credentials to token file")
+
+        self.credentials = creds
+        return creds
+
+    def start(self):
+        """Start refreshing the loaded credentials ahead of expiry."""
+        if self._thread is not None or self.credentials is None:
+            return
+        if not self.credentials.refresh_token:
+            # Nothing to refresh with; google-auth reports the expiry itself
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="credential-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Refresh the token now if it is due (or always with ``force``).
+
+        Callers that arrive while another refresh is running wait for it and
+        then find the token fresh. Returns False if the refresh failed.
+        """
+        with self._lock:
+            creds = self.credentials
+            if creds is None:
+                return False
+            if not force and self.time_to_refresh() > timedelta(0):
+                return True
+
+            try:
+                creds.refresh(Request())
+            except Exception as e:
+                self._last_error = str(e)
+                print(f"Error refreshing credentials: {e}")
+                return False
+
+            self._last_error = ""
+            try:
+                self._save(creds)
+            except OSError as e:
+                # The in-memory token still works; try saving next time
+                print(f"Error saving refreshed credentials: {e}")
+            return True
+
+    def time_to_refresh(self) -> timedelta:
+        """How long until the token is due for refresh (<= 0 means now)."""
+        creds = self.credentials
+        if creds is None or creds.expiry is None:
+            return self.MAX_WAIT
+        # google-auth keeps expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return creds.expiry - self.REFRESH_MARGIN - now
+
+    @property
+    def last_error(self) -> str:
+        """Message of the last failed background refresh ("" if it succeeded)."""
+        return self._last_error
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = self.time_to_refresh()
+            if delay <= timedelta(0):
+                if not self.refresh():
+                    delay = self.RETRY_DELAY
+                else:
+                    continue
+            self._stop.wait(min(delay, self.MAX_WAIT).total_seconds())
+
+    def _save(self, creds: Credentials):
+        """Write the token file atomically, readable only by the user."""
+        directory = os.path.dirname(os.path.abspath(self.token_file))
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory, prefix=".token-", suffix=".json.tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as token:
+                token.write(creds.to_json())
+                token.flush()
+                os.fsync(token.fileno())
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.token_file)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,260 @@
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Iterable, Tuple
+
+import numpy as np
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.timezone_service import timezone_service
+
+DAY = 86400
+HOUR = 3600
+# Every UTC offset in use is a multiple of 15 minutes
+QUARTER_HOUR = 900
+# 1970-01-01 was a Thursday; Monday is weekday 0
+_EPOCH_WEEKDAY = 3
+
+
+class EventColumns:
+    """
+    Events as NumPy columns, for counts and busy-time aggregates.
+
+    Holds one array per field (start and end as POSIX seconds, duration,
+    calendar index, transparency) instead of a list of CalendarEvents, so
+    per-day counts, busy-hour histograms and totals over a year of events
+    on several calendars are a handful of vectorized operations instead of
+    Python loops. Local dates and hours follow ``timezone_service``,
+    including its DST changes.
+
+    Busy time is the union of the events' intervals, so double-booked hours
+    count once. Like the freebusy endpoint, events shown as available
+    (transparent) are not busy.
+    """
+
+    def __init__(self, events: Iterable[CalendarEvent] = ()):
+        timed = [event for event in events if event.start is not None]
+        calendar_index: Dict[str, int] = {}
+        for event in timed:
+            calendar_index.setdefault(event.calendar_id, len(calendar_index))
+        self.calendar_ids: List[str] = list(calendar_index)
+
+        count = len(timed)
+        self.starts = np.fromiter(
+            (event.start.timestamp() for event in timed), np.int64, count
+        )
+        ends = np.fromiter(
+            ((event.end or event.start).timestamp() for event in timed),
+            np.int64,
+            count,
+        )
+        # An event ending before it starts is treated as zero-length
+        self.ends = np.maximum(ends, self.starts)
+        self.durations = self.ends - self.starts
+        self.calendars = np.fromiter(
+            (calendar_index[event.calendar_id] for event in timed), np.int16, count
+        )
+        self.transparent = np.fromiter(
+            (event.transparent for event in timed), np.bool_, count
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def day_counts(self, first_day: date, days: int) -> np.ndarray:
+        """Number of events starting on each of ``days`` local dates."""
+        if not len(self) or days <= 0:
+            return np.zeros(max(days, 0), np.int64)
+        local_days = (self.starts + _utc_offsets(self.starts)) // DAY
+        offsets = local_days - (first_day - date(1970, 1, 1)).days
+        offsets = offsets[(offsets >= 0) & (offsets < days)]
+        return np.bincount(offsets, minlength=days)
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        """Number of events overlapping [start, end)."""
+        lo, hi = _bounds(start, end)
+        return int(np.count_nonzero(self._overlapping(lo, hi)))
+
+    def busy_seconds(
+        self, start: datetime, end: datetime, busy_only: bool = True
+    ) -> int:
+        """Seconds of [start, end) covered by at least one event."""
+        merged_starts, merged_ends = self._merged(*_bounds(start, end), busy_only)
+        return int((merged_ends - merged_starts).sum())
+
+    def calendar_seconds(self, start: datetime, end: datetime) -> Dict[str, int]:
+        """Seconds of [start, end) booked on each calendar (overlaps add up)."""
+        lo, hi = _bounds(start, end)
+        clipped = np.clip(self.ends, lo, hi) - np.clip(self.starts, lo, hi)
+        totals = np.bincount(
+            self.calendars, weights=clipped, minlength=len(self.calendar_ids)
+        )
+        return {
+            calendar_id: int(total)
+            for calendar_id, total in zip(self.calendar_ids, totals)
+        }
+
+    def busy_hours(
+        self, start: datetime, end: datetime, busy_only: bool = True
+    ) -> np.ndarray:
+        """
+        Busy hours of [start, end) by local weekday and hour of day.
+
+        Returns a 7 x 24 array; row 0 is Monday, column 9 is 09:00-10:00.
+        """
+        merged_starts, merged_ends = self._merged(*_bounds(start, end), busy_only)
+        if not len(merged_starts):
+            return np.zeros((7, 24))
+
+        # Cut the busy time at the instants where a local hour begins and at
+        # the zone's offset changes, so every piece lies within one local
+        # hour: across a DST change, wall-clock hours are not 3600s apart
+        first, last = int(merged_starts[0]), int(merged_ends.max())
+        grid = np.arange(first // QUARTER_HOUR * QUARTER_HOUR, last, QUARTER_HOUR)
+        changes, offsets = _offset_changes(first, last)
+        grid_local = grid + offsets[np.searchsorted(changes, grid, "right")]
+        edges = np.union1d(grid[grid_local % HOUR == 0], [first, last, *changes])
+        edges = edges[(edges >= first) & (edges <= last)]
+
+        covered = _coverage(merged_starts, merged_ends, edges)
+        pieces = edges[:-1]
+        local = pieces + offsets[np.searchsorted(changes, pieces, "right")]
+        buckets = ((local // DAY + _EPOCH_WEEKDAY) % 7) * 24 + local % DAY // HOUR
+        histogram = np.bincount(buckets, weights=np.diff(covered), minlength=7 * 24)
+        return (histogram / HOUR).reshape(7, 24)
+
+    def busy_stats(
+        self, start: datetime, end: datetime, busy_only: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Summary of how busy [start, end) is.
+
+        Returns:
+            Dict with "events" (count overlapping the period), "busy_hours"
+            (union of busy time), "calendar_hours" by calendar ID,
+            "busiest_day" as (date, event count) or None, "peak_hour" as
+            (weekday, hour) or None, and the "day_counts" and "hourly"
+            arrays behind them.
+        """
+        first_day = timezone_service.local_date(timezone_service.localize(start))
+        last_day = timezone_service.local_date(
+            timezone_service.localize(end) - timedelta(microseconds=1)
+        )
+        day_counts = self.day_counts(first_day, (last_day - first_day).days + 1)
+        hourly = self.busy_hours(start, end, busy_only)
+
+        busiest_day = None
+        if day_counts.any():
+            busiest = int(day_counts.argmax())
+            busiest_day = (
+                first_day + timedelta(days=busiest),
+                int(day_counts[busiest]),
+            )
+        peak_hour = None
+        if hourly.any():
+            weekday, hour = np.unravel_index(int(hourly.argmax()), hourly.shape)
+            peak_hour = (int(weekday), int(hour))
+
+        return {
+            "events": self.count_between(start, end),
+            "busy_hours": self.busy_seconds(start, end, busy_only) / HOUR,
+            "calendar_hours": {
+                calendar_id: seconds / HOUR
+                for calendar_id, seconds in self.calendar_seconds(start, end).items()
+            },
+            "busiest_day": busiest_day,
+            "peak_hour": peak_hour,
+            "day_counts": day_counts,
+            "hourly": hourly,
+        }
+
+    def _overlapping(self, lo: int, hi: int) -> np.ndarray:
+        """Mask of the events overlapping [lo, hi), zero-length ones included."""
+        return (self.starts < hi) & ((self.ends > lo) | (self.starts >= lo))
+
+    def _merged(
+        self, lo: int, hi: int, busy_only: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Disjoint busy intervals clipped to [lo, hi), in start order."""
+        starts = np.clip(self.starts, lo, hi)
+        ends = np.clip(self.ends, lo, hi)
+        keep = ends > starts
+        if busy_only:
+            keep &= ~self.transparent
+        starts, ends = starts[keep], ends[keep]
+        if not len(starts):
+            return starts, ends
+
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]
+        reach = np.maximum.accumulate(ends)
+        # A new block begins wherever an event starts after all earlier ones end
+        first = np.flatnonzero(np.r_[True, starts[1:] > reach[:-1]])
+        last = np.r_[first[1:] - 1, len(starts) - 1]
+        return starts[first], reach[last]
+
+
+def _bounds(start: datetime, end: datetime) -> Tuple[int, int]:
+    return (
+        int(timezone_service.localize(start).timestamp()),
+        int(timezone_service.localize(end).timestamp()),
+    )
+
+
+def _coverage(starts: np.ndarray, ends: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Seconds covered by the disjoint, sorted intervals up to each point.
+
+    At most one interval can contain a point, so the total is the sum of
+    the intervals that ended before it plus the part of that one.
+    """
+    done = np.r_[0, np.cumsum(ends - starts)]
+    ended = np.searchsorted(ends, points, side="right")
+    started = np.searchsorted(starts, points, side="right")
+    partial = np.where(
+        started > ended, points - starts[np.minimum(ended, len(starts) - 1)], 0
+    )
+    return done[ended] + partial
+
+
+def _utc_offsets(epochs: np.ndarray) -> np.ndarray:
+    """UTC offset in seconds of the local zone at each POSIX time."""
+    if not len(epochs):
+        return np.zeros(0, np.int64)
+    changes, offsets = _offset_changes(int(epochs.min()), int(epochs.max()))
+    return offsets[np.searchsorted(changes, epochs, "right")]
+
+
+def _offset_changes(first: int, last: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The local zone's offset changes between two POSIX times.
+
+    Returns the instants where the offset changes and the offsets (one
+    more than the changes): the offset at ``t`` is
+    ``offsets[searchsorted(changes, t, "right")]``.
+
+    The offset is sampled once a day across the range and each change is
+    bisected to the second, so a year costs a few hundred lookups however
+    many events there are.
+    """
+    zone = timezone_service.tz
+
+    def offset(epoch: int) -> int:
+        return int(datetime.fromtimestamp(epoch, zone).utcoffset().total_seconds())
+
+    offsets = [offset(first)]
+    changes: List[int] = []
+    previous = first
+    for sample in range(first + DAY, last + DAY, DAY):
+        sample = min(sample, last)
+        current = offset(sample)
+        if current != offsets[-1]:
+            low, high = previous, sample
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset(middle) == offsets[-1]:
+                    low = middle
+                else:
+                    high = middle
+            changes.append(high)
+            offsets.append(current)
+        previous = sample
+    return np.asarray(changes, np.int64), np.asarray(offsets, np.int64)
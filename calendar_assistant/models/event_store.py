@@ -0,0 +1,289 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterable, Optional, Set
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.interval_index import IntervalIndex
+from calendar_assistant.models.recurrence import RecurringSeries, parse_instance_id
+from calendar_assistant.models.timezone_service import timezone_service
+
+
+class EventStore:
+    """
+    Local, ID-indexed copy of one Google Calendar's events.
+
+    Filled by a full sync and then kept current by applying the changed and
+    deleted events returned by incremental (syncToken) syncs. Safe to use from
+    the event loop while a worker thread applies a sync.
+
+    Recurring events can be stored as series (masters) instead of instances;
+    queries then expand them for just the requested window. Instances stored
+    as separate events (moved or edited ones) or removed by ID are left out
+    of the expansion.
+
+    Overlap and free-slot queries go through IntervalIndexes that are
+    rebuilt on the first query after the events change.
+    """
+
+    # How far ahead the interval index holds instances of recurring series
+    INDEX_HORIZON = timedelta(days=366)
+
+    def __init__(self, synced_from: Optional[datetime] = None):
+        self.synced_from = synced_from
+        self._events: Dict[str, CalendarEvent] = {}
+        self._series: Dict[str, RecurringSeries] = {}
+        # Original starts of the instances each series must not generate
+        self._skipped: Dict[str, Set[datetime]] = {}
+        # Interval indexes keyed by (busy only, with series instances)
+        self._indexes: Dict[tuple, IntervalIndex] = {}
+        self._indexed_until: Optional[datetime] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._events) + len(self._series)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._events or event_id in self._series
+
+    def get(self, event_id: str) -> Optional[CalendarEvent]:
+        """Return the stored event (or series master) with this ID, if any."""
+        event = self._events.get(event_id)
+        if event is None and event_id in self._series:
+            event = self._series[event_id].master
+        return event
+
+    def upsert(self, event: CalendarEvent):
+        """Insert or replace an event."""
+        if event.id:
+            with self._lock:
+                self._events[event.id] = event
+                self._skip_instance(event.id)
+                self._indexes = {}
+
+    def upsert_series(self, series: RecurringSeries):
+        """Insert or replace a recurring series."""
+        with self._lock:
+            self._series[series.id] = series
+            self._events.pop(series.id, None)
+            self._indexes = {}
+
+    def remove(self, event_id: str) -> bool:
+        """
+        Remove an event or series, returning True if it was present.
+
+        Removing an instance of a stored series hides that instance.
+        """
+        with self._lock:
+            removed = self._events.pop(event_id, None) is not None
+            if self._series.pop(event_id, None) is not None:
+                self._skipped.pop(event_id, None)
+                removed = True
+            if self._skip_instance(event_id):
+                removed = True
+            if removed:
+                self._indexes = {}
+            return removed
+
+    def replace_all(
+        self,
+        events: Iterable[CalendarEvent],
+        synced_from: Optional[datetime],
+        series: Iterable[RecurringSeries] = (),
+        cancelled_instances: Iterable[str] = (),
+    ):
+        """
+        Replace the whole store with the result of a full sync.
+
+        ``cancelled_instances`` are IDs of deleted instances of ``series``.
+        """
+        new_events = {event.id: event for event in events if event.id}
+        new_series = {item.id: item for item in series}
+        skipped: Dict[str, Set[datetime]] = {}
+        for event_id in list(new_events) + list(cancelled_instances):
+            instance = parse_instance_id(event_id)
+            if instance is not None:
+                skipped.setdefault(instance[0], set()).add(instance[1])
+
+        with self._lock:
+            self._events = new_events
+            self._series = new_series
+            self._skipped = skipped
+            self._indexes = {}
+            self.synced_from = synced_from
+
+    def covers(self, start: datetime, end: Optional[datetime] = None) -> bool:
+        """
+        Whether a full sync has loaded everything from ``start`` onwards.
+
+        Pass ``end`` when the interval index will be queried: it only holds
+        recurring instances up to ``INDEX_HORIZON`` ahead.
+        """
+        if self.synced_from is None:
+            return False
+        if timezone_service.localize(start) < timezone_service.localize(
+            self.synced_from
+        ):
+            return False
+        if end is not None and self._series:
+            horizon = datetime.now(timezone.utc) + self.INDEX_HORIZON
+            return timezone_service.localize(end) <= horizon
+        return True
+
+    def events_between(self, start: datetime, end: datetime) -> List[CalendarEvent]:
+        """
+        Return stored events overlapping [start, end), ordered by start time.
+
+        Uses the same overlap semantics as timeMin/timeMax on events().list.
+        Recurring series are expanded for this window only.
+        """
+        start = timezone_service.localize(start)
+        end = timezone_service.localize(end)
+        with self._lock:
+            series = list(self._series.values())
+            skipped = {series_id: set(s) for series_id, s in self._skipped.items()}
+
+        events = self._get_index(busy_only=False, with_series=False).overlapping(
+            start, end
+        )
+        if not series:
+            return events
+
+        for item in series:
+            events.extend(item.expand(start, end, skipped.get(item.id, ())))
+        events.sort(key=CalendarEvent.sort_key)
+        return events
+
+    def index(self, busy_only: bool = False) -> IntervalIndex:
+        """
+        Interval index of the stored events, rebuilt only after changes.
+
+        Includes the instances of recurring series from ``synced_from`` to
+        ``INDEX_HORIZON`` ahead. With ``busy_only``, events shown as
+        available (transparent) are left out, as the freebusy endpoint does.
+        """
+        return self._get_index(busy_only, with_series=True)
+
+    def _get_index(self, busy_only: bool, with_series: bool) -> IntervalIndex:
+        with self._lock:
+            if with_series and self._series:
+                # Keep the indexed range at least ~INDEX_HORIZON ahead
+                now = datetime.now(timezone.utc)
+                if (
+                    self._indexed_until is None
+                    or self._indexed_until < now + self.INDEX_HORIZON
+                ):
+                    self._indexes = {}
+                    self._indexed_until = now + self.INDEX_HORIZON + timedelta(days=1)
+
+            key = (busy_only, with_series)
+            index = self._indexes.get(key)
+            if index is not None:
+                return index
+
+            events = list(self._events.values())
+            if with_series and self._series:
+                window_start = self.synced_from or datetime.now(timezone.utc)
+                for item in self._series.values():
+                    events.extend(
+                        item.expand(
+                            window_start,
+                            self._indexed_until,
+                            self._skipped.get(item.id, ()),
+                        )
+                    )
+            if busy_only:
+                events = [event for event in events if not event.transparent]
+            index = self._indexes[key] = IntervalIndex(events)
+            return index
+
+    def _skip_instance(self, event_id: str) -> bool:
+        """Stop generating the series instance with this ID, if it is one."""
+        instance = parse_instance_id(event_id)
+        if instance is None:
+            return False
+        self._skipped.setdefault(instance[0], set()).add(instance[1])
+        return instance[0] in self._series
+
+
+class RecentEventCache:
+    """
+    Bounded, thread-safe LRU cache of recently seen events keyed by
+    (calendar ID, event ID), used to answer lookups by ID without a request.
+
+    Each entry remembers the level of detail it was fetched with, so a
+    "summary" copy never answers a request for full details.
+    """
+
+    # Levels of detail, from least to most complete
+    DETAIL_LEVELS = {"summary": 0, "full": 1}
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._events: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def get(
+        self, calendar_id: str, event_id: str, detail: str = "full"
+    ) -> Optional[CalendarEvent]:
+        """Return a cached event with at least ``detail`` and mark it as used."""
+        key = (calendar_id, event_id)
+        with self._lock:
+            entry = self._events.get(key)
+            if entry is None or entry[0] < self.DETAIL_LEVELS[detail]:
+                return None
+            self._events.move_to_end(key)
+            return entry[1]
+
+    def put(self, calendar_id: str, event: CalendarEvent, detail: str = "full"):
+        """Remember an event, evicting the least recently used when full."""
+        if not event.id:
+            return
+        key = (calendar_id, event.id)
+        with self._lock:
+            self._events[key] = (self.DETAIL_LEVELS[detail], event)
+            self._events.move_to_end(key)
+            while len(self._events) > self.max_size:
+                self._events.popitem(last=False)
+
+    def discard(self, calendar_id: str, event_id: str):
+        """Forget an event, e.g. after it was deleted."""
+        with self._lock:
+            self._events.pop((calendar_id, event_id), None)
+
+
+class ResponseCache:
+    """
+    Bounded, thread-safe LRU cache of list responses keyed by request URI.
+
+    Each entry keeps the response's ETag together with the already converted
+    result, so a 304 Not Modified reply can be answered without downloading
+    or converting the payload again.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[tuple]:
+        """Return ``(etag, value)`` for a request, marking it as used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, etag: str, value: Any):
+        """Remember a response, evicting the least recently used when full."""
+        with self._lock:
+            self._entries[key] = (etag, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
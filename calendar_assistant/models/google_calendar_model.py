@@ -1,14 +1,29 @@
 import os
 import json
-from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional
-from google.auth.transport.requests import Request
+from datetime import date, datetime, timezone, timedelta
+from typing import List, Dict, Any, Callable, Iterator, Optional
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest
 from dotenv import load_dotenv
+import httplib2
+import threading
 import time
+import uuid
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.credential_manager import CredentialManager
+from calendar_assistant.models.event_store import (
+    EventStore,
+    RecentEventCache,
+    ResponseCache,
+)
+from calendar_assistant.models.ics import read_ics, write_ics
+from calendar_assistant.models.interval_index import IntervalIndex
+from calendar_assistant.models.recurrence import RecurringSeries
+from calendar_assistant.models.request_scheduler import RequestScheduler
+from calendar_assistant.models.timezone_service import timezone_service
 
 load_dotenv()
 
@@ -21,20 +36,192 @@ class GoogleCalendarModel:
     # Scopes for Google Calendar API
     SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
-    def __init__(self):
-        self.service = None
+    # Upper bound Google accepts for maxResults on events().list
+    MAX_PAGE_SIZE = 2500
+
+    # How far back the initial full sync reaches before incremental syncs take over
+    SYNC_LOOKBACK_DAYS = int(os.getenv("GOOGLE_SYNC_LOOKBACK_DAYS", "31"))
+
+    # The synced store backs the month grid and the event list, which shows
+    # descriptions, so it is synced with every field
+    SYNC_DETAIL = "full"
+
+    # Extra fields needed to expand recurring events locally
+    RECURRENCE_FIELDS = "recurrence,recurringEventId,originalStartTime"
+
+    # Partial-response field masks by level of detail. "summary" omits
+    # descriptions and attendees; "full" has every field of CalendarEvent.
+    EVENT_FIELDS = {
+        "summary": "id,etag,status,summary,start,end,location,htmlLink,transparency",
+        "full": (
+            "id,etag,status,summary,description,start,end,location,"
+            "attendees(email),htmlLink,transparency"
+        ),
+    }
+
+    # Number of recently seen events kept for get_event lookups
+    EVENT_CACHE_SIZE = 2000
+
+    # How many list responses (pages) are kept for ETag revalidation
+    RESPONSE_CACHE_SIZE = 256
+
+    # Google allows at most 50 calls in one Calendar API batch request
+    MAX_BATCH_SIZE = 50
+    # Events read from an .ics file before they are sent (in batches)
+    IMPORT_CHUNK_SIZE = 500
+
+    # Our event fields mapped to the Google event fields they patch
+    PATCH_FIELDS = {
+        "title": "summary",
+        "description": "description",
+        "start_time": "start",
+        "end_time": "end",
+        "location": "location",
+        "attendees": "attendees",
+    }
+
+    def __init__(
+        self,
+        lazy: bool = False,
+        api_root: Optional[str] = None,
+        local_recurrence: Optional[bool] = None,
+    ):
+        """
+        Args:
+            lazy: Defer loading credentials and building the service until the
+                  service is first used, instead of doing it during startup.
+            api_root: Send requests to this server instead of Google, e.g. the
+                  fake server in scripts/fake_google_calendar.py (defaults to
+                  ``GOOGLE_CALENDAR_API_ROOT``). No credentials are used.
+            local_recurrence: Sync recurring events as masters plus exceptions
+                  and expand them locally, instead of downloading every
+                  instance (defaults to ``GOOGLE_LOCAL_RECURRENCE=1``).
+        """
+        # httplib2 is not thread-safe, so every thread gets its own service
+        # object (see the ``service`` property).
+        self._thread_local = threading.local()
+        self._main_service = None
+        self._main_thread_id = threading.get_ident()
         self.credentials = None
         self.credentials_file = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
         self.token_file = os.getenv("GOOGLE_TOKEN_FILE", "token.json")
+        # Refreshes the OAuth token in the background before it expires
+        self.credential_manager = CredentialManager(
+            self.token_file, self.credentials_file, self.SCOPES
+        )
+        self.api_root = (api_root or os.getenv("GOOGLE_CALENDAR_API_ROOT", "")).rstrip(
+            "/"
+        )
+
+        if local_recurrence is None:
+            local_recurrence = os.getenv("GOOGLE_LOCAL_RECURRENCE", "0") == "1"
+        self.local_recurrence = local_recurrence
+
+        # Incremental sync state, keyed by calendar ID
+        self.event_stores: Dict[str, EventStore] = {}
+        self._sync_tokens: Dict[str, str] = {}
+        self._sync_locks: Dict[str, threading.Lock] = {}
+        self._sync_locks_guard = threading.Lock()
+        # Called with the calendar ID after a full sync replaced its store,
+        # e.g. by the write queue to re-apply writes Google has not seen yet
+        self.on_store_replaced: Optional[Callable[[str], None]] = None
+
+        # Open push notification channels, keyed by channel ID
+        self.channels: Dict[str, Dict[str, Any]] = {}
+
+        # Shared quota-aware scheduler that every API request goes through
+        self.scheduler = RequestScheduler()
+
+        # Recently seen events, for lookups by ID without a list request
+        self._event_cache = RecentEventCache(self.EVENT_CACHE_SIZE)
+
+        # ETag-tagged list responses, revalidated with If-None-Match
+        self._response_cache = ResponseCache(self.RESPONSE_CACHE_SIZE)
+
+        # Bumped whenever a local copy of the calendars changes (see state_version)
+        self._state_version = 0
+        self._state_version_lock = threading.Lock()
+
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        if not lazy:
+            self._ensure_initialized()
+
+    @property
+    def service(self):
+        """
+        Google Calendar service for the calling thread.
 
-        self._initialize_service()
+        In lazy mode the first access loads credentials and builds the
+        service, so call it from a worker thread to keep the UI responsive.
+
+        The service built at startup is used on the thread that created it;
+        worker threads lazily build their own copy with a separate HTTP
+        connection, sharing the same credentials.
+        """
+        if not self._initialized:
+            self._ensure_initialized()
+        if self._main_service is None:
+            return None
+        if threading.get_ident() == self._main_thread_id:
+            return self._main_service
+
+        thread_service = getattr(self._thread_local, "service", None)
+        if thread_service is None:
+            thread_service = self._build_service()
+            self._thread_local.service = thread_service
+        return thread_service
+
+    @service.setter
+    def service(self, value):
+        self._main_service = value
+        self._main_thread_id = threading.get_ident()
+        self._thread_local = threading.local()
+        self._initialized = True
+
+    def _ensure_initialized(self):
+        """Initialize the service exactly once, even with concurrent callers."""
+        with self._init_lock:
+            if not self._initialized:
+                self._initialize_service()
+                self._initialized = True
+
+    def _build_service(self):
+        """
+        Build a Calendar API client with its own HTTP connection.
+
+        Uses the discovery document bundled with google-api-python-client, so
+        no network round trip is needed to build the client.
+        """
+        if self.api_root:
+            return build(
+                "calendar",
+                "v3",
+                http=httplib2.Http(),
+                client_options={"api_endpoint": f"{self.api_root}/calendar/v3/"},
+                static_discovery=True,
+                cache_discovery=False,
+            )
+        return build(
+            "calendar",
+            "v3",
+            credentials=self.credentials,
+            static_discovery=True,
+            cache_discovery=False,
+        )
 
     def _initialize_service(self):
         """Initialize Google Calendar service with authentication."""
         try:
+            if self.api_root:
+                self.service = self._build_service()
+                print(f"✓ Using Calendar API at {self.api_root}")
+                return
+
             self.credentials = self._get_credentials()
             if self.credentials:
-                self.service = build("calendar", "v3", credentials=self.credentials)
+                self.service = self._build_service()
+                self.credential_manager.start()
                 print("✓ Google Calendar service initialized successfully")
             else:
                 print("⚠️  No valid credentials found, service not initialized")
@@ -45,44 +232,11 @@ class GoogleCalendarModel:
 
     def _get_credentials(self) -> Optional[Credentials]:
         """Get valid credentials for Google Calendar API."""
-        creds = None
-
-        # Load existing token if available
-        if os.path.exists(self.token_file):
-            creds = Credentials.from_authorized_user_file(self.token_file, self.SCOPES)
+        return self.credential_manager.load()
 
-        # If no valid credentials, initiate OAuth flow
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                    print("✓ Refreshed expired credentials")
-                except Exception as e:
-                    print(f"Error refreshing credentials: {e}")
-                    creds = None
-
-            if not creds:
-                if os.path.exists(self.credentials_file):
-                    try:
-                        flow = InstalledAppFlow.from_client_secrets_file(
-                            self.credentials_file, self.SCOPES
-                        )
-                        creds = flow.run_local_server(port=0)
-                        print("✓ Completed OAuth flow")
-                    except Exception as e:
-                        print(f"Error during OAuth flow: {e}")
-                        return None
-                else:
-                    print(f"Credentials file not found: {self.credentials_file}")
-                    return None
-
-            # Save credentials for next run
-            if creds:
-                with open(self.token_file, "w") as token:
-                    token.write(creds.to_json())
-                    print("✓ Saved credentials to token file")
-
-        return creds
+    def shutdown(self):
+        """Stop background credential refreshes."""
+        self.credential_manager.stop()
 
     def get_calendars(self) -> List[Dict[str, Any]]:
         """Get list of user's calendars."""
@@ -90,36 +244,175 @@ class GoogleCalendarModel:
             print("Google Calendar service not initialized")
             return []
 
-        try:
-            calendar_list = self.service.calendarList().list().execute()
-            calendars = []
-
-            for calendar_item in calendar_list.get("items", []):
-                calendars.append(
-                    {
-                        "id": calendar_item.get("id", ""),
-                        "name": calendar_item.get("summary", ""),
-                        "description": calendar_item.get("description", ""),
-                        "timezone": calendar_item.get("timeZone", ""),
-                        "primary": calendar_item.get("primary", False),
-                        "access_role": calendar_item.get("accessRole", ""),
-                        "color": calendar_item.get("backgroundColor", ""),
-                    }
-                )
+        def to_calendars(calendar_list: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return [
+                {
+                    "id": calendar_item.get("id", ""),
+                    "name": calendar_item.get("summary", ""),
+                    "description": calendar_item.get("description", ""),
+                    "timezone": calendar_item.get("timeZone", ""),
+                    "primary": calendar_item.get("primary", False),
+                    "access_role": calendar_item.get("accessRole", ""),
+                    "color": calendar_item.get("backgroundColor", ""),
+                    "selected": calendar_item.get("selected", False),
+                }
+                for calendar_item in calendar_list.get("items", [])
+            ]
 
-            return calendars
+        try:
+            calendars = self._execute_conditional(
+                self.service.calendarList().list(), to_calendars
+            )
+            return list(calendars)
 
         except HttpError as e:
             print(f"Error getting calendars: {e}")
             return []
 
+    def iter_events(
+        self,
+        calendar_id: str = "primary",
+        start_date: str = None,
+        end_date: str = None,
+        page_size: int = 250,
+        max_results: Optional[int] = None,
+        detail: str = "full",
+    ) -> Iterator[CalendarEvent]:
+        """
+        Lazily iterate over events from Google Calendar, following page tokens.
+
+        Pages are only requested as the caller consumes events, so breaking out
+        of the loop early stops further API calls.
+
+        Args:
+            calendar_id: Calendar ID (default: 'primary')
+            start_date: ISO format start date filter
+            end_date: ISO format end date filter
+            page_size: Number of events requested per page (Google caps this at 2500)
+            max_results: Stop after this many events (None for no limit)
+            detail: "summary" to skip descriptions and attendees, or "full"
+        """
+        if not self.service:
+            print("Google Calendar service not initialized")
+            return
+
+        # Set default time range if not provided
+        if not start_date:
+            start_date = datetime.utcnow().isoformat() + "Z"
+        if not end_date:
+            end_time = datetime.utcnow() + timedelta(days=30)
+            end_date = end_time.isoformat() + "Z"
+
+        page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        if max_results is not None:
+            # Don't ask for more than the caller needs
+            page_size = min(page_size, max_results)
+
+        def to_page(response: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "nextPageToken": response.get("nextPageToken"),
+                "items": [
+                    CalendarEvent.from_google(event, calendar_id)
+                    for event in response.get("items", [])
+                ],
+            }
+
+        yielded = 0
+        page_token = None
+        try:
+            while True:
+                # Pages are revalidated with their ETag; an unchanged page
+                # is answered with 304 and served from the response cache.
+                page = self._execute_conditional(
+                    self.service.events().list(
+                        calendarId=calendar_id,
+                        timeMin=start_date,
+                        timeMax=end_date,
+                        maxResults=page_size,
+                        singleEvents=True,
+                        orderBy="startTime",
+                        fields=self._list_fields(detail),
+                        pageToken=page_token,
+                    ),
+                    to_page,
+                )
+                for event in page["items"]:
+                    self._event_cache.put(calendar_id, event, detail)
+                    yield event
+                    yielded += 1
+                    if max_results is not None and yielded >= max_results:
+                        return
+
+                page_token = page["nextPageToken"]
+                if not page_token:
+                    return
+        except HttpError as e:
+            print(f"Error getting events: {e}")
+
+    def _list_fields(self, detail: str, recurrence: bool = False) -> str:
+        """Field mask for an events().list page at the given level of detail."""
+        item_fields = self.EVENT_FIELDS[detail]
+        if recurrence:
+            item_fields += "," + self.RECURRENCE_FIELDS
+        return f"etag,nextPageToken,nextSyncToken,items({item_fields})"
+
+    def _sync_list_params(self) -> Dict[str, Any]:
+        """events().list parameters shared by full and incremental syncs."""
+        return {
+            "maxResults": self.MAX_PAGE_SIZE,
+            # With local recurrence a series arrives as one master (plus its
+            # exceptions) instead of one resource per instance
+            "singleEvents": not self.local_recurrence,
+            "fields": self._list_fields(self.SYNC_DETAIL, self.local_recurrence),
+        }
+
+    def _execute_conditional(self, request, convert) -> Any:
+        """
+        Execute a read with ``If-None-Match`` and return ``convert(response)``.
+
+        The converted result is cached under the request URI together with
+        the response ETag. When the server answers 304 Not Modified, the
+        cached result is returned without downloading or converting anything.
+        """
+        key = request.uri
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached[0]
+
+        try:
+            response = self.scheduler.execute(request)
+        except HttpError as e:
+            if cached is not None and e.resp.status == 304:
+                return cached[1]
+            raise
+
+        result = convert(response)
+        if response.get("etag"):
+            self._response_cache.put(key, response["etag"], result)
+        return result
+
+    def _iter_event_pages(self, **list_params) -> Iterator[Dict[str, Any]]:
+        """Yield raw events().list response pages, following nextPageToken."""
+        page_token = None
+        while True:
+            page = self.scheduler.execute(
+                self.service.events().list(pageToken=page_token, **list_params)
+            )
+            yield page
+
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                return
+
     def get_events(
         self,
         calendar_id: str = "primary",
         start_date: str = None,
         end_date: str = None,
-        max_results: int = 100,
-    ) -> List[Dict[str, Any]]:
+        max_results: Optional[int] = 100,
+        page_size: int = 250,
+        detail: str = "full",
+    ) -> List[CalendarEvent]:
         """
         Get events from Google Calendar.
 
@@ -127,47 +420,519 @@ class GoogleCalendarModel:
             calendar_id: Calendar ID (default: 'primary')
             start_date: ISO format start date filter
             end_date: ISO format end date filter
-            max_results: Maximum number of events to return
+            max_results: Maximum number of events to return (None for all pages)
+            page_size: Number of events requested per page
+            detail: "summary" to skip descriptions and attendees, or "full"
+        """
+        return list(
+            self.iter_events(
+                calendar_id=calendar_id,
+                start_date=start_date,
+                end_date=end_date,
+                page_size=page_size,
+                max_results=max_results,
+                detail=detail,
+            )
+        )
+
+    def sync_events(self, calendar_id: str = "primary") -> Dict[str, Any]:
+        """
+        Bring the local event store for a calendar up to date.
+
+        The first call performs a full sync from ``SYNC_LOOKBACK_DAYS`` ago and
+        stores Google's ``nextSyncToken``. Later calls send that token, so only
+        events changed or deleted since the previous sync are downloaded and
+        applied to the store. An expired token (HTTP 410) triggers a full resync.
+
+        Args:
+            calendar_id: Calendar ID (default: 'primary')
+
+        Returns:
+            Summary dict with the sync mode and the number of changed/deleted events
         """
         if not self.service:
             print("Google Calendar service not initialized")
-            return []
+            return {"mode": "none", "changed": 0, "deleted": 0}
+
+        with self._get_sync_lock(calendar_id):
+            return self._sync_events_locked(calendar_id)
+
+    def _get_sync_lock(self, calendar_id: str) -> threading.Lock:
+        """Per-calendar lock so concurrent refreshes don't interleave."""
+        with self._sync_locks_guard:
+            if calendar_id not in self._sync_locks:
+                self._sync_locks[calendar_id] = threading.Lock()
+            return self._sync_locks[calendar_id]
+
+    def _sync_events_locked(self, calendar_id: str) -> Dict[str, Any]:
+        """Run a full or incremental sync; the caller holds the sync lock."""
+        if calendar_id in self._sync_tokens:
+            try:
+                return self._incremental_sync(calendar_id)
+            except HttpError as e:
+                if e.resp.status != 410:
+                    print(f"Error during incremental sync: {e}")
+                    return {"mode": "error", "changed": 0, "deleted": 0}
+                print("⚠️  Sync token expired, performing full sync")
+                self._sync_tokens.pop(calendar_id, None)
 
         try:
-            # Set default time range if not provided
-            if not start_date:
-                start_date = datetime.utcnow().isoformat() + "Z"
-            if not end_date:
-                end_time = datetime.utcnow() + timedelta(days=30)
-                end_date = end_time.isoformat() + "Z"
-
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=start_date,
-                    timeMax=end_date,
-                    maxResults=max_results,
-                    singleEvents=True,
-                    orderBy="startTime",
+            return self._full_sync(calendar_id)
+        except HttpError as e:
+            print(f"Error during full sync: {e}")
+            return {"mode": "error", "changed": 0, "deleted": 0}
+
+    def watch_events(
+        self,
+        calendar_id: str,
+        address: str,
+        token: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Open a push notification channel for changes to a calendar's events.
+
+        Google then POSTs a notification to ``address`` whenever an event in
+        the calendar changes, so the app only syncs when there is something
+        new. The notification carries no event data; call ``sync_events`` to
+        fetch the changes.
+
+        Args:
+            calendar_id: Calendar to watch
+            address: HTTPS URL that receives the notifications
+            token: Opaque value echoed back in every notification, used to
+                   verify that notifications come from this channel
+            ttl_seconds: Requested channel lifetime (Google's default if None)
+
+        Returns:
+            ``{"id", "resource_id", "calendar_id", "token", "expiration"}``
+            with ``expiration`` as an aware datetime (or None), or None if the
+            channel could not be opened
+        """
+        if not self.service:
+            print("Google Calendar service not initialized")
+            return None
+
+        body = {"id": str(uuid.uuid4()), "type": "web_hook", "address": address}
+        if token:
+            body["token"] = token
+        if ttl_seconds:
+            body["params"] = {"ttl": str(ttl_seconds)}
+
+        try:
+            response = self.scheduler.execute(
+                self.service.events().watch(calendarId=calendar_id, body=body),
+                idempotent=False,
+            )
+        except HttpError as e:
+            print(f"Error opening notification channel: {e}")
+            return None
+
+        expiration = response.get("expiration")
+        channel = {
+            "id": response.get("id", body["id"]),
+            "resource_id": response.get("resourceId", ""),
+            "calendar_id": calendar_id,
+            "token": token,
+            "expiration": (
+                datetime.fromtimestamp(int(expiration) / 1000, timezone.utc)
+                if expiration
+                else None
+            ),
+        }
+        self.channels[channel["id"]] = channel
+        return channel
+
+    def stop_channel(self, channel: Dict[str, Any]) -> bool:
+        """Stop a notification channel opened by ``watch_events``."""
+        self.channels.pop(channel["id"], None)
+        if not self.service:
+            return False
+
+        try:
+            self.scheduler.execute(
+                self.service.channels().stop(
+                    body={"id": channel["id"], "resourceId": channel["resource_id"]}
                 )
-                .execute()
             )
+            return True
+        except HttpError as e:
+            print(f"Error stopping notification channel: {e}")
+            return False
+
+    def stop_all_channels(self):
+        """Stop every open notification channel, e.g. on shutdown."""
+        for channel in list(self.channels.values()):
+            self.stop_channel(channel)
+
+    def get_request_stats(self) -> Dict[str, int]:
+        """Counters for API calls, throttled, rate-limited, retried and failed requests."""
+        return self.scheduler.stats()
+
+    @property
+    def state_version(self) -> int:
+        """
+        A counter that changes whenever the calendars may have changed.
+
+        Bumped by every write made through this model and by syncs that
+        found changes, so anything derived from calendar data (such as a
+        cached answer) is still current if the version is the same.
+        """
+        return self._state_version
+
+    def _bump_state_version(self):
+        with self._state_version_lock:
+            self._state_version += 1
+
+    def get_event_store(self, calendar_id: str = "primary") -> EventStore:
+        """Return the local event store for a calendar, creating it if needed."""
+        with self._sync_locks_guard:
+            if calendar_id not in self.event_stores:
+                self.event_stores[calendar_id] = EventStore()
+            return self.event_stores[calendar_id]
+
+    def get_synced_events(
+        self, start: datetime, end: datetime, calendar_id: str = "primary"
+    ) -> List[CalendarEvent]:
+        """
+        Refresh a calendar incrementally and return its events in [start, end).
+
+        Served from the local event store when the synced window covers
+        ``start``; otherwise falls back to listing the range directly. If the
+        refresh fails, the last synced copy is served; if there is none, a
+        RuntimeError is raised instead of returning an empty list.
+        """
+        sync_result = self.sync_events(calendar_id)
+        store = self.get_event_store(calendar_id)
+        if store.covers(start):
+            return store.events_between(start, end)
+        if sync_result["mode"] == "error":
+            raise RuntimeError(f"Could not sync calendar '{calendar_id}'")
+
+        return self.get_events(
+            calendar_id=calendar_id,
+            start_date=timezone_service.localize(start).isoformat(),
+            end_date=timezone_service.localize(end).isoformat(),
+            max_results=None,
+            detail=self.SYNC_DETAIL,
+        )
+
+    def _full_sync(self, calendar_id: str) -> Dict[str, Any]:
+        """List every event in the sync window and remember the sync token."""
+        synced_from = datetime.now(timezone.utc) - timedelta(
+            days=self.SYNC_LOOKBACK_DAYS
+        )
+        events = []
+        series = []
+        cancelled_instances = []
+        sync_token = None
+
+        # orderBy is not allowed together with syncToken, so it is left out
+        # here too to keep the initial and incremental queries identical.
+        for page in self._iter_event_pages(
+            calendarId=calendar_id,
+            timeMin=synced_from.isoformat(),
+            **self._sync_list_params(),
+        ):
+            for event in page.get("items", []):
+                if event.get("status") == "cancelled":
+                    # Deleted instances of a series are listed as cancelled
+                    if event.get("recurringEventId"):
+                        cancelled_instances.append(event.get("id", ""))
+                elif event.get("recurrence"):
+                    series.append(RecurringSeries.from_google(event, calendar_id))
+                else:
+                    events.append(
+                        self._cache_event(calendar_id, event, self.SYNC_DETAIL)
+                    )
+            sync_token = page.get("nextSyncToken", sync_token)
+
+        self.get_event_store(calendar_id).replace_all(
+            events, synced_from, series, cancelled_instances
+        )
+        if self.on_store_replaced is not None:
+            self.on_store_replaced(calendar_id)
+        if sync_token:
+            self._sync_tokens[calendar_id] = sync_token
+        self._bump_state_version()
+
+        return {"mode": "full", "changed": len(events) + len(series), "deleted": 0}
+
+    def _incremental_sync(self, calendar_id: str) -> Dict[str, Any]:
+        """Fetch only the events changed since the stored sync token."""
+        store = self.get_event_store(calendar_id)
+        changed = 0
+        deleted = 0
+        sync_token = self._sync_tokens[calendar_id]
+
+        for page in self._iter_event_pages(
+            calendarId=calendar_id,
+            syncToken=sync_token,
+            **self._sync_list_params(),
+        ):
+            for event in page.get("items", []):
+                if event.get("status") == "cancelled":
+                    self._event_cache.discard(calendar_id, event.get("id", ""))
+                    if store.remove(event.get("id", "")):
+                        deleted += 1
+                elif event.get("recurrence"):
+                    store.upsert_series(RecurringSeries.from_google(event, calendar_id))
+                    changed += 1
+                else:
+                    store.upsert(
+                        self._cache_event(calendar_id, event, self.SYNC_DETAIL)
+                    )
+                    changed += 1
+            sync_token = page.get("nextSyncToken", sync_token)
+
+        self._sync_tokens[calendar_id] = sync_token
+        if changed or deleted:
+            self._bump_state_version()
+        return {"mode": "incremental", "changed": changed, "deleted": deleted}
 
-            events = []
-            for event in events_result.get("items", []):
-                converted_event = self._google_event_to_dict(event)
-                events.append(converted_event)
+    def get_event(
+        self,
+        event_id: str,
+        calendar_id: str = "primary",
+        use_cache: bool = True,
+        detail: str = "full",
+    ) -> Optional[CalendarEvent]:
+        """
+        Get a single event by ID.
+
+        Recently seen events are answered from an ID-indexed cache when they
+        were fetched with at least the requested detail; otherwise one
+        events().get request is made. Use this to load the full details of an
+        event that was listed in "summary" mode. A cached copy's ETag is sent
+        as If-None-Match, so refetching an unchanged event costs only a 304.
+
+        Args:
+            event_id: Google Calendar event ID
+            calendar_id: Calendar ID (default: 'primary')
+            use_cache: Set to False to always fetch the current server copy
+            detail: "summary" to skip descriptions and attendees, or "full"
+        """
+        cached_event = self._event_cache.get(calendar_id, event_id, detail)
+        if use_cache and cached_event is not None:
+            return cached_event
 
-            return events
+        if not self.service:
+            print("Google Calendar service not initialized")
+            return None
+
+        request = self.service.events().get(
+            calendarId=calendar_id,
+            eventId=event_id,
+            fields=self.EVENT_FIELDS[detail],
+        )
+        # Revalidate a cached copy instead of downloading it again
+        if cached_event is not None and cached_event.etag:
+            request.headers["If-None-Match"] = cached_event.etag
+
+        try:
+            google_event = self.scheduler.execute(request)
+            if google_event.get("status") == "cancelled":
+                return None
+
+            return self._cache_event(calendar_id, google_event, detail)
 
         except HttpError as e:
-            print(f"Error getting events: {e}")
-            return []
+            if cached_event is not None and e.resp.status == 304:
+                return cached_event
+            print(f"Error getting event: {e}")
+            return None
+
+    def _cache_event(
+        self, calendar_id: str, google_event: Dict[str, Any], detail: str = "full"
+    ) -> CalendarEvent:
+        """Convert a Google event, tag its calendar and remember it by ID."""
+        event = CalendarEvent.from_google(google_event, calendar_id)
+        self._event_cache.put(calendar_id, event, detail)
+        return event
+
+    def check_availability(
+        self,
+        start: datetime,
+        end: datetime,
+        calendar_ids: Optional[List[str]] = None,
+        use_local: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Check whether [start, end) is free.
+
+        If every calendar has a synced local store reaching back to ``start``,
+        the answer comes from the stores' interval indexes without a request.
+        Otherwise one freebusy query returns the busy intervals of every
+        calendar, including multi-day events that started before ``start``.
+
+        Args:
+            start: Start of the window (naive datetimes are treated as local time)
+            end: End of the window
+            calendar_ids: Calendars to check (default: ['primary'])
+            use_local: Set to False to always ask the freebusy endpoint
+
+        Returns:
+            ``{"available": bool, "busy": [...], "errors": {...}}`` where ``busy``
+            holds merged ``{"start", "end", "calendar_ids"}`` intervals with aware
+            datetimes, or an empty dict if the query failed
+        """
+        calendar_ids = calendar_ids or ["primary"]
+        start = timezone_service.localize(start)
+        end = timezone_service.localize(end)
+
+        if use_local:
+            local_availability = self.local_availability(start, end, calendar_ids)
+            if local_availability is not None:
+                return local_availability
+
+        if not self.service:
+            print("Google Calendar service not initialized")
+            return {}
+
+        try:
+            response = self.scheduler.execute(
+                self.service.freebusy().query(
+                    body={
+                        "timeMin": start.isoformat(),
+                        "timeMax": end.isoformat(),
+                        "items": [{"id": calendar_id} for calendar_id in calendar_ids],
+                    }
+                )
+            )
+        except HttpError as e:
+            print(f"Error checking availability: {e}")
+            return {}
+
+        intervals = []
+        errors = {}
+        for calendar_id, info in response.get("calendars", {}).items():
+            if info.get("errors"):
+                errors[calendar_id] = ", ".join(
+                    error.get("reason", "unknown") for error in info["errors"]
+                )
+            for busy in info.get("busy", []):
+                intervals.append(
+                    (
+                        datetime.fromisoformat(busy["start"].replace("Z", "+00:00")),
+                        datetime.fromisoformat(busy["end"].replace("Z", "+00:00")),
+                        calendar_id,
+                    )
+                )
+
+        busy = self._merge_busy_intervals(intervals)
+        return {"available": not busy, "busy": busy, "errors": errors}
+
+    def local_availability(
+        self,
+        start: datetime,
+        end: datetime,
+        calendar_ids: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        ``check_availability`` answered from the synced local stores only.
+
+        Takes microseconds and makes no request. Returns None if a calendar
+        has not been synced back to ``start``.
+        """
+        start = timezone_service.localize(start)
+        end = timezone_service.localize(end)
+        indexes = self._busy_indexes(start, end, calendar_ids or ["primary"])
+        if indexes is None:
+            return None
+
+        intervals = [
+            (max(event.start, start), min(event.end or event.start, end), calendar_id)
+            for calendar_id, index in indexes.items()
+            for event in index.overlapping(start, end)
+        ]
+        busy = self._merge_busy_intervals(intervals)
+        return {"available": not busy, "busy": busy, "errors": {}}
+
+    def find_free_slot(
+        self,
+        duration: timedelta,
+        after: datetime,
+        before: Optional[datetime] = None,
+        calendar_ids: Optional[List[str]] = None,
+    ) -> Optional[datetime]:
+        """
+        Find the earliest time from ``after`` that is free for ``duration``.
+
+        Answered from the local interval indexes when every calendar is synced
+        back to ``after``, otherwise from one freebusy query.
+
+        Args:
+            duration: Length of the free period needed
+            after: Earliest start (naive datetimes are treated as local time)
+            before: The period must end by this time (default: 14 days later)
+            calendar_ids: Calendars that must all be free (default: ['primary'])
+
+        Returns:
+            The start of the free period, or None if there is none (or the
+            freebusy query failed)
+        """
+        calendar_ids = calendar_ids or ["primary"]
+        after = timezone_service.localize(after)
+        before = timezone_service.localize(before or after + timedelta(days=14))
+
+        indexes = self._busy_indexes(after, before, calendar_ids)
+        if indexes is not None:
+            candidate = after
+            while candidate + duration <= before:
+                busy_until = [
+                    index.busy_until(candidate, candidate + duration)
+                    for index in indexes.values()
+                ]
+                busy_until = [until for until in busy_until if until is not None]
+                if not busy_until:
+                    return candidate
+                candidate = max(busy_until)
+            return None
+
+        availability = self.check_availability(
+            after, before, calendar_ids, use_local=False
+        )
+        if not availability:
+            return None
+        candidate = after
+        for busy in availability["busy"]:
+            if busy["start"] - candidate >= duration:
+                break
+            candidate = max(candidate, busy["end"])
+        return candidate if candidate + duration <= before else None
+
+    def _busy_indexes(
+        self, start: datetime, end: datetime, calendar_ids: List[str]
+    ) -> Optional[Dict[str, IntervalIndex]]:
+        """
+        Busy-event indexes of the given calendars, or None unless every one
+        of them has a synced store that covers [start, end).
+        """
+        indexes = {}
+        for calendar_id in calendar_ids:
+            store = self.event_stores.get(calendar_id)
+            if store is None or not store.covers(start, end):
+                return None
+            indexes[calendar_id] = store.index(busy_only=True)
+        return indexes
+
+    def _merge_busy_intervals(self, intervals: List[tuple]) -> List[Dict[str, Any]]:
+        """Merge overlapping (start, end, calendar_id) intervals across calendars."""
+        merged: List[Dict[str, Any]] = []
+        for start, end, calendar_id in sorted(intervals):
+            if merged and start <= merged[-1]["end"]:
+                merged[-1]["end"] = max(merged[-1]["end"], end)
+                if calendar_id not in merged[-1]["calendar_ids"]:
+                    merged[-1]["calendar_ids"].append(calendar_id)
+            else:
+                merged.append(
+                    {"start": start, "end": end, "calendar_ids": [calendar_id]}
+                )
+        return merged
 
     def create_event(
         self, event_data: Dict[str, Any], calendar_id: str = "primary"
-    ) -> Dict[str, Any]:
+    ) -> Optional[CalendarEvent]:
         """
         Create an event in Google Calendar.
 
@@ -177,49 +942,116 @@ class GoogleCalendarModel:
         """
         if not self.service:
             print("Google Calendar service not initialized")
-            return {}
+            return None
 
         try:
             # Convert to Google Calendar format
             google_event = self._dict_to_google_event(event_data)
 
             # Create the event
-            created_event = (
-                self.service.events()
-                .insert(calendarId=calendar_id, body=google_event)
-                .execute()
+            created_event = self.scheduler.execute(
+                self.service.events().insert(calendarId=calendar_id, body=google_event),
+                idempotent=False,
             )
+            self._bump_state_version()
 
-            return self._google_event_to_dict(created_event)
+            return self._cache_event(calendar_id, created_event)
 
         except HttpError as e:
             print(f"Error creating event: {e}")
-            return {}
+            return None
 
     def update_event(
         self, event_id: str, event_data: Dict[str, Any], calendar_id: str = "primary"
-    ) -> Dict[str, Any]:
+    ) -> Optional[CalendarEvent]:
         """Update an existing event in Google Calendar."""
         if not self.service:
             print("Google Calendar service not initialized")
-            return {}
+            return None
 
         try:
             # Convert to Google Calendar format
             google_event = self._dict_to_google_event(event_data)
 
             # Update the event
-            updated_event = (
-                self.service.events()
-                .update(calendarId=calendar_id, eventId=event_id, body=google_event)
-                .execute()
+            updated_event = self.scheduler.execute(
+                self.service.events().update(
+                    calendarId=calendar_id, eventId=event_id, body=google_event
+                )
             )
+            self._bump_state_version()
 
-            return self._google_event_to_dict(updated_event)
+            return self._cache_event(calendar_id, updated_event)
 
         except HttpError as e:
             print(f"Error updating event: {e}")
-            return {}
+            return None
+
+    def patch_event(
+        self, event_id: str, changes: Dict[str, Any], calendar_id: str = "primary"
+    ) -> Optional[CalendarEvent]:
+        """
+        Partially update an event, sending only the fields in ``changes``.
+
+        Unlike ``update_event`` this needs no prior read, and fields that are
+        not being changed are left as they are on the server, even if they
+        were edited elsewhere in the meantime.
+
+        Args:
+            event_id: Google Calendar event ID
+            changes: Local-format fields to change (see ``PATCH_FIELDS``)
+            calendar_id: Calendar ID (default: 'primary')
+        """
+        if not self.service:
+            print("Google Calendar service not initialized")
+            return None
+
+        try:
+            patched_event = self.scheduler.execute(
+                self.service.events().patch(
+                    calendarId=calendar_id,
+                    eventId=event_id,
+                    body=self._dict_to_google_patch(changes),
+                    fields=self.EVENT_FIELDS["full"],
+                )
+            )
+            self._bump_state_version()
+
+            return self._cache_event(calendar_id, patched_event)
+
+        except HttpError as e:
+            print(f"Error patching event: {e}")
+            return None
+
+    def get_cached_event(
+        self, event_id: str, calendar_id: str = "primary", detail: str = "summary"
+    ) -> Optional[CalendarEvent]:
+        """Return a recently seen copy of an event without making a request."""
+        return self._event_cache.get(calendar_id, event_id, detail)
+
+    def apply_local_event(self, event: CalendarEvent, detail: str = "full"):
+        """
+        Show a locally changed event before Google has confirmed it.
+
+        Args:
+            event: The optimistic local copy
+            detail: Level of detail of the copy it was made from, so a copy
+                    without description or attendees never answers a
+                    request for full details
+        """
+        self._event_cache.put(event.calendar_id, event, detail)
+        store = self.event_stores.get(event.calendar_id)
+        if store is not None:
+            store.upsert(event)
+        self._bump_state_version()
+
+    def discard_local_event(self, event_id: str, calendar_id: str = "primary"):
+        """Hide a locally deleted event before Google has confirmed it."""
+        self._event_cache.discard(calendar_id, event_id)
+        store = self.event_stores.get(calendar_id)
+        if store is not None:
+            store.remove(event_id)
+        self._bump_state_version()
 
     def delete_event(self, event_id: str, calendar_id: str = "primary") -> bool:
         """Delete an event from Google Calendar."""
@@ -228,15 +1060,301 @@ class GoogleCalendarModel:
             return False
 
         try:
-            self.service.events().delete(
-                calendarId=calendar_id, eventId=event_id
-            ).execute()
+            self.scheduler.execute(
+                self.service.events().delete(calendarId=calendar_id, eventId=event_id)
+            )
+            self._event_cache.discard(calendar_id, event_id)
+            self._bump_state_version()
             return True
 
         except HttpError as e:
             print(f"Error deleting event: {e}")
             return False
 
+    def batch_create_events(
+        self, events_data: List[Dict[str, Any]], calendar_id: str = "primary"
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many events using the Calendar API batch endpoint.
+
+        Args:
+            events_data: Events in our local format
+            calendar_id: Calendar ID (default: 'primary')
+
+        Returns:
+            One result per input event, in order (see ``_execute_batch``)
+        """
+        if not self.service:
+            print("Google Calendar service not initialized")
+            return self._batch_unavailable(len(events_data))
+
+        # Building the events() resource is slow, so it is built only once
+        events = self.service.events()
+        requests = [
+            events.insert(
+                calendarId=calendar_id, body=self._dict_to_google_event(event_data)
+            )
+            for event_data in events_data
+        ]
+        return self._execute_batch(requests, calendar_id)
+
+    def batch_patch_events(
+        self, changes_by_id: Dict[str, Dict[str, Any]], calendar_id: str = "primary"
+    ) -> List[Dict[str, Any]]:
+        """
+        Partially update many events using the Calendar API batch endpoint.
+
+        Args:
+            changes_by_id: Mapping of event ID to the local-format fields to change
+            calendar_id: Calendar ID (default: 'primary')
+
+        Returns:
+            One result per event ID, in the mapping's order
+        """
+        if not self.service:
+            print("Google Calendar service not initialized")
+            return self._batch_unavailable(len(changes_by_id))
+
+        events = self.service.events()
+        requests = [
+            events.patch(
+                calendarId=calendar_id,
+                eventId=event_id,
+                body=self._dict_to_google_patch(changes),
+            )
+            for event_id, changes in changes_by_id.items()
+        ]
+        return self._execute_batch(requests, calendar_id)
+
+    def batch_delete_events(
+        self, event_ids: List[str], calendar_id: str = "primary"
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete many events using the Calendar API batch endpoint.
+
+        Args:
+            event_ids: Google Calendar event IDs
+            calendar_id: Calendar ID (default: 'primary')
+
+        Returns:
+            One result per event ID, in order
+        """
+        if not self.service:
+            print("Google Calendar service not initialized")
+            return self._batch_unavailable(len(event_ids))
+
+        events = self.service.events()
+        requests = [
+            events.delete(calendarId=calendar_id, eventId=event_id)
+            for event_id in event_ids
+        ]
+        results = self._execute_batch(requests, calendar_id)
+        for event_id, result in zip(event_ids, results):
+            if result["success"]:
+                self._event_cache.discard(calendar_id, event_id)
+        return results
+
+    def import_ics(
+        self,
+        path: str,
+        calendar_id: str = "primary",
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create the events of an iCalendar file through the batch endpoint.
+
+        The file is streamed and sent ``chunk_size`` events at a time (each
+        chunk in batches of ``MAX_BATCH_SIZE``), so large files are never
+        loaded whole. Event IDs derive from the file's UIDs, so re-importing
+        a file skips the events that already exist.
+
+        Returns:
+            Dict with "imported", "duplicates" and "failed" counts, the
+            first few "errors", "seconds" and "events_per_sec"
+        """
+        chunk_size = chunk_size or self.IMPORT_CHUNK_SIZE
+        summary = {"imported": 0, "duplicates": 0, "failed": 0, "errors": []}
+        started = time.perf_counter()
+
+        def send(chunk: List[Dict[str, Any]]):
+            for event_data, result in zip(
+                chunk, self.batch_create_events(chunk, calendar_id)
+            ):
+                if result["success"]:
+                    summary["imported"] += 1
+                elif result["status"] == 409:
+                    # Already imported (the ID derives from the UID)
+                    summary["duplicates"] += 1
+                else:
+                    summary["failed"] += 1
+                    if len(summary["errors"]) < 10:
+                        title = event_data.get("title") or "Untitled"
+                        summary["errors"].append(f"{title}: {result['error']}")
+
+        with open(path, encoding="utf-8-sig", newline="") as source:
+            chunk = []
+            for event_data in read_ics(source):
+                chunk.append(event_data)
+                if len(chunk) >= chunk_size:
+                    send(chunk)
+                    chunk = []
+            if chunk:
+                send(chunk)
+
+        return self._with_throughput(
+            summary,
+            summary["imported"] + summary["duplicates"] + summary["failed"],
+            started,
+        )
+
+    def export_ics(
+        self,
+        path: str,
+        calendar_id: str = "primary",
+        start_date: str = None,
+        end_date: str = None,
+    ) -> Dict[str, Any]:
+        """
+        Write a calendar's events in a time range to an iCalendar file.
+
+        Pages from ``iter_events`` are written as they arrive, so only one
+        page is held in memory. The file is replaced only once complete.
+
+        Returns:
+            Dict with "exported", "seconds" and "events_per_sec"
+        """
+        started = time.perf_counter()
+        temp_path = f"{path}.part"
+        try:
+            with open(temp_path, "w", encoding="utf-8", newline="") as target:
+                exported = write_ics(
+                    self.iter_events(
+                        calendar_id=calendar_id,
+                        start_date=start_date,
+                        end_date=end_date,
+                        page_size=self.MAX_PAGE_SIZE,
+                    ),
+                    target,
+                    calendar_name=calendar_id,
+                )
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return self._with_throughput({"exported": exported}, exported, started)
+
+    def _with_throughput(
+        self, summary: Dict[str, Any], count: int, started: float
+    ) -> Dict[str, Any]:
+        """Add elapsed "seconds" and "events_per_sec" since ``started``."""
+        seconds = time.perf_counter() - started
+        summary["seconds"] = seconds
+        summary["events_per_sec"] = count / seconds if seconds > 0 else 0.0
+        return summary
+
+    def _execute_batch(
+        self, requests: List[Any], calendar_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Send requests in batches of ``MAX_BATCH_SIZE`` operations per HTTP call.
+
+        Each result is ``{"success": bool, "event": CalendarEvent, "error": str,
+        "status": int}`` (``event`` is None for failures and deletes, ``status``
+        is the HTTP status or 0 if there was none); a failing operation does
+        not affect the others in its batch.
+        """
+        results: List[Dict[str, Any]] = [
+            {"success": False, "event": None, "error": "Not executed", "status": 0}
+            for _ in requests
+        ]
+
+        pending = list(range(len(requests)))
+        attempt = 0
+
+        while pending:
+            rate_limited = []
+
+            def callback(request_id, response, exception):
+                index = int(request_id)
+                if exception is not None:
+                    if isinstance(
+                        exception, HttpError
+                    ) and self.scheduler.is_rate_limited(exception):
+                        rate_limited.append(index)
+                    results[index] = {
+                        "success": False,
+                        "event": None,
+                        "error": str(exception),
+                        "status": _http_status(exception),
+                    }
+                else:
+                    # delete returns an empty body
+                    event = (
+                        self._cache_event(calendar_id, response) if response else None
+                    )
+                    results[index] = {
+                        "success": True,
+                        "event": event,
+                        "error": "",
+                        "status": 200,
+                    }
+
+            for chunk_start in range(0, len(pending), self.MAX_BATCH_SIZE):
+                chunk = pending[chunk_start : chunk_start + self.MAX_BATCH_SIZE]
+                batch = self._new_batch(callback)
+                for index in chunk:
+                    batch.add(requests[index], request_id=str(index))
+
+                try:
+                    # Each call in a batch counts against the quota separately
+                    self.scheduler.execute(batch, idempotent=False, cost=len(chunk))
+                except HttpError as e:
+                    # The whole HTTP call failed; mark this chunk's operations
+                    print(f"Error executing batch request: {e}")
+                    for index in chunk:
+                        results[index] = {
+                            "success": False,
+                            "event": None,
+                            "error": str(e),
+                            "status": e.resp.status,
+                        }
+
+            # Operations rejected for rate limiting were not applied, so they
+            # are resent after a backoff; everything else is final.
+            if not rate_limited or attempt >= self.scheduler.max_retries:
+                break
+            self.scheduler.record_retries(len(rate_limited))
+            time.sleep(self.scheduler.backoff_delay(attempt))
+            attempt += 1
+            pending = sorted(rate_limited)
+
+        if any(result["success"] for result in results):
+            self._bump_state_version()
+        return results
+
+    def _new_batch(self, callback) -> BatchHttpRequest:
+        """An empty batch request for the configured API server."""
+        if self.api_root:
+            # The discovery document's batch URI always points at Google
+            return BatchHttpRequest(
+                callback=callback, batch_uri=f"{self.api_root}/batch/calendar/v3"
+            )
+        return self.service.new_batch_http_request(callback=callback)
+
+    def _batch_unavailable(self, count: int) -> List[Dict[str, Any]]:
+        """Failed results for a batch that could not be sent at all."""
+        return [
+            {
+                "success": False,
+                "event": None,
+                "error": "Service not initialized",
+                "status": 0,
+            }
+            for _ in range(count)
+        ]
+
     def _dict_to_google_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert our event format to Google Calendar format."""
         google_event = {
@@ -244,41 +1362,21 @@ class GoogleCalendarModel:
             "description": event_data.get("description", ""),
         }
 
-        # Get the user's local timezone in a format Google Calendar accepts
-        local_tz = datetime.now().astimezone().tzinfo
+        # Client-assigned IDs make inserts safe to retry (a repeat gets 409)
+        if event_data.get("id"):
+            google_event["id"] = event_data["id"]
 
-        # Try to get a proper timezone name that Google accepts
-        # First try to get the zone name from the timezone object
-        try:
-            if hasattr(local_tz, "zone"):
-                tz_name = local_tz.zone  # For pytz timezones
-            elif hasattr(local_tz, "key"):
-                tz_name = local_tz.key  # For zoneinfo timezones
-            else:
-                # Fall back to system timezone name
-                tz_name = (
-                    time.tzname[time.daylight] if time.daylight else time.tzname[0]
-                )
-                # If we get something like 'CEST', map it to a proper timezone
-                if tz_name in ["CEST", "CET"]:
-                    tz_name = (
-                        "Europe/Stockholm"  # Assuming you're in Sweden based on CEST
-                    )
-                elif tz_name in ["EST", "EDT"]:
-                    tz_name = "America/New_York"
-                elif tz_name in ["PST", "PDT"]:
-                    tz_name = "America/Los_Angeles"
-                else:
-                    # Default to UTC if we can't determine
-                    tz_name = "UTC"
-        except:
-            # If all else fails, use UTC
-            tz_name = "UTC"
+        # The user's zone, resolved once; Google needs its IANA name
+        local_tz = timezone_service.tz
+        tz_name = timezone_service.name
 
         # Handle start time - accept both string and datetime objects
         if event_data.get("start_time"):
             start_time_value = event_data["start_time"]
-            if isinstance(start_time_value, str):
+            if _is_date(start_time_value):
+                # All-day event
+                google_event["start"] = {"date": start_time_value.isoformat()}
+            elif isinstance(start_time_value, str):
                 # Parse the datetime string
                 try:
                     start_dt = datetime.fromisoformat(
@@ -296,15 +1394,19 @@ class GoogleCalendarModel:
                 if start_dt.tzinfo is None:
                     start_dt = start_dt.replace(tzinfo=local_tz)
 
-            google_event["start"] = {
-                "dateTime": start_dt.isoformat(),
-                "timeZone": tz_name,
-            }
+            if not _is_date(start_time_value):
+                google_event["start"] = {
+                    "dateTime": start_dt.isoformat(),
+                    # Keep an IANA zone (recurrences repeat in it), else the user's
+                    "timeZone": getattr(start_dt.tzinfo, "key", None) or tz_name,
+                }
 
         # Handle end time - accept both string and datetime objects
         if event_data.get("end_time"):
             end_time_value = event_data["end_time"]
-            if isinstance(end_time_value, str):
+            if _is_date(end_time_value):
+                google_event["end"] = {"date": end_time_value.isoformat()}
+            elif isinstance(end_time_value, str):
                 try:
                     end_dt = datetime.fromisoformat(
                         end_time_value.replace("Z", "+00:00")
@@ -321,10 +1423,11 @@ class GoogleCalendarModel:
                 if end_dt.tzinfo is None:
                     end_dt = end_dt.replace(tzinfo=local_tz)
 
-            google_event["end"] = {
-                "dateTime": end_dt.isoformat(),
-                "timeZone": tz_name,
-            }
+            if not _is_date(end_time_value):
+                google_event["end"] = {
+                    "dateTime": end_dt.isoformat(),
+                    "timeZone": getattr(end_dt.tzinfo, "key", None) or tz_name,
+                }
 
         # Handle location
         if event_data.get("location"):
@@ -342,49 +1445,30 @@ class GoogleCalendarModel:
                         attendees_list.append({"email": email})
                 google_event["attendees"] = attendees_list
 
+        # RRULE/EXDATE/RDATE lines of a recurring event
+        if event_data.get("recurrence"):
+            google_event["recurrence"] = list(event_data["recurrence"])
+
         return google_event
 
-    def _google_event_to_dict(self, google_event: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert Google Calendar event format to our event format."""
-        # Extract start and end times
-        start_time = ""
-        end_time = ""
-
-        if "start" in google_event:
-            if "dateTime" in google_event["start"]:
-                start_time = google_event["start"]["dateTime"]
-            elif "date" in google_event["start"]:
-                start_time = google_event["start"]["date"] + "T00:00:00"
-
-        if "end" in google_event:
-            if "dateTime" in google_event["end"]:
-                end_time = google_event["end"]["dateTime"]
-            elif "date" in google_event["end"]:
-                end_time = google_event["end"]["date"] + "T00:00:00"
-
-        # Extract attendees
-        attendees = ""
-        if "attendees" in google_event:
-            attendee_emails = [
-                attendee.get("email", "") for attendee in google_event["attendees"]
-            ]
-            attendees = ", ".join(filter(None, attendee_emails))
+    def _dict_to_google_patch(self, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a partial event in our format to a PATCH body.
 
-        return {
-            "id": google_event.get("id", ""),
-            "title": google_event.get("summary", ""),
-            "start_time": start_time,
-            "end_time": end_time,
-            "description": google_event.get("description", ""),
-            "location": google_event.get("location", ""),
-            "attendees": attendees,
-            "google_id": google_event.get("id", ""),
-            "html_link": google_event.get("htmlLink", ""),
-        }
+        Only the fields present in ``changes`` are included, so unchanged
+        fields on the server are left alone. Empty strings clear a field.
+        """
+        full_event = self._dict_to_google_event(changes)
+        patch = {}
+        for local_key, google_key in self.PATCH_FIELDS.items():
+            if local_key in changes:
+                default = [] if google_key == "attendees" else ""
+                patch[google_key] = full_event.get(google_key, default)
+        return patch
 
     def sync_events_to_google(
         self, local_events: List[Dict[str, Any]], calendar_id: str = "primary"
-    ) -> List[Dict[str, Any]]:
+    ) -> List[CalendarEvent]:
         """
         Sync local events to Google Calendar.
 
@@ -396,22 +1480,22 @@ class GoogleCalendarModel:
             List of created events with Google IDs
         """
         created_events = []
+        results = self.batch_create_events(local_events, calendar_id)
 
-        for event in local_events:
-            try:
-                created_event = self.create_event(event, calendar_id)
-                if created_event:
-                    created_events.append(created_event)
-                    print(f"✓ Synced to Google: {event.get('title', '')}")
-
-            except Exception as e:
-                print(f"✗ Error syncing event {event.get('title', '')}: {e}")
+        for event, result in zip(local_events, results):
+            if result["success"]:
+                created_events.append(result["event"])
+                print(f"✓ Synced to Google: {event.get('title', '')}")
+            else:
+                print(
+                    f"✗ Error syncing event {event.get('title', '')}: {result['error']}"
+                )
 
         return created_events
 
     def sync_events_from_google(
         self, calendar_id: str = "primary", start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[CalendarEvent]:
         """
         Sync events from Google Calendar to our local format.
 
@@ -434,7 +1518,7 @@ class GoogleCalendarModel:
 
     def quick_add_event(
         self, text: str, calendar_id: str = "primary"
-    ) -> Dict[str, Any]:
+    ) -> Optional[CalendarEvent]:
         """
         Create an event using Google's Quick Add feature.
 
@@ -444,17 +1528,29 @@ class GoogleCalendarModel:
         """
         if not self.service:
             print("Google Calendar service not initialized")
-            return {}
+            return None
 
         try:
-            created_event = (
-                self.service.events()
-                .quickAdd(calendarId=calendar_id, text=text)
-                .execute()
+            created_event = self.scheduler.execute(
+                self.service.events().quickAdd(calendarId=calendar_id, text=text),
+                idempotent=False,
             )
+            self._bump_state_version()
 
-            return self._google_event_to_dict(created_event)
+            return self._cache_event(calendar_id, created_event)
 
         except HttpError as e:
             print(f"Error with quick add: {e}")
-            return {}
+            return None
+
+
+def _http_status(error: Exception) -> int:
+    """HTTP status of an API error, or 0 for errors without a response."""
+    if isinstance(error, HttpError):
+        return error.resp.status
+    return 0
+
+
+def _is_date(value: Any) -> bool:
+    """Whether ``value`` is a date without a time (an all-day start or end)."""
+    return isinstance(value, date) and not isinstance(value, datetime)
@@ -0,0 +1,311 @@
+import hashlib
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterable, Iterator, Optional, TextIO, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.timezone_service import timezone_service
+
+# RFC 5545 limits content lines to 75 octets, excluding the line break
+MAX_LINE_OCTETS = 75
+
+_DURATION = re.compile(
+    r"([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?"
+)
+_RECURRENCE_PROPERTIES = ("RRULE", "RDATE", "EXDATE")
+
+
+def read_ics(source: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the VEVENTs of an iCalendar file as events in our local format.
+
+    Reads one line at a time and keeps only the current event, except for
+    recurring events and their overrides (RECURRENCE-ID), which are held
+    until the end of the file: each overridden occurrence is excluded from
+    its series with an EXDATE, so it is not imported twice. Each event
+    dict has "id", "title", "start_time",
+    "end_time" (datetimes, or dates for all-day events), "description",
+    "location", "attendees" and, for recurring events, "recurrence".
+
+    The "id" is derived from the UID (and RECURRENCE-ID), which makes an
+    import safe to retry: creating an event that already exists gets 409.
+    Events without DTSTART are skipped.
+    """
+    event: Optional[Dict[str, Any]] = None
+    # Components nested in the VEVENT (e.g. VALARM) whose lines are ignored
+    nested = 0
+    # Recurring masters by UID, and overrides of their occurrences
+    series: Dict[str, Dict[str, Any]] = {}
+    overrides: List[Dict[str, Any]] = []
+
+    for name, params, value in _content_lines(source):
+        if name == "BEGIN":
+            if value.upper() == "VEVENT" and event is None:
+                event = {}
+            elif event is not None:
+                nested += 1
+            continue
+        if name == "END":
+            if event is not None and nested:
+                nested -= 1
+            elif event is not None and value.upper() == "VEVENT":
+                uid = event.get("UID", (None, ""))[1]
+                if uid and "RECURRENCE-ID" in event:
+                    overrides.append(event)
+                elif uid and ("RRULE" in event or "RDATE" in event):
+                    series[uid] = event
+                else:
+                    converted = _to_local_event(event)
+                    if converted is not None:
+                        yield converted
+                event = None
+            continue
+        if event is None or nested:
+            continue
+        if name in _RECURRENCE_PROPERTIES or name == "ATTENDEE":
+            event.setdefault(name, []).append((params, value))
+        else:
+            event.setdefault(name, (params, value))
+
+    for override in overrides:
+        master = series.get(override["UID"][1])
+        if master is not None:
+            params, value = override["RECURRENCE-ID"]
+            params = {key: param for key, param in params.items() if key != "RANGE"}
+            master.setdefault("EXDATE", []).append((params, value))
+    for properties in (*series.values(), *overrides):
+        converted = _to_local_event(properties)
+        if converted is not None:
+            yield converted
+
+
+def write_ics(
+    events: Iterable[CalendarEvent], target: TextIO, calendar_name: str = ""
+) -> int:
+    """
+    Write events to an iCalendar file as they are produced.
+
+    Nothing is buffered beyond the current event, so ``events`` can be a
+    lazy iterator over API pages. Returns the number of events written.
+    """
+    stamp = _format_datetime(datetime.now(timezone.utc))
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//AI Calendar Assistant//EN",
+        "CALSCALE:GREGORIAN",
+    ]
+    if calendar_name:
+        lines.append(f"X-WR-CALNAME:{_escape(calendar_name)}")
+    _write_lines(target, lines)
+
+    count = 0
+    for event in events:
+        if event.start is None:
+            continue
+        lines = ["BEGIN:VEVENT", f"UID:{event.id}@google.com", f"DTSTAMP:{stamp}"]
+        if event.all_day:
+            start_date = timezone_service.local_date(event.start)
+            end_date = (
+                timezone_service.local_date(event.end)
+                if event.end
+                else start_date + timedelta(days=1)
+            )
+            lines.append(f"DTSTART;VALUE=DATE:{start_date:%Y%m%d}")
+            lines.append(f"DTEND;VALUE=DATE:{end_date:%Y%m%d}")
+        else:
+            lines.append(f"DTSTART:{_format_datetime(event.start)}")
+            lines.append(f"DTEND:{_format_datetime(event.end or event.start)}")
+        lines.append(f"SUMMARY:{_escape(event.title)}")
+        if event.description:
+            lines.append(f"DESCRIPTION:{_escape(event.description)}")
+        if event.location:
+            lines.append(f"LOCATION:{_escape(event.location)}")
+        for email in filter(None, (a.strip() for a in event.attendees.split(","))):
+            lines.append(f"ATTENDEE:mailto:{email}")
+        if event.html_link:
+            lines.append(f"URL:{event.html_link}")
+        if event.transparent:
+            lines.append("TRANSP:TRANSPARENT")
+        lines.append("END:VEVENT")
+        _write_lines(target, lines)
+        count += 1
+
+    _write_lines(target, ["END:VCALENDAR"])
+    return count
+
+
+def _content_lines(source: TextIO) -> Iterator[Tuple[str, Dict[str, str], str]]:
+    """Unfold the file's lines and split them into (name, params, value)."""
+    current = ""
+    for raw_line in source:
+        line = raw_line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            # A folded continuation of the previous line
+            current += line[1:]
+            continue
+        if current:
+            parsed = _parse_content_line(current)
+            if parsed is not None:
+                yield parsed
+        current = line
+    if current:
+        parsed = _parse_content_line(current)
+        if parsed is not None:
+            yield parsed
+
+
+def _parse_content_line(line: str) -> Optional[Tuple[str, Dict[str, str], str]]:
+    """Split ``NAME;PARAM=value;...:VALUE``; params may quote ':' and ';'."""
+    separators = []
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in ";:":
+            separators.append(index)
+            if char == ":":
+                break
+    else:
+        return None
+
+    name = line[: separators[0]].upper()
+    params = {}
+    for start, end in zip(separators, separators[1:]):
+        key, _, param_value = line[start + 1 : end].partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return name, params, line[separators[-1] + 1 :]
+
+
+def _to_local_event(properties: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Convert a VEVENT's properties into our local event format."""
+    if "DTSTART" not in properties:
+        return None
+    start = _parse_time(*properties["DTSTART"])
+    if "DTEND" in properties:
+        end = _parse_time(*properties["DTEND"])
+    elif "DURATION" in properties:
+        end = start + _parse_duration(properties["DURATION"][1])
+    else:
+        # RFC 5545: a date lasts one day, a date-time takes no time
+        end = start + timedelta(days=1) if _is_date(start) else start
+
+    uid = properties.get("UID", (None, ""))[1]
+    recurrence_id = properties.get("RECURRENCE-ID", (None, ""))[1]
+    event = {
+        "title": _unescape(properties.get("SUMMARY", (None, ""))[1]),
+        "start_time": start,
+        "end_time": end,
+        "description": _unescape(properties.get("DESCRIPTION", (None, ""))[1]),
+        "location": _unescape(properties.get("LOCATION", (None, ""))[1]),
+        "attendees": ", ".join(
+            value[len("mailto:") :] if value.lower().startswith("mailto:") else value
+            for _, value in properties.get("ATTENDEE", [])
+        ),
+    }
+    if uid:
+        # SHA-1 hex digits are valid base32hex, as event IDs require
+        event["id"] = hashlib.sha1(f"{uid}|{recurrence_id}".encode()).hexdigest()
+
+    recurrence = []
+    for name in _RECURRENCE_PROPERTIES:
+        for params, value in properties.get(name, []):
+            param_text = "".join(f";{key}={param}" for key, param in params.items())
+            recurrence.append(f"{name}{param_text}:{value}")
+    if recurrence:
+        event["recurrence"] = recurrence
+    return event
+
+
+def _is_date(value: Any) -> bool:
+    return isinstance(value, date) and not isinstance(value, datetime)
+
+
+def _parse_time(params: Dict[str, str], value: str):
+    """
+    Parse a DATE or DATE-TIME value.
+
+    UTC ("Z") and TZID times become aware datetimes; floating times and
+    unknown TZIDs are taken as the user's local time.
+    """
+    value = value.strip()
+    if params.get("VALUE", "").upper() == "DATE" or len(value) == 8:
+        return datetime.strptime(value[:8], "%Y%m%d").date()
+
+    if value.endswith("Z"):
+        return datetime.strptime(value[:-1], "%Y%m%dT%H%M%S").replace(
+            tzinfo=timezone.utc
+        )
+    parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    if "TZID" in params:
+        try:
+            return parsed.replace(tzinfo=ZoneInfo(params["TZID"].lstrip("/")))
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    return timezone_service.localize(parsed)
+
+
+def _parse_duration(value: str) -> timedelta:
+    match = _DURATION.fullmatch(value.strip())
+    if not match:
+        return timedelta(0)
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(
+        weeks=int(weeks or 0),
+        days=int(days or 0),
+        hours=int(hours or 0),
+        minutes=int(minutes or 0),
+        seconds=int(seconds or 0),
+    )
+    return -duration if sign == "-" else duration
+
+
+def _format_datetime(value: datetime) -> str:
+    return f"{value.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _unescape(text: str) -> str:
+    result = []
+    chars = iter(text)
+    for char in chars:
+        if char == "\\":
+            escaped = next(chars, "")
+            result.append("\n" if escaped in ("n", "N") else escaped)
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def _write_lines(target: TextIO, lines: List[str]):
+    target.write("".join(_fold(line) + "\r\n" for line in lines))
+
+
+def _fold(line: str) -> str:
+    """Fold a line into 75-octet pieces without splitting UTF-8 characters."""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line
+    pieces = []
+    piece = ""
+    size = 0
+    limit = MAX_LINE_OCTETS
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > limit:
+            pieces.append(piece)
+            # Continuation lines start with a space, which counts
+            piece, size, limit = "", 0, MAX_LINE_OCTETS - 1
+        piece += char
+        size += char_size
+    pieces.append(piece)
+    return "\r\n ".join(pieces)
@@ -0,0 +1,538 @@
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import List, Dict, Optional, Tuple
+
+import parsedatetime
+
+from calendar_assistant.models.async_google_calendar_model import (
+    AsyncGoogleCalendarModel,
+)
+from calendar_assistant.models.timezone_service import timezone_service
+
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?"
+    r"|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+_WEEKDAY = r"(?:mon|tues|wednes|thurs|fri|satur|sun)day"
+# Day phrases the router understands; anything else goes to the agent
+_DAY = re.compile(
+    r"\b(?:"
+    r"(?P<relative>today|tonight|tomorrow|day after tomorrow)"
+    rf"|(?:on\s+)?(?:(?P<qualifier>this|next)\s+)?(?P<weekday>{_WEEKDAY})"
+    r"|(?:on\s+)?(?P<iso>\d{4}-\d{2}-\d{2})"
+    rf"|(?:on\s+)?(?P<month_day>{_MONTH}\.?\s+\d{{1,2}}(?:st|nd|rd|th)?"
+    rf"|\d{{1,2}}(?:st|nd|rd|th)?\s+(?:of\s+)?{_MONTH})"
+    r")\b"
+)
+_CLOCK = r"(?:\d{1,2}(?::\d{2})?\s*(?:am|pm)|\d{1,2}:\d{2}|noon|midnight)"
+_TIME_RANGE = re.compile(
+    rf"\b(?:from\s+|between\s+)?(?P<start>\d{{1,2}}(?::\d{{2}})?|{_CLOCK})"
+    rf"\s*(?:-|–|to|until|till|and)\s*(?P<end>{_CLOCK})(?!\w)"
+)
+_TIME = re.compile(rf"(?:\b(?:at\s+)|@\s*|\b)(?P<start>{_CLOCK})(?!\w)")
+_DURATION = re.compile(
+    r"\bfor\s+(?:(?P<number>\d+(?:\.\d+)?)|an?)\s*"
+    r"(?P<unit>h(?:ou)?rs?|min(?:ute)?s?)\b"
+)
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_CALENDAR_SUFFIX = re.compile(
+    r"\s+(?:to|in|on|into)\s+(?:my\s+)?(?:google\s+)?calendar\b"
+)
+
+_CREATE = re.compile(
+    r"^(?:please\s+)?(?:create|add|schedule|book|set\s+up|put)\s+(?P<rest>.+)$"
+)
+_LIST = (
+    re.compile(
+        r"^(?:please\s+)?(?:show|list|display|get|view)(?:\s+me)?(?:\s+all)?"
+        r"(?:\s+(?:of\s+)?my)?\s+(?:events|meetings|appointments|calendar"
+        r"|schedule|agenda|plans)(?P<when>.*)$"
+    ),
+    re.compile(
+        r"^what(?:'s|\s+is|\s+do\s+i\s+have|\s+have\s+i\s+got|\s+are\s+my"
+        r"\s+(?:events|meetings|plans))(?:\s+(?:on|in)\s+my\s+(?:calendar"
+        r"|schedule|agenda))?(?P<when>.*)$"
+    ),
+)
+_DELETE = re.compile(
+    r"^(?:please\s+)?(?:delete|remove|cancel)\s+(?:my\s+|the\s+)?(?P<rest>.+)$"
+)
+
+# Words that make a request more than the fast path can safely do
+_UNSURE = re.compile(
+    r"\b(?:every|each|daily|weekly|monthly|yearly|recurring|repeat\w*|remind\w*"
+    r"|all|not|don'?t|instead|again|also|both|then|unless|if|or)\b|\?"
+)
+# Titles that refer back to the conversation ("add it at 5pm")
+_PRONOUNS = {"it", "that", "this", "them", "one", "these", "those"}
+# Generic words that do not identify an event by themselves
+_GENERIC = {
+    "event",
+    "events",
+    "meeting",
+    "meetings",
+    "appointment",
+    "appointments",
+    "a",
+    "an",
+    "the",
+    "my",
+}
+_WEEKDAYS = ["mon", "tues", "wednes", "thurs", "fri", "satur", "sun"]
+
+
+@dataclass(slots=True)
+class Intent:
+    """A request the router can carry out without the agent."""
+
+    action: str  # "create", "list" or "delete"
+    title: str = ""
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    attendees: List[str] = field(default_factory=list)
+    # Whether the user gave a clock time (for delete: only match that start)
+    has_time: bool = False
+
+
+class IntentRouter:
+    """
+    Handles simple create/list/delete requests without the LLM agent.
+
+    Recognizes common phrasings with fixed patterns, resolves the dates in
+    them with parsedatetime and calls the calendar model directly, so
+    "create meeting at 4pm today" takes milliseconds instead of several LLM
+    round trips. Whenever a request does not fit a pattern exactly, is
+    ambiguous (a bare "at 4", a pronoun, a recurrence, several matching
+    events) or needs the conversation for context, ``route`` returns None
+    and the caller falls back to the agent. Responses use the same wording
+    as the agent's tools, so the conversation history reads the same.
+    """
+
+    # How far ahead "delete <title>" looks when no day is given
+    DELETE_SEARCH_DAYS = 14
+    # Length of created events when no end or duration is given
+    DEFAULT_DURATION = timedelta(hours=1)
+
+    def __init__(self, calendar: AsyncGoogleCalendarModel):
+        self.calendar = calendar
+        self._parser = parsedatetime.Calendar(
+            version=parsedatetime.VERSION_CONTEXT_STYLE
+        )
+        self._lock = threading.Lock()
+        self._stats = {"total": 0, "create": 0, "list": 0, "delete": 0}
+
+    async def route(self, user_input: str) -> Optional[str]:
+        """
+        Handle the request locally if it is simple enough.
+
+        Returns:
+            The response text, or None if the agent should handle it
+        """
+        intent = self.parse(user_input)
+        handled = None
+        if intent is not None and await self.calendar.ensure_service():
+            try:
+                if intent.action == "create":
+                    handled = await self._create(intent)
+                elif intent.action == "list":
+                    handled = await self._list(intent)
+                else:
+                    handled = await self._delete(intent)
+            except Exception as e:
+                # Let the agent try; it reports errors in context
+                print(f"Fast path failed, using the agent: {e}")
+                handled = None
+
+        with self._lock:
+            self._stats["total"] += 1
+            if handled is not None:
+                self._stats[intent.action] += 1
+        return handled
+
+    def parse(
+        self, user_input: str, now: Optional[datetime] = None
+    ) -> Optional[Intent]:
+        """Turn a request into an Intent, or None if it is not clearly simple."""
+        text = " ".join(user_input.strip().lower().rstrip(".!").split())
+        now = timezone_service.to_local(now or timezone_service.now())
+
+        for pattern in _LIST:
+            match = pattern.match(text)
+            if match:
+                return self._parse_list(match.group("when"), now)
+        if _UNSURE.search(text):
+            return None
+
+        match = _CREATE.match(text)
+        if match:
+            original = user_input.strip().rstrip(".!")
+            # Keep the title's original capitalization
+            rest = original[len(original) - len(match.group("rest")) :]
+            return self._parse_create(rest, now)
+        match = _DELETE.match(text)
+        if match:
+            return self._parse_delete(match.group("rest"), now)
+        return None
+
+    def get_stats(self) -> Dict[str, float]:
+        """Requests seen, handled locally by action, and the local share."""
+        with self._lock:
+            stats = dict(self._stats)
+        local = stats["create"] + stats["list"] + stats["delete"]
+        stats["local"] = local
+        stats["local_share"] = local / stats["total"] if stats["total"] else 0.0
+        return stats
+
+    def summary(self) -> str:
+        """One-line report of how many requests skipped the agent."""
+        stats = self.get_stats()
+        return (
+            f"⚡ Handled {stats['local']} of {stats['total']} requests locally "
+            f"({stats['local_share']:.0%}): {stats['create']} create, "
+            f"{stats['list']} list, {stats['delete']} delete"
+        )
+
+    def _parse_create(self, rest: str, now: datetime) -> Optional[Intent]:
+        rest = _CALENDAR_SUFFIX.sub("", rest)
+        attendees = _EMAIL.findall(rest)
+        rest = _EMAIL.sub("", rest)
+
+        when = self._parse_when(rest, now)
+        if when is None or not when[2]:
+            # No clock time: an all-day event or a question for the agent
+            return None
+        start, end, _, remainder = when
+        if start < now:
+            return None
+
+        duration = _DURATION.search(remainder)
+        if duration:
+            if end is not None:
+                return None
+            number = float(duration.group("number") or 1)
+            unit = (
+                timedelta(hours=1)
+                if duration.group("unit")[0] == "h"
+                else (timedelta(minutes=1))
+            )
+            end = start + number * unit
+            remainder = remainder[: duration.start()] + remainder[duration.end() :]
+
+        title = _clean_title(remainder)
+        if title is None:
+            return None
+        return Intent(
+            action="create",
+            title=title,
+            start=start,
+            end=end or start + self.DEFAULT_DURATION,
+            attendees=attendees,
+            has_time=True,
+        )
+
+    def _parse_list(self, when: str, now: datetime) -> Optional[Intent]:
+        when = re.sub(r"^(?:for|on|in)\s+", "", when.strip(" ?"))
+        today = now.date()
+        if when in ("", "today", "for today", "tonight"):
+            first_day, days = today, 1
+        elif when == "tomorrow":
+            first_day, days = today + timedelta(days=1), 1
+        elif when in ("this week", "the week"):
+            first_day = today
+            days = 7 - today.weekday()
+        elif when == "next week":
+            first_day = today + timedelta(days=7 - today.weekday())
+            days = 7
+        elif when in ("this month", "the month"):
+            first_day = today.replace(day=1)
+            next_month = (first_day + timedelta(days=32)).replace(day=1)
+            days = (next_month - first_day).days
+        else:
+            match = _DAY.fullmatch(when)
+            day = self._resolve_day(match, now) if match else None
+            if day is None:
+                return None
+            first_day, days = day, 1
+
+        return Intent(
+            action="list",
+            start=_midnight(first_day),
+            end=_midnight(first_day + timedelta(days=days)),
+        )
+
+    def _parse_delete(self, rest: str, now: datetime) -> Optional[Intent]:
+        when = self._parse_when(rest, now)
+        if when is None:
+            return None
+        start, end, has_time, remainder = when
+        title = _clean_title(remainder)
+        if title is None:
+            return None
+        words = set(re.findall(r"\w+", title.lower())) - _GENERIC
+        if not words:
+            return None
+
+        if start is None:
+            # No day given: search the coming days
+            start = now
+            end = now + timedelta(days=self.DELETE_SEARCH_DAYS)
+        elif not has_time:
+            start, end = start, start + timedelta(days=1)
+        return Intent(
+            action="delete", title=title, start=start, end=end, has_time=has_time
+        )
+
+    def _parse_when(
+        self, text: str, now: datetime
+    ) -> Optional[Tuple[Optional[datetime], Optional[datetime], bool, str]]:
+        """
+        Find at most one day phrase and one time (or time range) in ``text``.
+
+        Returns:
+            (start, end or None, whether a clock time was given, the text
+            without them), with start None if neither was given; or None if
+            the text has several days or times or one cannot be resolved
+        """
+        lowered = text.lower()
+        days = list(_DAY.finditer(lowered))
+        if len(days) > 1:
+            return None
+        day = None
+        spans = []
+        if days:
+            day = self._resolve_day(days[0], now)
+            if day is None:
+                return None
+            spans.append(days[0].span())
+
+        start_clock = end_clock = None
+        time_range = _TIME_RANGE.search(lowered)
+        if time_range:
+            end_clock = _parse_clock(time_range.group("end"))
+            meridiem = re.search(r"am|pm", time_range.group("end"))
+            start_clock = _parse_clock(
+                time_range.group("start"), meridiem.group() if meridiem else None
+            )
+            if start_clock is None or end_clock is None:
+                return None
+            spans.append(time_range.span())
+            rest = lowered[: time_range.start()] + lowered[time_range.end() :]
+            if _TIME.search(rest):
+                return None
+        else:
+            times = list(_TIME.finditer(lowered))
+            if len(times) > 1:
+                return None
+            if times:
+                start_clock = _parse_clock(times[0].group("start"))
+                if start_clock is None:
+                    return None
+                spans.append(times[0].span())
+        if _overlapping(spans):
+            return None
+
+        remainder = text
+        for span_start, span_end in sorted(spans, reverse=True):
+            remainder = remainder[:span_start] + " " + remainder[span_end:]
+        # "at 4" or "at 16" without a clock format is left for the agent
+        if re.search(r"\bat\s+\d", remainder.lower()):
+            return None
+
+        if day is None and start_clock is None:
+            return None, None, False, remainder
+        if start_clock is None:
+            return _midnight(day), None, False, remainder
+
+        day = day or now.date()
+        start = timezone_service.localize(datetime.combine(day, start_clock))
+        end = None
+        if end_clock is not None:
+            end = timezone_service.localize(datetime.combine(day, end_clock))
+            if end <= start:
+                return None
+        return start, end, True, remainder
+
+    def _resolve_day(self, match: re.Match, now: datetime) -> Optional[date]:
+        """The date of a ``_DAY`` match, relative to ``now``."""
+        today = now.date()
+        relative = match.group("relative")
+        if relative in ("today", "tonight"):
+            return today
+        if relative == "tomorrow":
+            return today + timedelta(days=1)
+        if relative == "day after tomorrow":
+            return today + timedelta(days=2)
+
+        weekday = match.group("weekday")
+        if weekday:
+            ahead = (_WEEKDAYS.index(weekday[: -len("day")]) - today.weekday()) % 7
+            if ahead == 0:
+                # "on saturday" said on a Saturday could mean either
+                return None
+            if match.group("qualifier") == "next" and ahead < 7 - today.weekday():
+                # "next friday" on a Monday is ambiguous too
+                return None
+            return today + timedelta(days=ahead)
+
+        if match.group("iso"):
+            try:
+                return date.fromisoformat(match.group("iso"))
+            except ValueError:
+                return None
+
+        # parsedatetime reads "5th of december" as December 1st, so drop "of"
+        # and make sure the day it found is the one that was said
+        month_day = re.sub(r"\s+of\s+", " ", match.group("month_day"))
+        parsed, context = self._parser.parseDT(
+            month_day, sourceTime=now.replace(tzinfo=None)
+        )
+        if not context.hasDate or parsed.day != int(re.search(r"\d+", month_day)[0]):
+            return None
+        return parsed.date()
+
+    async def _create(self, intent: Intent) -> Optional[str]:
+        calendar_ids = await self.calendar.get_selected_calendar_ids()
+        availability = await self.calendar.check_availability(
+            intent.start, intent.end, calendar_ids
+        )
+        if availability and availability.get("busy"):
+            # Conflicts need the user's choice, which the agent follows up on
+            return None
+
+        created_event = await self.calendar.create_event(
+            event_data={
+                "title": intent.title,
+                "start_time": intent.start.isoformat(),
+                "end_time": intent.end.isoformat(),
+                "attendees": ", ".join(intent.attendees),
+            }
+        )
+        if not created_event:
+            return None
+        start = timezone_service.to_local(created_event.start)
+        end = timezone_service.to_local(created_event.end)
+        return (
+            f"✅ Successfully created Google Calendar event: '{created_event.title}' "
+            f"from {start.strftime('%Y-%m-%d %H:%M %Z')} "
+            f"to {end.strftime('%H:%M %Z')}."
+        )
+
+    async def _list(self, intent: Intent) -> str:
+        events = await self.calendar.get_synced_events_multi(intent.start, intent.end)
+        last_day = (intent.end - timedelta(days=1)).date()
+        if last_day == intent.start.date():
+            period = intent.start.strftime("%A, %B %d")
+        else:
+            period = f"{intent.start.strftime('%B %d')} - {last_day.strftime('%B %d')}"
+        if not events:
+            return f"No events scheduled for {period} in Google Calendar."
+
+        lines = [f"Google Calendar events for {period} (with IDs for updates):"]
+        for event in events:
+            start = timezone_service.to_local(event.start)
+            when = start.strftime("%Y-%m-%d %H:%M %Z")
+            if event.all_day:
+                when = start.strftime("%Y-%m-%d (all day)")
+            location = f" at {event.location}" if event.location else ""
+            lines.append(
+                f"- {event.title or 'Untitled Google Event'} on {when}{location} "
+                f"[ID: {event.id}, Calendar: {event.calendar_id}]"
+            )
+        return "\n".join(lines)
+
+    async def _delete(self, intent: Intent) -> Optional[str]:
+        if intent.has_time:
+            # Search that day and keep the event starting at the given time
+            day_start = _midnight(intent.start.date())
+            events = await self.calendar.get_synced_events_multi(
+                day_start, _midnight(intent.start.date() + timedelta(days=1))
+            )
+        else:
+            events = await self.calendar.get_synced_events_multi(
+                intent.start, intent.end
+            )
+        words = set(re.findall(r"\w+", intent.title.lower())) - _GENERIC
+        matches = [
+            event
+            for event in events
+            if words <= set(re.findall(r"\w+", event.title.lower()))
+            and (not intent.has_time or event.start == intent.start)
+        ]
+        if len(matches) != 1:
+            # None or several candidates: the agent asks which one
+            return None
+
+        event = matches[0]
+        if not await self.calendar.delete_event(event.id, event.calendar_id):
+            return None
+        formatted_time = timezone_service.to_local(event.start).strftime(
+            "%Y-%m-%d %H:%M %Z"
+        )
+        return (
+            f"Successfully deleted Google Calendar event '{event.title}' "
+            f"scheduled for {formatted_time}."
+        )
+
+
+def _parse_clock(text: str, meridiem: Optional[str] = None) -> Optional[time]:
+    """
+    Parse "4pm", "4:30 pm", "16:00", "noon" or "midnight".
+
+    A bare hour is only accepted with ``meridiem`` (from the end of a range
+    like "9-10am"); "4:30" without am/pm is read as 24-hour time, except
+    for the hours that are more likely afternoon.
+    """
+    text = text.strip()
+    if text == "noon":
+        return time(12, 0)
+    if text == "midnight":
+        return time(0, 0)
+    match = re.fullmatch(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?", text)
+    if not match:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2) or 0)
+    suffix = match.group(3) or meridiem
+    if suffix:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if suffix == "pm" else 0)
+    elif match.group(2) is None or 1 <= hour <= 7:
+        # "at 4" or "4:30": morning or afternoon?
+        return None
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def _clean_title(text: str) -> Optional[str]:
+    """The event title left after removing dates and filler, or None."""
+    title = " ".join(text.split())
+    title = re.sub(
+        r"^(?:(?:a|an|the|new)\s+)?(?:(?:event|meeting|appointment)\s+)?"
+        r"(?:called|titled|named)\s+",
+        "",
+        title,
+        flags=re.IGNORECASE,
+    )
+    title = re.sub(r"^(?:a|an|the|new)\s+", "", title, flags=re.IGNORECASE)
+    previous = None
+    while previous != title:
+        previous = title
+        title = re.sub(
+            r"\s+(?:at|on|for|from|with|and|,)$", "", title, flags=re.IGNORECASE
+        )
+    title = title.strip(" ,\"'")
+    if not title or title.lower() in _PRONOUNS or title.lower() in ("event",):
+        return None
+    return title[0].upper() + title[1:]
+
+
+def _midnight(day: date) -> datetime:
+    return timezone_service.localize(datetime.combine(day, time()))
+
+
+def _overlapping(spans: List[Tuple[int, int]]) -> bool:
+    spans = sorted(spans)
+    return any(a_end > b_start for (_, a_end), (b_start, _) in zip(spans, spans[1:]))
@@ -0,0 +1,170 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import List, Iterable, Optional
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+
+
+class IntervalIndex:
+    """
+    Static index of events as [start, end) intervals for overlap queries.
+
+    Events are kept in an array sorted by start, viewed as an implicit
+    balanced binary tree (the node at index i on level k has children at
+    i -/+ 2**(k-1)) in which every node also stores the largest end time in
+    its subtree. Overlap queries prune every subtree whose largest end is
+    before the query start, so they visit O(log n + k) nodes for k results,
+    and the results come out in start order. This is the layout of Heng
+    Li's cgranges; it needs no pointers and is built in O(n log n).
+
+    Times are compared as POSIX timestamps. Events without a start are left
+    out, and an event without an end is treated as zero-length, the same as
+    ``EventStore.events_between``. The index is immutable; build a new one
+    when the events change.
+    """
+
+    # Subtrees at or below this level are scanned linearly
+    SCAN_LEVEL = 3
+
+    def __init__(self, events: Iterable[CalendarEvent]):
+        timed = [event for event in events if event.start is not None]
+        timed.sort(key=CalendarEvent.sort_key)
+        self._events = timed
+        self._starts = [event.start.timestamp() for event in timed]
+        self._ends = [
+            max((event.end or event.start).timestamp(), start)
+            for event, start in zip(timed, self._starts)
+        ]
+        self._max_ends = list(self._ends)
+        self._max_level = self._build()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def overlapping(
+        self, start: datetime, end: datetime, limit: Optional[int] = None
+    ) -> List[CalendarEvent]:
+        """
+        Events overlapping [start, end), in start order.
+
+        With ``limit``, stops after that many matches, e.g. ``limit=1`` to
+        only ask whether the period is busy.
+        """
+        return [
+            self._events[i]
+            for i in self._overlap_indices(start.timestamp(), end.timestamp(), limit)
+        ]
+
+    def is_free(self, start: datetime, end: datetime) -> bool:
+        """Whether no event overlaps [start, end)."""
+        return not self._overlap_indices(start.timestamp(), end.timestamp(), 1)
+
+    def containing(self, start: datetime, end: datetime) -> List[CalendarEvent]:
+        """Events that cover the whole of [start, end), in start order."""
+        query_start, query_end = start.timestamp(), end.timestamp()
+        return [
+            self._events[i]
+            for i in self._overlap_indices(query_start, query_end)
+            if self._starts[i] <= query_start and self._ends[i] >= query_end
+        ]
+
+    def within(self, start: datetime, end: datetime) -> List[CalendarEvent]:
+        """Events that lie entirely inside [start, end), in start order."""
+        query_start, query_end = start.timestamp(), end.timestamp()
+        matches = []
+        for i in range(bisect_left(self._starts, query_start), len(self._starts)):
+            if self._starts[i] >= query_end:
+                break
+            if self._ends[i] <= query_end:
+                matches.append(self._events[i])
+        return matches
+
+    def busy_until(self, start: datetime, end: datetime) -> Optional[datetime]:
+        """Latest end of the events overlapping [start, end), or None if free."""
+        indices = self._overlap_indices(start.timestamp(), end.timestamp())
+        if not indices:
+            return None
+        latest = max(indices, key=lambda i: self._ends[i])
+        event = self._events[latest]
+        return event.end or event.start
+
+    def next_free_slot(
+        self,
+        duration: timedelta,
+        after: datetime,
+        before: Optional[datetime] = None,
+    ) -> Optional[datetime]:
+        """
+        Earliest start >= ``after`` of a free period of ``duration``.
+
+        Jumps past each block of overlapping events in turn; returns None if
+        no such period ends by ``before``.
+        """
+        candidate = after
+        while before is None or candidate + duration <= before:
+            busy_until = self.busy_until(candidate, candidate + duration)
+            if busy_until is None:
+                return candidate
+            candidate = busy_until
+        return None
+
+    def _build(self) -> int:
+        """Fill the subtree max-end array; returns the root's level."""
+        n = len(self._starts)
+        if n == 0:
+            return -1
+
+        max_ends = self._max_ends
+        last_i = 0
+        last = 0.0
+        for i in range(0, n, 2):
+            last_i = i
+            last = max_ends[i] = self._ends[i]
+
+        level = 1
+        while 1 << level <= n:
+            half = 1 << (level - 1)
+            for i in range((half << 1) - 1, n, half << 2):
+                left = max_ends[i - half]
+                # A missing right subtree still covers the array's tail
+                right = max_ends[i + half] if i + half < n else last
+                max_ends[i] = max(self._ends[i], left, right)
+            last_i = last_i - half if (last_i >> level) & 1 else last_i + half
+            if last_i < n and max_ends[last_i] > last:
+                last = max_ends[last_i]
+            level += 1
+        return level - 1
+
+    def _overlap_indices(
+        self, start: float, end: float, limit: Optional[int] = None
+    ) -> List[int]:
+        n = len(self._starts)
+        matches: List[int] = []
+        if n == 0 or start >= end:
+            return matches
+
+        # (level, node index, whether its left subtree has been visited)
+        stack = [(self._max_level, (1 << self._max_level) - 1, False)]
+        while stack:
+            level, node, left_done = stack.pop()
+            if level <= self.SCAN_LEVEL:
+                first = node >> level << level
+                for i in range(first, min(first + (1 << (level + 1)) - 1, n)):
+                    if self._starts[i] >= end:
+                        break
+                    if start < self._ends[i]:
+                        matches.append(i)
+                        if limit is not None and len(matches) >= limit:
+                            return matches
+            elif not left_done:
+                stack.append((level, node, True))
+                child = node - (1 << (level - 1))
+                if child >= n or self._max_ends[child] > start:
+                    stack.append((level - 1, child, False))
+            elif node < n and self._starts[node] < end:
+                if start < self._ends[node]:
+                    matches.append(node)
+                    if limit is not None and len(matches) >= limit:
+                        return matches
+                stack.append((level - 1, node + (1 << (level - 1)), False))
+        return matches
@@ -0,0 +1,176 @@
+import hmac
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Any, Optional
+
+
+class NotificationReceiver:
+    """
+    Minimal HTTP endpoint for Google Calendar push notifications.
+
+    Google POSTs an empty-bodied request with ``X-Goog-*`` headers to the
+    channel's address when a watched calendar changes. The receiver checks
+    that the channel is one it registered and that the token matches, then
+    calls ``on_change(calendar_id)`` from its server thread. The initial
+    "sync" message sent when a channel opens is acknowledged and ignored.
+
+    Google only delivers to public HTTPS addresses, so in practice this is
+    run behind a tunnel or reverse proxy that forwards to ``host:port``.
+    """
+
+    CHANGE_STATES = {"exists", "not_exists"}
+
+    def __init__(
+        self,
+        on_change: Callable[[str], None],
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        path: str = "/notifications",
+    ):
+        self.on_change = on_change
+        self.host = host
+        self.port = port
+        self.path = path
+        self._channels: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"received": 0, "changes": 0, "ignored": 0, "rejected": 0}
+
+    @property
+    def url(self) -> str:
+        """Local URL the receiver listens on."""
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    def register(self, channel: Dict[str, Any]):
+        """Accept notifications for a channel returned by ``watch_events``."""
+        with self._lock:
+            self._channels[channel["id"]] = channel
+
+    def unregister(self, channel_id: str):
+        """Stop accepting notifications for a channel."""
+        with self._lock:
+            self._channels.pop(channel_id, None)
+
+    def start(self):
+        """Start serving on a background thread."""
+        if self._server is not None:
+            return
+
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split("?", 1)[0] != receiver.path:
+                    status = 404
+                else:
+                    status = receiver.handle_notification(self.headers)
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                # Keep request logs out of the terminal UI
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        # Port 0 picks a free port; report the real one
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="push-receiver", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+    def handle_notification(self, headers) -> int:
+        """
+        Process one notification's headers and return the HTTP status.
+
+        Unknown channels get 404 and token mismatches 403; everything else
+        is acknowledged with 200 so Google does not retry it.
+        """
+        channel_id = headers.get("X-Goog-Channel-ID", "")
+        state = headers.get("X-Goog-Resource-State", "")
+        self._count("received")
+
+        with self._lock:
+            channel = self._channels.get(channel_id)
+        if channel is None:
+            self._count("rejected")
+            return 404
+
+        expected_token = channel.get("token") or ""
+        received_token = headers.get("X-Goog-Channel-Token", "")
+        if not hmac.compare_digest(expected_token, received_token):
+            self._count("rejected")
+            return 403
+
+        if state not in self.CHANGE_STATES:
+            self._count("ignored")
+            return 200
+
+        self._count("changes")
+        try:
+            self.on_change(channel["calendar_id"])
+        except Exception as e:
+            print(f"Error handling calendar change notification: {e}")
+        return 200
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for received, change, ignored and rejected notifications."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+
+class FakeNotifier:
+    """
+    Sends Google-style push notifications to a local receiver.
+
+    Lets tests and local development drive the notification path without a
+    public address or a real Google channel.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self._message_numbers: Dict[str, int] = {}
+
+    def notify(self, channel: Dict[str, Any], state: str = "exists") -> int:
+        """POST a notification for ``channel`` and return the HTTP status."""
+        message_number = self._message_numbers.get(channel["id"], 0) + 1
+        self._message_numbers[channel["id"]] = message_number
+
+        headers = {
+            "X-Goog-Channel-ID": channel["id"],
+            "X-Goog-Resource-ID": channel.get("resource_id", ""),
+            "X-Goog-Resource-State": state,
+            "X-Goog-Message-Number": str(message_number),
+        }
+        if channel.get("token"):
+            headers["X-Goog-Channel-Token"] = channel["token"]
+
+        request = urllib.request.Request(
+            self.url, data=b"", headers=headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def open_channel(self, channel: Dict[str, Any]) -> int:
+        """Send the "sync" message Google sends when a channel is opened."""
+        return self.notify(channel, state="sync")
@@ -0,0 +1,156 @@
+import dataclasses
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Collection, Iterator, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from dateutil.rrule import rrulestr
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.timezone_service import timezone_service
+
+_UNTIL = re.compile(r"UNTIL=(\d{8})(T\d{6})?(Z?)")
+
+
+@dataclass(slots=True)
+class RecurringSeries:
+    """
+    A recurring event's master, expanded into instances locally.
+
+    Listing with ``singleEvents=False`` returns one master per series (with
+    its RRULE/EXDATE/RDATE lines) instead of every instance, plus the
+    instances that were moved, edited or cancelled. ``expand`` generates
+    only the instances in the requested window, lazily, with the IDs Google
+    gives them, so an instance can be edited or deleted like a single event.
+
+    Timed rules are evaluated in the master's own zone, so a 09:00 standup
+    stays at 09:00 across DST changes; all-day series repeat on local dates.
+    """
+
+    master: CalendarEvent
+    rules: List[str]
+    time_zone: str = ""
+    _rule_set: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_google(
+        cls, google_event: Dict[str, Any], calendar_id: str = "primary"
+    ) -> "RecurringSeries":
+        """Build a series from a master event resource (one with ``recurrence``)."""
+        return cls(
+            master=CalendarEvent.from_google(google_event, calendar_id),
+            rules=list(google_event.get("recurrence", [])),
+            time_zone=google_event.get("start", {}).get("timeZone", ""),
+        )
+
+    @property
+    def id(self) -> str:
+        return self.master.id
+
+    def expand(
+        self,
+        start: datetime,
+        end: datetime,
+        skip: Collection[datetime] = (),
+    ) -> Iterator[CalendarEvent]:
+        """
+        Yield the instances overlapping [start, end), in start order.
+
+        ``skip`` holds the original start times of instances that exist as
+        separate exception events (or were cancelled), which are left out.
+        """
+        master = self.master
+        if master.start is None:
+            return
+
+        duration = (master.end or master.start) - master.start
+        rule_set = self._get_rule_set()
+        if master.all_day:
+            # All-day rules repeat on local dates, so they run on naive times
+            lower = timezone_service.to_local(start - duration).replace(tzinfo=None)
+            upper = timezone_service.to_local(end).replace(tzinfo=None)
+        else:
+            lower = start - duration
+            upper = end
+
+        for occurrence in rule_set.xafter(lower):
+            if occurrence >= upper:
+                return
+            if master.all_day:
+                instance_start = timezone_service.localize(occurrence)
+                instance_end = timezone_service.localize(occurrence + duration)
+            else:
+                instance_start = occurrence
+                instance_end = occurrence + duration
+            if instance_start in skip:
+                continue
+
+            yield dataclasses.replace(
+                master,
+                id=instance_id(master.id, instance_start, master.all_day),
+                start=instance_start,
+                end=instance_end,
+            )
+
+    def _get_rule_set(self):
+        if self._rule_set is None:
+            dtstart = self._dtstart()
+            aware = dtstart.tzinfo is not None
+            lines = [_normalize_until(line, aware) for line in self.rules]
+            self._rule_set = rrulestr(
+                "\n".join(lines), dtstart=dtstart, forceset=True, unfold=True
+            )
+        return self._rule_set
+
+    def _dtstart(self) -> datetime:
+        """The master's start as the rule's DTSTART."""
+        start = self.master.start
+        if self.master.all_day:
+            return timezone_service.to_local(start).replace(tzinfo=None)
+        if self.time_zone:
+            try:
+                return start.astimezone(ZoneInfo(self.time_zone))
+            except (ZoneInfoNotFoundError, ValueError):
+                pass
+        return start
+
+
+def instance_id(master_id: str, original_start: datetime, all_day: bool) -> str:
+    """The ID Google gives an instance of a recurring event."""
+    if all_day:
+        return f"{master_id}_{timezone_service.to_local(original_start):%Y%m%d}"
+    return f"{master_id}_{original_start.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+
+
+def parse_instance_id(event_id: str) -> Optional[Tuple[str, datetime]]:
+    """Split an instance ID into (master ID, original start), if it is one."""
+    master_id, _, stamp = event_id.rpartition("_")
+    if not master_id:
+        return None
+    try:
+        if len(stamp) == 8:
+            return master_id, timezone_service.localize(
+                datetime.strptime(stamp, "%Y%m%d")
+            )
+        return master_id, datetime.strptime(stamp, "%Y%m%dT%H%M%SZ").replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+def _normalize_until(line: str, aware: bool) -> str:
+    """
+    Make an RRULE's UNTIL match DTSTART, as dateutil requires: UTC for
+    timed series, floating for all-day ones.
+    """
+    match = _UNTIL.search(line)
+    if not match:
+        return line
+    day, time_part, _ = match.groups()
+    if aware:
+        until = f"UNTIL={day}{time_part or 'T235959'}Z"
+    else:
+        until = f"UNTIL={day}{time_part or ''}"
+    return line[: match.start()] + until + line[match.end() :]
@@ -0,0 +1,162 @@
+import json
+import os
+import random
+import socket
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from googleapiclient.errors import HttpError
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    ``acquire`` blocks until enough tokens are available.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take ``tokens`` from the bucket, returning how long the caller waited."""
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+class RequestScheduler:
+    """
+    Shared scheduler for Google API requests.
+
+    Every request first takes a token from a bucket sized to the project's
+    quota (``GOOGLE_API_QPS`` requests per second, bursts of
+    ``GOOGLE_API_BURST``). Rate-limit responses (429, or 403 with a
+    rateLimitExceeded reason) are retried with exponential backoff and full
+    jitter; server errors and network failures are retried only for
+    idempotent requests, since a failed insert may still have been applied.
+    """
+
+    RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+    RETRYABLE_SERVER_STATUSES = {500, 502, 503, 504}
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 32.0,
+    ):
+        rate = rate or float(os.getenv("GOOGLE_API_QPS", "5"))
+        burst = burst or float(os.getenv("GOOGLE_API_BURST", "10"))
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "throttled": 0,
+            "rate_limited": 0,
+            "retried": 0,
+            "failed": 0,
+            "not_modified": 0,
+        }
+
+    def execute(self, request, idempotent: bool = True, cost: int = 1) -> Any:
+        """
+        Execute a googleapiclient request (or batch) under the quota.
+
+        Args:
+            request: Object with an ``execute()`` method
+            idempotent: Whether server and network errors may be retried
+            cost: Quota units the request uses (a batch costs one per call)
+        """
+        attempt = 0
+        while True:
+            if self.bucket.acquire(cost) > 0:
+                self._count("throttled")
+            self._count("calls")
+
+            try:
+                return request.execute()
+            except HttpError as e:
+                if e.resp.status == 304:
+                    # Answer to a conditional request, not a failure
+                    self._count("not_modified")
+                    raise
+                rate_limited = self.is_rate_limited(e)
+                if rate_limited:
+                    self._count("rate_limited")
+                retryable = rate_limited or (
+                    idempotent and e.resp.status in self.RETRYABLE_SERVER_STATUSES
+                )
+                if not retryable or attempt >= self.max_retries:
+                    self._count("failed")
+                    raise
+            except (socket.timeout, ConnectionError, TimeoutError):
+                if not idempotent or attempt >= self.max_retries:
+                    self._count("failed")
+                    raise
+
+            self._count("retried")
+            time.sleep(self.backoff_delay(attempt))
+            attempt += 1
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given retry attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    @classmethod
+    def is_rate_limited(cls, error: HttpError) -> bool:
+        """Whether an HttpError is a quota / rate-limit rejection."""
+        status = error.resp.status
+        if status == 429:
+            return True
+        if status != 403:
+            return False
+
+        try:
+            details = json.loads(error.content.decode("utf-8"))
+            reasons = {
+                item.get("reason") for item in details["error"].get("errors", [])
+            }
+        except (ValueError, KeyError, AttributeError, TypeError):
+            return False
+        return bool(reasons & cls.RATE_LIMIT_REASONS)
+
+    def record_retries(self, count: int):
+        """Count retries made outside ``execute``, e.g. resent batch operations."""
+        self._count("retried", count)
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the request counters."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
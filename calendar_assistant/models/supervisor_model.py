@@ -1,11 +1,18 @@
+import os
 from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.tools import tool
 from langchain.agents import AgentExecutor
 from langchain.agents.openai_functions_agent.base import OpenAIFunctionsAgent
-from langchain_core.messages import SystemMessage
+from langchain_core.messages import HumanMessage, SystemMessage
 
+from calendar_assistant.models.agent_cache import AgentCache, normalize_request
 from calendar_assistant.models.google_calendar_model import GoogleCalendarModel
+from calendar_assistant.models.async_google_calendar_model import (
+    AsyncGoogleCalendarModel,
+)
+from calendar_assistant.models.timezone_service import timezone_service
 from calendar_assistant.prompts.agent_prompts import get_prompt
 
 
@@ -14,20 +21,47 @@ class SupervisorModel:
     Handles the initialization and management of the AI agent for Google Calendar operations.
     """
 
+    # Tools that only read the calendar; answers built from them are cacheable
+    READ_ONLY_TOOLS = {
+        "get_google_calendar_today_events",
+        "get_google_calendar_events_for_date_range",
+        "get_google_calendar_month_events",
+        "check_google_calendar_availability",
+        "find_google_calendar_free_slot",
+        "get_google_calendar_busy_stats",
+    }
+    # Tools that change the calendar and invalidate cached answers
+    MUTATING_TOOLS = {
+        "create_google_calendar_event",
+        "force_create_google_calendar_event",
+        "update_google_calendar_event",
+        "delete_google_calendar_event",
+        "import_google_calendar_ics",
+    }
+
     def __init__(
         self,
         google_calendar_model: GoogleCalendarModel,
         model_name: str = "gpt-4.1-nano",
+        async_calendar_model: AsyncGoogleCalendarModel = None,
     ):
         self.google_calendar_model = google_calendar_model
+        # Tools await this wrapper so API calls never block the event loop
+        self.async_calendar_model = async_calendar_model or AsyncGoogleCalendarModel(
+            google_calendar_model
+        )
         self.model_name = model_name
         self.model = None
         self.agent_executor = None
+        self.tools = {}
+        # Answers to repeated read-only questions; CALENDAR_AGENT_CACHE_TTL=0 disables
+        cache_ttl = float(os.getenv("CALENDAR_AGENT_CACHE_TTL", "300"))
+        self.cache = AgentCache(ttl=cache_ttl) if cache_ttl > 0 else None
         self.initialize()
 
     def _get_tools(self):
         """Define and return Google Calendar tool functions."""
-        gcal_model = self.google_calendar_model
+        gcal_model = self.async_calendar_model
 
         @tool
         async def create_google_calendar_event(
@@ -51,7 +85,7 @@ class SupervisorModel:
                 location: Where the event takes place (optional).
                 attendees: Comma-separated email addresses of attendees (optional).
             """
-            if not gcal_model.service:
+            if not await gcal_model.ensure_service():
                 return "Error: Google Calendar service is not available. Please check authentication."
             try:
                 # Prepare event data for GoogleCalendarModel.create_event
@@ -77,66 +111,34 @@ class SupervisorModel:
                 )
 
                 # Ensure timezone-aware datetime objects
-                if start_dt.tzinfo is None:
-                    start_dt = start_dt.replace(
-                        tzinfo=datetime.now().astimezone().tzinfo
-                    )
-                if end_dt.tzinfo is None:
-                    end_dt = end_dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
-
-                # Get events for the day to check conflicts
-                day_start = start_dt.replace(hour=0, minute=0, second=0, microsecond=0)
-                day_end = day_start + timedelta(days=1)
-
-                try:
-                    existing_events = gcal_model.get_events(
-                        start_date=day_start.isoformat(),
-                        end_date=day_end.isoformat(),
-                    )
-                except Exception as e:
-                    # If we can't get events for conflict check, proceed with creation
-                    print(f"Warning: Could not check for conflicts: {e}")
-                    existing_events = []
+                start_dt = timezone_service.localize(start_dt)
+                end_dt = timezone_service.localize(end_dt)
+
+                # Answered from the synced local stores' interval index when
+                # possible (no API call); otherwise one freebusy query, which
+                # also covers multi-day events that started before this one
+                availability = await gcal_model.check_availability(
+                    start_dt, end_dt, await gcal_model.get_selected_calendar_ids()
+                )
+                if not availability:
+                    # If we can't check for conflicts, proceed with creation
+                    print("Warning: Could not check for conflicts")
 
                 conflicts = []
-                for event in existing_events:
-                    try:
-                        event_start_str = event["start_time"]
-                        event_end_str = event["end_time"]
-
-                        # Parse event times and ensure timezone awareness
-                        event_start = datetime.fromisoformat(
-                            event_start_str.replace("Z", "+00:00")
-                        )
-                        event_end = datetime.fromisoformat(
-                            event_end_str.replace("Z", "+00:00")
-                        )
-
-                        if event_start.tzinfo is None:
-                            event_start = event_start.replace(
-                                tzinfo=datetime.now().astimezone().tzinfo
-                            )
-                        if event_end.tzinfo is None:
-                            event_end = event_end.replace(
-                                tzinfo=datetime.now().astimezone().tzinfo
-                            )
-
-                        # Check if there's overlap: event starts before this ends and ends after this starts
-                        if event_start < end_dt and event_end > start_dt:
-                            event_title = event.get("title", "Untitled")
-                            event_location = event.get("location", "")
-                            loc_info = f" at {event_location}" if event_location else ""
-                            conflicts.append(
-                                f"• {event_title} ({event_start.strftime('%H:%M')} - {event_end.strftime('%H:%M')}){loc_info}"
-                            )
-                    except (ValueError, KeyError, TypeError):
-                        continue  # Skip events with invalid times
+                for busy in availability.get("busy", []):
+                    busy_start = busy["start"].astimezone(start_dt.tzinfo)
+                    busy_end = busy["end"].astimezone(start_dt.tzinfo)
+                    if busy_start.date() == busy_end.date():
+                        busy_range = f"{busy_start.strftime('%H:%M')} - {busy_end.strftime('%H:%M')}"
+                    else:
+                        busy_range = f"{busy_start.strftime('%Y-%m-%d %H:%M')} - {busy_end.strftime('%Y-%m-%d %H:%M')}"
+                    conflicts.append(f"• Busy ({busy_range})")
 
                 # If conflicts detected, return warning with options
                 if conflicts:
                     conflict_list = "\n".join(conflicts)
                     return f"""⚠️ TIME CONFLICT DETECTED ⚠️
-You already have {len(conflicts)} event(s) during the requested time:
+You are already busy during {len(conflicts)} period(s) of the requested time:
 {conflict_list}
 
 Options:
@@ -147,22 +149,16 @@ Options:
 Please specify your choice or provide a new time."""
 
                 # No conflicts, proceed with creation
-                created_event = gcal_model.create_event(event_data=event_data)
+                created_event = await gcal_model.create_event(event_data=event_data)
 
-                if created_event and created_event.get("id"):
+                if created_event:
                     # Format confirmation message
-                    start_dt_confirm = datetime.fromisoformat(
-                        created_event["start_time"].replace("Z", "+00:00")
-                    )
-                    end_dt_confirm = datetime.fromisoformat(
-                        created_event["end_time"].replace("Z", "+00:00")
-                    )
+                    start_dt_confirm = created_event.start
+                    end_dt_confirm = created_event.end
                     loc_confirm = (
-                        f" at {created_event['location']}"
-                        if created_event.get("location")
-                        else ""
+                        f" at {created_event.location}" if created_event.location else ""
                     )
-                    return f"✅ Successfully created Google Calendar event: '{created_event['title']}' from {start_dt_confirm.strftime('%Y-%m-%d %H:%M %Z')} to {end_dt_confirm.strftime('%H:%M %Z')}{loc_confirm}."
+                    return f"✅ Successfully created Google Calendar event: '{created_event.title}' from {start_dt_confirm.strftime('%Y-%m-%d %H:%M %Z')} to {end_dt_confirm.strftime('%H:%M %Z')}{loc_confirm}."
                 else:
                     return "Error: Failed to create Google Calendar event. No event data returned."
 
@@ -192,7 +188,7 @@ Please specify your choice or provide a new time."""
                 location: Where the event takes place (optional).
                 attendees: Comma-separated email addresses of attendees (optional).
             """
-            if not gcal_model.service:
+            if not await gcal_model.ensure_service():
                 return "Error: Google Calendar service is not available. Please check authentication."
             try:
                 # Prepare event data for GoogleCalendarModel.create_event
@@ -210,22 +206,16 @@ Please specify your choice or provide a new time."""
                     event_data["end_time"] = (start_dt + timedelta(hours=1)).isoformat()
 
                 # FORCE CREATE: Skip conflict detection, create directly
-                created_event = gcal_model.create_event(event_data=event_data)
+                created_event = await gcal_model.create_event(event_data=event_data)
 
-                if created_event and created_event.get("id"):
+                if created_event:
                     # Format confirmation message
-                    start_dt_confirm = datetime.fromisoformat(
-                        created_event["start_time"].replace("Z", "+00:00")
-                    )
-                    end_dt_confirm = datetime.fromisoformat(
-                        created_event["end_time"].replace("Z", "+00:00")
-                    )
+                    start_dt_confirm = created_event.start
+                    end_dt_confirm = created_event.end
                     loc_confirm = (
-                        f" at {created_event['location']}"
-                        if created_event.get("location")
-                        else ""
+                        f" at {created_event.location}" if created_event.location else ""
                     )
-                    return f"✅ FORCE CREATED Google Calendar event: '{created_event['title']}' from {start_dt_confirm.strftime('%Y-%m-%d %H:%M %Z')} to {end_dt_confirm.strftime('%H:%M %Z')}{loc_confirm}. (Overlapping events allowed)"
+                    return f"✅ FORCE CREATED Google Calendar event: '{created_event.title}' from {start_dt_confirm.strftime('%Y-%m-%d %H:%M %Z')} to {end_dt_confirm.strftime('%H:%M %Z')}{loc_confirm}. (Overlapping events allowed)"
                 else:
                     return "Error: Failed to create Google Calendar event. No event data returned."
 
@@ -237,42 +227,44 @@ Please specify your choice or provide a new time."""
         @tool
         async def get_google_calendar_today_events() -> str:
             """Get all events scheduled for today from Google Calendar with their IDs for updates."""
-            if not gcal_model.service:
+            if not await gcal_model.ensure_service():
                 return "Error: Google Calendar service is not available."
             try:
-                today = datetime.now().date()
-                start_date_dt = datetime.combine(today, datetime.min.time())
-                end_date_dt = datetime.combine(
-                    today + timedelta(days=1), datetime.min.time()
+                today = timezone_service.now().date()
+                start_date_dt = timezone_service.localize(
+                    datetime.combine(today, datetime.min.time())
+                )
+                end_date_dt = timezone_service.localize(
+                    datetime.combine(today + timedelta(days=1), datetime.min.time())
                 )
 
-                events = gcal_model.get_events(
-                    start_date=start_date_dt.isoformat() + "Z",
-                    end_date=end_date_dt.isoformat() + "Z",
+                events = gcal_model.iter_events_multi(
+                    start_date=start_date_dt.isoformat(),
+                    end_date=end_date_dt.isoformat(),
+                    max_results=None,
+                    detail="summary",
                 )
-                if not events:
-                    return "No events scheduled for today in Google Calendar."
 
                 result = "Today's Google Calendar events (with IDs for updates):\n"
-                for event in events:
-                    title = event.get("title", "Untitled Google Event")
-                    start_str = event.get("start_time", "")
-                    loc = event.get("location", "")
-                    event_id = event.get("google_id") or event.get("id", "")
-
-                    try:
-                        start_dt = datetime.fromisoformat(
-                            start_str.replace("Z", "+00:00")
-                        )
-                        formatted_time = start_dt.strftime("%H:%M %Z")
-                    except ValueError:
-                        formatted_time = start_str
+                found = False
+                async for event in events:
+                    found = True
+                    title = event.title or "Untitled Google Event"
+                    loc = event.location
+                    event_id = event.id
+                    calendar_id = event.calendar_id
+                    formatted_time = (
+                        event.start.strftime("%H:%M %Z") if event.start else "unknown time"
+                    )
 
                     loc_info = f" at {loc}" if loc else ""
                     result += (
-                        f"- {title} at {formatted_time}{loc_info} [ID: {event_id}]\n"
+                        f"- {title} at {formatted_time}{loc_info} [ID: {event_id}, Calendar: {calendar_id}]\n"
                     )
 
+                if not found:
+                    return "No events scheduled for today in Google Calendar."
+
                 return result.strip()
             except Exception as e:
                 return f"Error retrieving today's Google Calendar events: {str(e)}"
@@ -288,40 +280,43 @@ Please specify your choice or provide a new time."""
                 start_date: The start date in ISO format YYYY-MM-DD (e.g., "2024-06-01"). Time is assumed as start of day.
                 end_date: The end date in ISO format YYYY-MM-DD (e.g., "2024-06-07"). Time is assumed as end of day.
             """
-            if not gcal_model.service:
+            if not await gcal_model.ensure_service():
                 return "Error: Google Calendar service is not available."
             try:
                 # Convert YYYY-MM-DD to YYYY-MM-DDTHH:MM:SSZ for full day coverage
-                start_dt_iso = (
-                    datetime.fromisoformat(start_date + "T00:00:00").isoformat() + "Z"
-                )
-                end_dt_iso = (
-                    datetime.fromisoformat(end_date + "T23:59:59").isoformat() + "Z"
-                )
-
-                events = gcal_model.get_events(
-                    start_date=start_dt_iso, end_date=end_dt_iso
+                start_dt_iso = timezone_service.localize(
+                    datetime.fromisoformat(start_date + "T00:00:00")
+                ).isoformat()
+                end_dt_iso = timezone_service.localize(
+                    datetime.fromisoformat(end_date + "T23:59:59")
+                ).isoformat()
+
+                events = gcal_model.iter_events_multi(
+                    start_date=start_dt_iso,
+                    end_date=end_dt_iso,
+                    max_results=None,
+                    detail="summary",
                 )
-                if not events:
-                    return f"No events found in Google Calendar between {start_date} and {end_date}."
 
                 result = f"Google Calendar events between {start_date} and {end_date} (with IDs for updates):\n"
-                for event in events:
-                    title = event.get("title", "Untitled Google Event")
-                    start_str = event.get("start_time", "")
-                    loc = event.get("location", "")
-                    event_id = event.get("google_id") or event.get("id", "")
-                    try:
-                        start_dt = datetime.fromisoformat(
-                            start_str.replace("Z", "+00:00")
-                        )
-                        formatted_time = start_dt.strftime("%Y-%m-%d %H:%M %Z")
-                    except ValueError:
-                        formatted_time = start_str
+                found = False
+                async for event in events:
+                    found = True
+                    title = event.title or "Untitled Google Event"
+                    loc = event.location
+                    event_id = event.id
+                    calendar_id = event.calendar_id
+                    formatted_time = (
+                        event.start.strftime("%Y-%m-%d %H:%M %Z") if event.start else "unknown time"
+                    )
                     loc_info = f" at {loc}" if loc else ""
                     result += (
-                        f"- {title} on {formatted_time}{loc_info} [ID: {event_id}]\n"
+                        f"- {title} on {formatted_time}{loc_info} [ID: {event_id}, Calendar: {calendar_id}]\n"
                     )
+
+                if not found:
+                    return f"No events found in Google Calendar between {start_date} and {end_date}."
+
                 return result.strip()
             except ValueError:
                 return "Error: Invalid date format. Please use YYYY-MM-DD."
@@ -341,12 +336,12 @@ Please specify your choice or provide a new time."""
                 year: The year (e.g., 2025). Defaults to current year if 0.
                 month: The month (1-12). Defaults to current month if 0.
             """
-            if not gcal_model.service:
+            if not await gcal_model.ensure_service():
                 return "Error: Google Calendar service is not available."
 
             try:
                 # Use current date if year/month not provided
-                now = datetime.now()
+                now = timezone_service.now()
                 target_year = year if year > 0 else now.year
                 target_month = month if month > 0 else now.month
 
@@ -359,52 +354,286 @@ Please specify your choice or provide a new time."""
                 end_date = f"{target_year}-{target_month:02d}-{last_day}"
 
                 # Convert to ISO format
-                start_dt_iso = (
-                    datetime.fromisoformat(start_date + "T00:00:00").isoformat() + "Z"
+                start_dt_iso = timezone_service.localize(
+                    datetime.fromisoformat(start_date + "T00:00:00")
+                ).isoformat()
+                end_dt_iso = timezone_service.localize(
+                    datetime.fromisoformat(end_date + "T23:59:59")
+                ).isoformat()
+
+                # Stream every page so busy months are not truncated
+                events = gcal_model.iter_events_multi(
+                    start_date=start_dt_iso,
+                    end_date=end_dt_iso,
+                    max_results=None,
+                    detail="summary",
                 )
-                end_dt_iso = (
-                    datetime.fromisoformat(end_date + "T23:59:59").isoformat() + "Z"
-                )
-
-                events = gcal_model.get_events(
-                    start_date=start_dt_iso, end_date=end_dt_iso, max_results=1000
-                )
-
-                if not events:
-                    month_name = datetime(target_year, target_month, 1).strftime(
-                        "%B %Y"
-                    )
-                    return f"No events found in Google Calendar for {month_name}."
 
                 month_name = datetime(target_year, target_month, 1).strftime("%B %Y")
                 result = (
                     f"Google Calendar events for {month_name} (with IDs for updates):\n"
                 )
 
-                for event in events:
-                    title = event.get("title", "Untitled Google Event")
-                    start_str = event.get("start_time", "")
-                    loc = event.get("location", "")
-                    event_id = event.get("google_id") or event.get("id", "")
-
-                    try:
-                        start_dt = datetime.fromisoformat(
-                            start_str.replace("Z", "+00:00")
-                        )
-                        formatted_time = start_dt.strftime("%B %d at %H:%M %Z")
-                    except ValueError:
-                        formatted_time = start_str
+                found = False
+                async for event in events:
+                    found = True
+                    title = event.title or "Untitled Google Event"
+                    loc = event.location
+                    event_id = event.id
+                    calendar_id = event.calendar_id
+                    formatted_time = (
+                        event.start.strftime("%B %d at %H:%M %Z") if event.start else "unknown time"
+                    )
 
                     loc_info = f" at {loc}" if loc else ""
                     result += (
-                        f"- {title} on {formatted_time}{loc_info} [ID: {event_id}]\n"
+                        f"- {title} on {formatted_time}{loc_info} [ID: {event_id}, Calendar: {calendar_id}]\n"
                     )
 
+                if not found:
+                    return f"No events found in Google Calendar for {month_name}."
+
                 return result.strip()
 
             except Exception as e:
                 return f"Error retrieving monthly Google Calendar events: {str(e)}"
 
+        @tool
+        async def check_google_calendar_availability(
+            start_time: str, end_time: str
+        ) -> str:
+            """
+            Check whether the user is free during a time period, without listing events.
+
+            Args:
+                start_time: The start time in ISO format YYYY-MM-DDTHH:MM:SS (required).
+                end_time: The end time in ISO format YYYY-MM-DDTHH:MM:SS (required).
+            """
+            if not await gcal_model.ensure_service():
+                return "Error: Google Calendar service is not available."
+
+            try:
+                start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+                start_dt = timezone_service.localize(start_dt)
+                end_dt = timezone_service.localize(end_dt)
+
+                availability = await gcal_model.check_availability(
+                    start_dt, end_dt, await gcal_model.get_selected_calendar_ids()
+                )
+                if not availability:
+                    return "Error: Could not check availability in Google Calendar."
+
+                period = f"{start_dt.strftime('%Y-%m-%d %H:%M')} - {end_dt.strftime('%Y-%m-%d %H:%M')}"
+                if availability["available"]:
+                    return f"✅ You are free during {period}."
+
+                result = f"You are busy during parts of {period}:\n"
+                for busy in availability["busy"]:
+                    busy_start = busy["start"].astimezone(start_dt.tzinfo)
+                    busy_end = busy["end"].astimezone(start_dt.tzinfo)
+                    result += f"- Busy {busy_start.strftime('%Y-%m-%d %H:%M')} - {busy_end.strftime('%Y-%m-%d %H:%M')}\n"
+                return result.strip()
+
+            except ValueError:
+                return "Error: Invalid date/time format. Please use ISO YYYY-MM-DDTHH:MM:SS."
+            except Exception as e:
+                return f"Error checking Google Calendar availability: {str(e)}"
+
+        @tool
+        async def find_google_calendar_free_slot(
+            duration_minutes: int, earliest_start: str = "", latest_end: str = ""
+        ) -> str:
+            """
+            Find the earliest free time of a given length, e.g. to suggest a new time after a conflict.
+
+            Args:
+                duration_minutes: Length of the free period needed, in minutes (required).
+                earliest_start: Do not start before this time, ISO format YYYY-MM-DDTHH:MM:SS (optional).
+                                Defaults to now.
+                latest_end: The period must end by this time, ISO format YYYY-MM-DDTHH:MM:SS (optional).
+                            Defaults to 14 days after earliest_start.
+            """
+            if not await gcal_model.ensure_service():
+                return "Error: Google Calendar service is not available."
+
+            try:
+                after = (
+                    timezone_service.localize(
+                        datetime.fromisoformat(earliest_start.replace("Z", "+00:00"))
+                    )
+                    if earliest_start
+                    else timezone_service.now()
+                )
+                before = (
+                    timezone_service.localize(
+                        datetime.fromisoformat(latest_end.replace("Z", "+00:00"))
+                    )
+                    if latest_end
+                    else None
+                )
+                duration = timedelta(minutes=duration_minutes)
+
+                slot = await gcal_model.find_free_slot(
+                    duration, after, before, await gcal_model.get_selected_calendar_ids()
+                )
+                if slot is None:
+                    return f"No free period of {duration_minutes} minutes found in that time range."
+
+                slot = timezone_service.to_local(slot)
+                slot_end = slot + duration
+                return f"✅ First free slot: {slot.strftime('%Y-%m-%d %H:%M')} - {slot_end.strftime('%H:%M %Z')}."
+
+            except ValueError:
+                return "Error: Invalid date/time format. Please use ISO YYYY-MM-DDTHH:MM:SS."
+            except Exception as e:
+                return f"Error finding a free slot in Google Calendar: {str(e)}"
+
+        @tool
+        async def get_google_calendar_busy_stats(
+            start_date: str = "", end_date: str = ""
+        ) -> str:
+            """
+            Summarize how busy the user is over a period: event count, busy hours, busiest day and time.
+
+            Args:
+                start_date: Start of the period, ISO format YYYY-MM-DD (optional). Defaults to today.
+                end_date: End of the period (inclusive), ISO format YYYY-MM-DD (optional).
+                          Defaults to 6 days after start_date.
+            """
+            if not await gcal_model.ensure_service():
+                return "Error: Google Calendar service is not available."
+
+            try:
+                first_day = (
+                    datetime.fromisoformat(start_date).date()
+                    if start_date
+                    else timezone_service.now().date()
+                )
+                last_day = (
+                    datetime.fromisoformat(end_date).date()
+                    if end_date
+                    else first_day + timedelta(days=6)
+                )
+                start_dt = timezone_service.localize(
+                    datetime.combine(first_day, datetime.min.time())
+                )
+                end_dt = timezone_service.localize(
+                    datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+                )
+
+                stats = await gcal_model.get_busy_stats(
+                    start_dt, end_dt, await gcal_model.get_selected_calendar_ids()
+                )
+
+                period = f"{first_day.isoformat()} to {last_day.isoformat()}"
+                if not stats["events"]:
+                    return f"No events found in Google Calendar from {period}."
+
+                days = (last_day - first_day).days + 1
+                result = (
+                    f"Busy summary for {period}:\n"
+                    f"- {stats['events']} events, {stats['busy_hours']:.1f} busy hours "
+                    f"({stats['busy_hours'] / days:.1f} per day on average)\n"
+                )
+                if stats["busiest_day"]:
+                    busiest_date, count = stats["busiest_day"]
+                    result += f"- Busiest day: {busiest_date.strftime('%A %B %d')} with {count} events\n"
+                if stats["peak_hour"]:
+                    weekday, hour = stats["peak_hour"]
+                    weekday_name = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][weekday]
+                    result += f"- Busiest time: {weekday_name}s {hour:02d}:00-{(hour + 1) % 24:02d}:00\n"
+                if len(stats["calendar_hours"]) > 1:
+                    for calendar_id, hours in stats["calendar_hours"].items():
+                        result += f"- {calendar_id}: {hours:.1f} hours booked\n"
+                return result.strip()
+
+            except ValueError:
+                return "Error: Invalid date format. Please use ISO YYYY-MM-DD."
+            except Exception as e:
+                return f"Error summarizing Google Calendar busy time: {str(e)}"
+
+        @tool
+        async def import_google_calendar_ics(file_path: str) -> str:
+            """
+            Import every event from an iCalendar (.ics) file into the primary Google Calendar in one step.
+
+            Args:
+                file_path: Path to the .ics file (required).
+            """
+            if not await gcal_model.ensure_service():
+                return "Error: Google Calendar service is not available."
+
+            try:
+                result = await gcal_model.import_ics(os.path.expanduser(file_path))
+                message = (
+                    f"✅ Imported {result['imported']} events from {file_path} "
+                    f"({result['events_per_sec']:.0f} events/sec)."
+                )
+                if result["duplicates"]:
+                    message += f" Skipped {result['duplicates']} already imported."
+                if result["failed"]:
+                    message += f" ⚠️ {result['failed']} failed:\n- " + "\n- ".join(
+                        result["errors"]
+                    )
+                return message
+
+            except OSError as e:
+                return f"Error: Could not read {file_path}: {str(e)}"
+            except Exception as e:
+                return f"Error importing events into Google Calendar: {str(e)}"
+
+        @tool
+        async def export_google_calendar_ics(
+            file_path: str, start_date: str = "", end_date: str = ""
+        ) -> str:
+            """
+            Export the primary Google Calendar's events in a date range to an iCalendar (.ics) file.
+
+            Args:
+                file_path: Path of the .ics file to write (required).
+                start_date: Start date in ISO format YYYY-MM-DD (optional). Defaults to today.
+                end_date: End date (inclusive) in ISO format YYYY-MM-DD (optional).
+                          Defaults to 30 days after start_date.
+            """
+            if not await gcal_model.ensure_service():
+                return "Error: Google Calendar service is not available."
+
+            try:
+                first_day = (
+                    datetime.fromisoformat(start_date).date()
+                    if start_date
+                    else timezone_service.now().date()
+                )
+                last_day = (
+                    datetime.fromisoformat(end_date).date()
+                    if end_date
+                    else first_day + timedelta(days=30)
+                )
+                start_dt = timezone_service.localize(
+                    datetime.combine(first_day, datetime.min.time())
+                )
+                end_dt = timezone_service.localize(
+                    datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+                )
+
+                result = await gcal_model.export_ics(
+                    os.path.expanduser(file_path),
+                    start_date=start_dt.isoformat(),
+                    end_date=end_dt.isoformat(),
+                )
+                return (
+                    f"✅ Exported {result['exported']} events from {first_day} to "
+                    f"{last_day} to {file_path} ({result['events_per_sec']:.0f} events/sec)."
+                )
+
+            except ValueError:
+                return "Error: Invalid date format. Please use ISO YYYY-MM-DD."
+            except OSError as e:
+                return f"Error: Could not write {file_path}: {str(e)}"
+            except Exception as e:
+                return f"Error exporting Google Calendar events: {str(e)}"
+
         @tool
         async def update_google_calendar_event(
             event_id: str,
@@ -414,12 +643,14 @@ Please specify your choice or provide a new time."""
             description: str = "",
             location: str = "",
             attendees: str = "",
+            calendar_id: str = "primary",
         ) -> str:
             """
             Update an existing event in Google Calendar.
 
             Args:
                 event_id: The Google Calendar event ID (required).
+                calendar_id: The calendar ID listed next to the event ID (optional, defaults to primary).
                 title: New title for the event (optional, keep current if empty).
                 start_time: New start time in ISO format YYYY-MM-DDTHH:MM:SS (optional).
                 end_time: New end time in ISO format YYYY-MM-DDTHH:MM:SS (optional).
@@ -430,121 +661,85 @@ Please specify your choice or provide a new time."""
             Note: To get event IDs, first retrieve events using get_google_calendar_today_events
             or get_google_calendar_events_for_date_range, which include the Google ID.
             """
-            if not gcal_model.service:
+            if not await gcal_model.ensure_service():
                 return "Error: Google Calendar service is not available."
 
             if not event_id.strip():
                 return "Error: Event ID is required to update an event."
 
             try:
-                # First, get the current event to preserve existing data
-                current_events = gcal_model.get_events(
-                    max_results=1000
-                )  # Get more events to find the one we want
-                current_event = None
-
-                for event in current_events:
-                    if (
-                        event.get("google_id") == event_id
-                        or event.get("id") == event_id
-                    ):
-                        current_event = event
-                        break
-
-                if not current_event:
-                    return (
-                        f"Error: Event with ID '{event_id}' not found in your calendar."
+                # Only the provided fields are sent (PATCH), so there is no
+                # read-before-write and other fields keep their server values
+                changes = {}
+                if title.strip():
+                    changes["title"] = title
+                if description.strip():
+                    changes["description"] = description
+                if location.strip():
+                    changes["location"] = location
+                if attendees.strip():
+                    changes["attendees"] = attendees
+                if start_time.strip():
+                    changes["start_time"] = start_time
+                if end_time.strip():
+                    changes["end_time"] = end_time
+                elif start_time.strip():
+                    # Moving the start keeps the current duration, taken from a
+                    # recently listed copy when there is one
+                    current_event = gcal_model.get_cached_event(
+                        event_id, calendar_id
+                    ) or await gcal_model.get_event(
+                        event_id, calendar_id, detail="summary"
                     )
+                    if not current_event:
+                        return f"Error: Event with ID '{event_id}' not found in your calendar."
 
-                # Prepare update data, keeping existing values if new ones aren't provided
-                update_data = {
-                    "title": title if title.strip() else current_event.get("title", ""),
-                    "description": description
-                    if description.strip()
-                    else current_event.get("description", ""),
-                    "location": location
-                    if location.strip()
-                    else current_event.get("location", ""),
-                    "attendees": attendees
-                    if attendees.strip()
-                    else current_event.get("attendees", ""),
-                }
-
-                # Handle start_time
-                if start_time.strip():
-                    update_data["start_time"] = start_time
-                else:
-                    update_data["start_time"] = current_event.get("start_time", "")
+                    new_start = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                    if current_event.start and current_event.end:
+                        duration = current_event.end - current_event.start
+                    else:
+                        # Without a known duration, default to 1 hour
+                        duration = timedelta(hours=1)
+                    changes["end_time"] = (new_start + duration).isoformat()
 
-                # Handle end_time - if start_time changed but end_time not provided, maintain duration
-                if end_time.strip():
-                    update_data["end_time"] = end_time
-                elif start_time.strip() and not end_time.strip():
-                    # Calculate duration from current event and apply to new start time
-                    try:
-                        current_start = datetime.fromisoformat(
-                            current_event.get("start_time", "").replace("Z", "+00:00")
-                        )
-                        current_end = datetime.fromisoformat(
-                            current_event.get("end_time", "").replace("Z", "+00:00")
-                        )
-                        duration = current_end - current_start
-
-                        new_start = datetime.fromisoformat(
-                            start_time.replace("Z", "+00:00")
-                        )
-                        new_end = new_start + duration
-                        update_data["end_time"] = new_end.isoformat()
-                    except ValueError:
-                        # If duration calculation fails, default to 1 hour
-                        new_start = datetime.fromisoformat(
-                            start_time.replace("Z", "+00:00")
-                        )
-                        update_data["end_time"] = (
-                            new_start + timedelta(hours=1)
-                        ).isoformat()
-                else:
-                    update_data["end_time"] = current_event.get("end_time", "")
+                if not changes:
+                    return "Error: No changes provided. Specify at least one field to update."
 
                 # Perform the update
-                updated_event = gcal_model.update_event(event_id, update_data)
+                updated_event = await gcal_model.patch_event(
+                    event_id, changes, calendar_id
+                )
 
-                if updated_event and updated_event.get("id"):
+                if updated_event:
                     # Format confirmation message
-                    changes = []
-                    if title.strip() and title != current_event.get("title", ""):
-                        changes.append(f"title to '{title}'")
+                    changed = []
+                    if title.strip():
+                        changed.append(f"title to '{title}'")
                     if start_time.strip():
-                        try:
-                            start_dt = datetime.fromisoformat(
-                                updated_event["start_time"].replace("Z", "+00:00")
+                        if updated_event.start:
+                            changed.append(
+                                f"start time to {updated_event.start.strftime('%Y-%m-%d %H:%M %Z')}"
                             )
-                            changes.append(
-                                f"start time to {start_dt.strftime('%Y-%m-%d %H:%M %Z')}"
-                            )
-                        except ValueError:
-                            changes.append(f"start time to {start_time}")
+                        else:
+                            changed.append(f"start time to {start_time}")
                     if end_time.strip():
-                        try:
-                            end_dt = datetime.fromisoformat(
-                                updated_event["end_time"].replace("Z", "+00:00")
+                        if updated_event.end:
+                            changed.append(
+                                f"end time to {updated_event.end.strftime('%H:%M %Z')}"
                             )
-                            changes.append(f"end time to {end_dt.strftime('%H:%M %Z')}")
-                        except ValueError:
-                            changes.append(f"end time to {end_time}")
-                    if location.strip() and location != current_event.get(
-                        "location", ""
-                    ):
-                        changes.append(f"location to '{location}'")
-                    if description.strip() and description != current_event.get(
-                        "description", ""
-                    ):
-                        changes.append(f"description")
-
-                    changes_text = ", ".join(changes) if changes else "event details"
-                    return f"Successfully updated Google Calendar event '{updated_event['title']}'. Changed: {changes_text}."
+                        else:
+                            changed.append(f"end time to {end_time}")
+                    if location.strip():
+                        changed.append(f"location to '{location}'")
+                    if description.strip():
+                        changed.append(f"description")
+                    if attendees.strip():
+                        changed.append(f"attendees")
+
+                    changes_text = ", ".join(changed)
+                    return f"Successfully updated Google Calendar event '{updated_event.title}'. Changed: {changes_text}."
                 else:
-                    return "Error: Failed to update Google Calendar event. No updated event data returned."
+                    return f"Error: Failed to update Google Calendar event. Event with ID '{event_id}' was not found or could not be updated."
 
             except ValueError as e:
                 return f"Error updating event due to invalid date/time format: {str(e)}. Please use ISO YYYY-MM-DDTHH:MM:SS."
@@ -552,70 +747,45 @@ Please specify your choice or provide a new time."""
                 return f"Unexpected error updating Google Calendar event: {str(e)}"
 
         @tool
-        async def delete_google_calendar_event(event_id: str) -> str:
+        async def delete_google_calendar_event(
+            event_id: str, calendar_id: str = "primary"
+        ) -> str:
             """
             Delete an event from Google Calendar.
 
             Args:
                 event_id: The Google Calendar event ID (required).
+                calendar_id: The calendar ID listed next to the event ID (optional, defaults to primary).
 
             Note: To get event IDs, first retrieve events using get_google_calendar_today_events
             or get_google_calendar_events_for_date_range, which include the Google ID.
             This action cannot be undone.
             """
-            if not gcal_model.service:
+            if not await gcal_model.ensure_service():
                 return "Error: Google Calendar service is not available."
 
             if not event_id.strip():
                 return "Error: Event ID is required to delete an event."
 
             try:
-                # Get a broader range of events to find the target event
-                # Use a date range from 30 days ago to 30 days in the future
-                from_date = (datetime.now() - timedelta(days=30)).date()
-                to_date = (datetime.now() + timedelta(days=30)).date()
-
-                start_dt_iso = (
-                    datetime.combine(from_date, datetime.min.time()).isoformat() + "Z"
-                )
-                end_dt_iso = (
-                    datetime.combine(to_date, datetime.max.time()).isoformat() + "Z"
-                )
-
-                current_events = gcal_model.get_events(
-                    start_date=start_dt_iso, end_date=end_dt_iso, max_results=1000
-                )
-                event_to_delete = None
-
-                for event in current_events:
-                    if (
-                        event.get("google_id") == event_id
-                        or event.get("id") == event_id
-                    ):
-                        event_to_delete = event
-                        break
+                # Look up the event for the confirmation message
+                event_to_delete = gcal_model.get_cached_event(
+                    event_id, calendar_id
+                ) or await gcal_model.get_event(event_id, calendar_id, detail="summary")
 
                 if not event_to_delete:
-                    # Try to delete anyway in case it's an ID mismatch issue
-                    direct_delete_success = gcal_model.delete_event(event_id)
-                    if direct_delete_success:
-                        return f"Successfully deleted Google Calendar event with ID '{event_id}'. (Event details not available for confirmation)"
-                    else:
-                        return f"Error: Event with ID '{event_id}' not found in your calendar or could not be deleted."
+                    return f"Error: Event with ID '{event_id}' not found in your calendar or could not be deleted."
 
                 # Delete the event
-                success = gcal_model.delete_event(event_id)
+                success = await gcal_model.delete_event(event_id, calendar_id)
 
                 if success:
-                    title = event_to_delete.get("title", "Unknown Event")
-                    start_time = event_to_delete.get("start_time", "")
-                    try:
-                        start_dt = datetime.fromisoformat(
-                            start_time.replace("Z", "+00:00")
-                        )
-                        formatted_time = start_dt.strftime("%Y-%m-%d %H:%M %Z")
-                    except ValueError:
-                        formatted_time = start_time
+                    title = event_to_delete.title or "Unknown Event"
+                    formatted_time = (
+                        event_to_delete.start.strftime("%Y-%m-%d %H:%M %Z")
+                        if event_to_delete.start
+                        else "an unknown time"
+                    )
 
                     return f"Successfully deleted Google Calendar event '{title}' scheduled for {formatted_time}."
                 else:
@@ -630,6 +800,11 @@ Please specify your choice or provide a new time."""
             get_google_calendar_today_events,
             get_google_calendar_events_for_date_range,
             get_google_calendar_month_events,
+            check_google_calendar_availability,
+            find_google_calendar_free_slot,
+            get_google_calendar_busy_stats,
+            import_google_calendar_ics,
+            export_google_calendar_ics,
             update_google_calendar_event,
             delete_google_calendar_event,
         ]
@@ -648,6 +823,7 @@ Please specify your choice or provide a new time."""
             return
 
         tools = self._get_tools()
+        self.tools = {calendar_tool.name: calendar_tool for calendar_tool in tools}
         system_message_content = get_prompt("supervisor_google_calendar")
         if not system_message_content:
             print("Error: Supervisor prompt could not be loaded. Agent setup aborted.")
@@ -660,48 +836,204 @@ Please specify your choice or provide a new time."""
             agent = OpenAIFunctionsAgent.from_llm_and_tools(
                 llm=self.model, tools=tools, system_message=system_message
             )
-            self.agent_executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
+            # The intermediate steps tell which tools ran, for the cache
+            self.agent_executor = AgentExecutor(
+                agent=agent,
+                tools=tools,
+                verbose=True,
+                return_intermediate_steps=True,
+            )
         except Exception as e:
             print(f"Error creating agent executor: {e}")
             self.agent_executor = None
 
-    async def process_message(self, user_input: str) -> str:
+    async def process_message(
+        self, user_input: str, cache_key: Optional[str] = None
+    ) -> str:
         """
         Process a user message through the agent.
+
+        Args:
+            user_input: The message, possibly with conversation context
+            cache_key: The bare request, if it can be answered without the
+                conversation; repeated read-only requests are then answered
+                from the cache, or by replaying the cached tool calls
         """
         if not self.agent_executor:
             return "Error: Agent not initialized. Cannot process message."
+        now = timezone_service.now()
+        request = self._cache_request(cache_key)
+        if request is not None:
+            cached = await self._answer_from_cache(request, now.date())
+            if cached is not None:
+                return cached
         try:
-            # Add current date and time context to the user input
-            now = datetime.now()
-            current_date_str = now.strftime("%A, %B %d, %Y")
-            current_time_str = now.strftime("%I:%M %p")
-            current_timezone = now.astimezone().tzname()
-            local_tz_offset = now.strftime("%z")
-
-            contextual_input = f"""
-                                Current date and time context:
-                                - Today is: {current_date_str}
-                                - Current time: {current_time_str} {current_timezone}
-                                - Current datetime (ISO): {now.isoformat()}
-                                - User's timezone: {current_timezone} (UTC{local_tz_offset[:3]}:{local_tz_offset[3:]})
-                                
-                                IMPORTANT TIMEZONE INSTRUCTION:
-                                When the user specifies times (like "13:00", "1pm", "3:30"), they mean LOCAL TIME in {current_timezone}.
-                                - "13:00" means 13:00 {current_timezone}, NOT 13:00 UTC
-                                - "1pm" means 13:00 {current_timezone}, NOT 13:00 UTC
-                                - Always use the user's local timezone for time interpretation
-                                - Create start_time and end_time in ISO format WITHOUT timezone conversion
-                                
-                                Example: If user says "meeting at 2pm", create with start_time: "YYYY-MM-DDTH14:00:00"
-
-                                User request: {user_input}
-
-                                Please interpret any relative date/time references (like "today", "yesterday", "tomorrow", "next week", etc.) based on the current date provided above.
-                                """
-
+            contextual_input = self._contextual_input(user_input, now)
             result = await self.agent_executor.ainvoke({"input": contextual_input})
-            return result.get("output", "No output from agent.")
+            output = result.get("output", "No output from agent.")
+            steps = result.get("intermediate_steps", [])
+            self._remember(request, now.date(), steps, output)
+            return output
         except Exception as e:
             print(f"Error during agent processing: {e}")
+            if self.cache is not None:
+                # A mutating tool may have run before the failure
+                self.cache.invalidate()
             return f"I encountered an issue processing your request: {str(e)}"
+
+    async def stream_message(
+        self, user_input: str, cache_key: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a user message through the agent, yielding progress as it happens.
+
+        Built on LangChain's ``astream_events``, so the reply's tokens arrive
+        while the model writes them instead of after the whole agent run.
+
+        Yields dicts with a "type":
+            "token": a piece of the reply in "text"
+            "tool_start" / "tool_end": a tool named "tool" started or finished;
+                text streamed before a tool call was the model thinking aloud
+            "done": the complete reply in "text", always the last event
+        """
+        if not self.agent_executor:
+            yield {
+                "type": "done",
+                "text": "Error: Agent not initialized. Cannot process message.",
+            }
+            return
+        now = timezone_service.now()
+        request = self._cache_request(cache_key)
+        if request is not None:
+            cached = await self._answer_from_cache(request, now.date())
+            if cached is not None:
+                yield {"type": "done", "text": cached}
+                return
+
+        try:
+            contextual_input = self._contextual_input(user_input, now)
+            result = {}
+            async for event in self.agent_executor.astream_events(
+                {"input": contextual_input}, version="v2"
+            ):
+                kind = event["event"]
+                if kind == "on_chat_model_stream":
+                    # Function-call chunks have no content
+                    text = event["data"]["chunk"].content
+                    if text and isinstance(text, str):
+                        yield {"type": "token", "text": text}
+                elif kind in ("on_tool_start", "on_tool_end"):
+                    yield {"type": kind[3:], "tool": event["name"]}
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    result = event["data"].get("output") or {}
+
+            output = result.get("output", "No output from agent.")
+            self._remember(
+                request, now.date(), result.get("intermediate_steps", []), output
+            )
+            yield {"type": "done", "text": output}
+        except Exception as e:
+            print(f"Error during agent processing: {e}")
+            if self.cache is not None:
+                self.cache.invalidate()
+            yield {
+                "type": "done",
+                "text": f"I encountered an issue processing your request: {str(e)}",
+            }
+
+    def _contextual_input(self, user_input: str, now: datetime) -> str:
+        """Wrap the user input in the current date, time and timezone context."""
+        # Add current date and time context to the user input
+        current_date_str = now.strftime("%A, %B %d, %Y")
+        current_time_str = now.strftime("%I:%M %p")
+        current_timezone = now.tzname()
+        local_tz_offset = timezone_service.utc_offset(now)
+
+        return f"""
+                            Current date and time context:
+                            - Today is: {current_date_str}
+                            - Current time: {current_time_str} {current_timezone}
+                            - Current datetime (ISO): {now.replace(tzinfo=None).isoformat()}
+                            - User's timezone: {timezone_service.name}, currently {current_timezone} (UTC{local_tz_offset})
+                            
+                            IMPORTANT TIMEZONE INSTRUCTION:
+                            When the user specifies times (like "13:00", "1pm", "3:30"), they mean LOCAL TIME in {current_timezone}.
+                            - "13:00" means 13:00 {current_timezone}, NOT 13:00 UTC
+                            - "1pm" means 13:00 {current_timezone}, NOT 13:00 UTC
+                            - Always use the user's local timezone for time interpretation
+                            - Create start_time and end_time in ISO format WITHOUT timezone conversion
+                            
+                            Example: If user says "meeting at 2pm", create with start_time: "YYYY-MM-DDTH14:00:00"
+
+                            User request: {user_input}
+
+                            Please interpret any relative date/time references (like "today", "yesterday", "tomorrow", "next week", etc.) based on the current date provided above.
+                            """
+
+    async def _answer_from_cache(self, request: str, day) -> Optional[str]:
+        """A cached answer for the current calendar state, or a replayed plan."""
+        version = self.google_calendar_model.state_version
+        answer = self.cache.get_answer(request, day, version)
+        if answer is not None:
+            return answer
+
+        plan = self.cache.get_plan(request, day)
+        if not plan or not self.model:
+            return None
+        try:
+            results = []
+            for name, tool_input in plan:
+                output = await self.tools[name].ainvoke(tool_input)
+                results.append(f"{name}({tool_input}):\n{output}")
+
+            # One plain LLM call phrases the reply, instead of the agent loop
+            today = timezone_service.now().strftime("%A, %B %d, %Y")
+            response = await self.model.ainvoke(
+                [
+                    SystemMessage(content=get_prompt("tool_results_summary")),
+                    HumanMessage(
+                        content=f"Today is {today}.\n\nUser request: {request}\n\n"
+                        "Tool results:\n\n" + "\n\n".join(results)
+                    ),
+                ]
+            )
+            answer = response.content
+        except Exception as e:
+            print(f"Error replaying cached tool plan: {e}")
+            return None
+        if not answer:
+            return None
+
+        self.cache.record_plan_hit()
+        self.cache.put_answer(
+            request, day, self.google_calendar_model.state_version, answer
+        )
+        return answer
+
+    def _cache_request(self, cache_key: Optional[str]) -> Optional[str]:
+        """The normalized request to cache under, or None if not cacheable."""
+        if not cache_key or self.cache is None:
+            return None
+        return normalize_request(cache_key)
+
+    def _remember(self, request: Optional[str], day, steps, output: str):
+        """Cache a read-only answer and its tool plan; invalidate after writes."""
+        if self.cache is None:
+            return
+        tool_names = [action.tool for action, _ in steps]
+        if any(name in self.MUTATING_TOOLS for name in tool_names):
+            self.cache.invalidate()
+            return
+        if request is None or any(
+            name not in self.READ_ONLY_TOOLS for name in tool_names
+        ):
+            return
+
+        # Keyed on the version after the tools ran, as their syncs may bump it
+        self.cache.put_answer(
+            request, day, self.google_calendar_model.state_version, output
+        )
+        if steps:
+            self.cache.put_plan(
+                request, day, [(action.tool, action.tool_input) for action, _ in steps]
+            )
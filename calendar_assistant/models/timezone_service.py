@@ -0,0 +1,130 @@
+import os
+import threading
+from datetime import datetime, date, tzinfo
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+class TimezoneService:
+    """
+    The user's local time zone, resolved once and cached.
+
+    The zone is taken from ``CALENDAR_TIMEZONE`` (an IANA name such as
+    "Europe/Stockholm"), then the ``TZ`` environment variable, then the
+    system configuration (/etc/localtime, /etc/timezone). If none of those
+    names a known zone, the system's current UTC offset is used and the
+    zone is reported to Google as "UTC".
+
+    Conversions of event times to local dates are memoized, so grouping and
+    sorting a month of events does not repeat the same tz arithmetic.
+    """
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, zone_name: Optional[str] = None):
+        self._configured_name = zone_name
+        self._tz: Optional[tzinfo] = None
+        self._name = ""
+        self._lock = threading.Lock()
+        self._local_date = lru_cache(maxsize=self.CACHE_SIZE)(self._compute_local_date)
+
+    @property
+    def tz(self) -> tzinfo:
+        """The local zone as a tzinfo (a ZoneInfo when the name is known)."""
+        if self._tz is None:
+            self._resolve()
+        return self._tz
+
+    @property
+    def name(self) -> str:
+        """IANA name of the local zone, as accepted by the Google Calendar API."""
+        if self._tz is None:
+            self._resolve()
+        return self._name
+
+    def configure(self, zone_name: Optional[str]):
+        """Switch to an explicit zone (or back to auto-detection with None)."""
+        with self._lock:
+            self._configured_name = zone_name
+            self._tz = None
+            self._local_date.cache_clear()
+
+    def now(self) -> datetime:
+        """Current local time, timezone-aware."""
+        return datetime.now(self.tz)
+
+    def localize(self, dt: datetime) -> datetime:
+        """Attach the local zone to a naive datetime; aware ones are unchanged."""
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=self.tz)
+        return dt
+
+    def to_local(self, dt: datetime) -> datetime:
+        """Convert a datetime to local time (naive values are taken as local)."""
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=self.tz)
+        return dt.astimezone(self.tz)
+
+    def local_date(self, dt: datetime) -> date:
+        """The local calendar date of a datetime, memoized per value."""
+        return self._local_date(dt)
+
+    def utc_offset(self, dt: Optional[datetime] = None) -> str:
+        """UTC offset of the zone at ``dt`` (default: now), e.g. "+02:00"."""
+        offset = self.to_local(dt or datetime.now(self.tz)).strftime("%z")
+        return f"{offset[:3]}:{offset[3:]}" if offset else "+00:00"
+
+    def _compute_local_date(self, dt: datetime) -> date:
+        return self.to_local(dt).date()
+
+    def _resolve(self):
+        with self._lock:
+            if self._tz is not None:
+                return
+            for candidate in (
+                self._configured_name,
+                os.getenv("CALENDAR_TIMEZONE"),
+                os.getenv("TZ"),
+                _system_zone_name(),
+            ):
+                zone = _load_zone(candidate)
+                if zone is not None:
+                    self._name = zone.key
+                    self._tz = zone
+                    return
+
+            # Unknown zone: keep the system's offset for local times
+            self._name = "UTC"
+            self._tz = datetime.now().astimezone().tzinfo
+
+
+def _load_zone(name: Optional[str]) -> Optional[ZoneInfo]:
+    """Load an IANA zone, returning None for empty or unknown names."""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name.lstrip(":"))
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def _system_zone_name() -> Optional[str]:
+    """Best-effort IANA name of the system zone on Unix-like systems."""
+    try:
+        target = os.path.realpath("/etc/localtime")
+        marker = "zoneinfo" + os.sep
+        if marker in target:
+            return target.split(marker, 1)[1]
+    except OSError:
+        pass
+
+    try:
+        with open("/etc/timezone", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+# Shared instance used throughout the app
+timezone_service = TimezoneService()
@@ -0,0 +1,489 @@
+import dataclasses
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Dict, Any, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.google_calendar_model import GoogleCalendarModel
+
+
+@dataclass(slots=True)
+class Mutation:
+    """One journaled write: "create", "patch" or "delete" of an event."""
+
+    seq: int
+    op: str
+    calendar_id: str
+    event_id: str
+    payload: Dict[str, Any]
+    attempts: int = 0
+
+
+@dataclass(slots=True)
+class PendingWrite:
+    """The coalesced effect of all journaled mutations of one event."""
+
+    op: str
+    calendar_id: str
+    event_id: str
+    payload: Dict[str, Any]
+    seqs: List[int] = field(default_factory=list)
+    attempted: bool = False
+
+
+class WriteJournal:
+    """
+    Durable, append-only SQLite journal of event mutations.
+
+    Mutations are removed only once Google has acknowledged them, so writes
+    made while offline (or before a crash) survive until they are flushed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS mutations (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    op TEXT NOT NULL,
+                    calendar_id TEXT NOT NULL,
+                    event_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT NOT NULL DEFAULT ''
+                )
+                """)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM mutations").fetchone()[0]
+
+    def append(
+        self, op: str, calendar_id: str, event_id: str, payload: Dict[str, Any]
+    ) -> int:
+        """Durably record a mutation and return its sequence number."""
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "INSERT INTO mutations (op, calendar_id, event_id, payload, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    op,
+                    calendar_id,
+                    event_id,
+                    json.dumps(payload, default=_encode_value),
+                    time.time(),
+                ),
+            )
+            return cursor.lastrowid
+
+    def pending(self) -> List[Mutation]:
+        """All unacknowledged mutations, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT seq, op, calendar_id, event_id, payload, attempts"
+                " FROM mutations ORDER BY seq"
+            ).fetchall()
+        return [
+            Mutation(
+                seq,
+                op,
+                calendar_id,
+                event_id,
+                json.loads(payload, object_hook=_decode_value),
+                attempts,
+            )
+            for seq, op, calendar_id, event_id, payload, attempts in rows
+        ]
+
+    def complete(self, seqs: List[int]):
+        """Remove mutations that Google has applied (or that are moot)."""
+        with self._lock, self._db:
+            self._db.executemany(
+                "DELETE FROM mutations WHERE seq = ?", [(seq,) for seq in seqs]
+            )
+
+    def record_failure(self, seqs: List[int], error: str):
+        """Count a failed attempt for mutations that will be retried."""
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE mutations SET attempts = attempts + 1, last_error = ?"
+                " WHERE seq = ?",
+                [(error, seq) for seq in seqs],
+            )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class OfflineWriteQueue:
+    """
+    Journaled, optimistic writes flushed to Google in the background.
+
+    ``create_event``, ``patch_event`` and ``delete_event`` append to the
+    journal, apply the change to the local event store and cache, and return
+    at once. A worker thread then coalesces the pending mutations per event
+    (e.g. create + patch becomes one insert, create + delete nothing) and
+    sends them through the batch endpoint. Transient failures (network,
+    429, 5xx) are retried with backoff; mutations Google rejects outright
+    are dropped with an error message.
+
+    New events get a client-assigned ID up front, so the local copy, later
+    patches and a retried insert all refer to the same event.
+    """
+
+    # How often the worker checks for mutations when it is not woken up
+    FLUSH_INTERVAL = 5.0
+    MAX_RETRY_DELAY = 300.0
+    TRANSIENT_STATUSES = {0, 408, 429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        google_calendar_model: GoogleCalendarModel,
+        journal_path: Optional[str] = None,
+    ):
+        self.google_calendar_model = google_calendar_model
+        self.journal = WriteJournal(
+            journal_path
+            or os.getenv("CALENDAR_WRITE_JOURNAL")
+            or default_journal_path()
+        )
+        # A full sync replaces the local store; keep showing pending writes
+        google_calendar_model.on_store_replaced = self._reapply_pending
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._failures = 0
+
+    def start(self):
+        """Start the background flush worker (flushes leftovers right away)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="write-queue", daemon=True
+        )
+        self._thread.start()
+        self._wake.set()
+
+    def stop(self, flush: bool = True, timeout: float = 10.0):
+        """Stop the worker, optionally making one last flush attempt."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if flush:
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Could not flush pending calendar writes: {e}")
+
+    def pending_count(self) -> int:
+        """Number of journaled mutations not yet acknowledged by Google."""
+        return len(self.journal)
+
+    def create_event(
+        self, event_data: Dict[str, Any], calendar_id: str = "primary"
+    ) -> CalendarEvent:
+        """Queue an insert and return the optimistic local copy."""
+        event_data = dict(event_data)
+        # base32hex-compatible, as Google requires for client-assigned IDs
+        event_data["id"] = event_data.get("id") or uuid.uuid4().hex
+        self.journal.append("create", calendar_id, event_data["id"], event_data)
+
+        event = CalendarEvent.from_google(
+            self.google_calendar_model._dict_to_google_event(event_data), calendar_id
+        )
+        self.google_calendar_model.apply_local_event(event)
+        self._wake.set()
+        return event
+
+    def patch_event(
+        self, event_id: str, changes: Dict[str, Any], calendar_id: str = "primary"
+    ) -> Optional[CalendarEvent]:
+        """
+        Queue a partial update and return the optimistic local copy.
+
+        Like GoogleCalendarModel.patch_event, returns None (and queues
+        nothing) for an event that does not exist: one that is neither
+        known locally nor found with a get request.
+        """
+        model = self.google_calendar_model
+        current, detail = self._find_event(event_id, calendar_id)
+        if current is None:
+            print(f"Error patching event: event {event_id} not found")
+            return None
+
+        self.journal.append("patch", calendar_id, event_id, changes)
+        event = _patched(current, model._dict_to_google_patch(changes))
+        model.apply_local_event(event, detail)
+        self._wake.set()
+        return event
+
+    def delete_event(self, event_id: str, calendar_id: str = "primary") -> bool:
+        """
+        Queue a delete and remove the event from the local view.
+
+        Returns False (and queues nothing) for an event that does not
+        exist, like ``patch_event``.
+        """
+        current, _ = self._find_event(event_id, calendar_id)
+        if current is None:
+            print(f"Error deleting event: event {event_id} not found")
+            return False
+
+        self.journal.append("delete", calendar_id, event_id, {})
+        self.google_calendar_model.discard_local_event(event_id, calendar_id)
+        self._wake.set()
+        return True
+
+    def _find_event(
+        self, event_id: str, calendar_id: str
+    ) -> Tuple[Optional[CalendarEvent], str]:
+        """
+        The most complete local copy of an event, or a summary fetched with
+        a get request, with the level of detail it has.
+        """
+        model = self.google_calendar_model
+        event = model.get_cached_event(event_id, calendar_id, detail="full")
+        if event is not None:
+            return event, "full"
+        store = model.event_stores.get(calendar_id)
+        event = store.get(event_id) if store is not None else None
+        if event is not None:
+            return event, model.SYNC_DETAIL
+        event = model.get_cached_event(event_id, calendar_id) or model.get_event(
+            event_id, calendar_id, detail="summary"
+        )
+        return event, "summary"
+
+    def _reapply_pending(self, calendar_id: str):
+        """Apply the journaled writes of a calendar to its freshly synced store."""
+        model = self.google_calendar_model
+        store = model.get_event_store(calendar_id)
+        for write in coalesce(self.journal.pending()):
+            if write.calendar_id != calendar_id or write.op == "noop":
+                continue
+            if write.op == "delete":
+                model.discard_local_event(write.event_id, calendar_id)
+            elif write.op == "create":
+                model.apply_local_event(
+                    CalendarEvent.from_google(
+                        model._dict_to_google_event(write.payload), calendar_id
+                    )
+                )
+            else:
+                current = store.get(write.event_id)
+                if current is not None:
+                    model.apply_local_event(
+                        _patched(current, model._dict_to_google_patch(write.payload)),
+                        model.SYNC_DETAIL,
+                    )
+
+    def flush(self) -> Dict[str, int]:
+        """
+        Send every pending mutation now.
+
+        Returns counts of ``sent`` (acknowledged), ``dropped`` (rejected by
+        Google or cancelled out locally) and ``retry`` (kept for later).
+        """
+        with self._flush_lock:
+            writes = coalesce(self.journal.pending())
+            stats = {"sent": 0, "dropped": 0, "retry": 0}
+
+            noops = [w for w in writes if w.op == "noop"]
+            if noops:
+                self.journal.complete([seq for w in noops for seq in w.seqs])
+                stats["dropped"] += len(noops)
+
+            groups: "OrderedDict[tuple, List[PendingWrite]]" = OrderedDict()
+            for write in writes:
+                if write.op != "noop":
+                    groups.setdefault((write.calendar_id, write.op), []).append(write)
+
+            for (calendar_id, op), group in groups.items():
+                results = self._send(op, calendar_id, group)
+                for write, result in zip(group, results):
+                    outcome = self._settle(write, result)
+                    stats[outcome] += 1
+
+            return stats
+
+    def _send(
+        self, op: str, calendar_id: str, writes: List[PendingWrite]
+    ) -> List[Dict[str, Any]]:
+        model = self.google_calendar_model
+        if op == "create":
+            return model.batch_create_events([w.payload for w in writes], calendar_id)
+        if op == "patch":
+            return model.batch_patch_events(
+                {w.event_id: w.payload for w in writes}, calendar_id
+            )
+        return model.batch_delete_events([w.event_id for w in writes], calendar_id)
+
+    def _settle(self, write: PendingWrite, result: Dict[str, Any]) -> str:
+        """Complete, drop or keep one write based on its batch result."""
+        status = result.get("status", 0)
+        if write.op == "create" and status == 409 and len(write.seqs) > 1:
+            # An earlier attempt was applied; send the later edits folded
+            # into this insert as a patch instead
+            result = self._send("patch", write.calendar_id, [write])[0]
+            status = result.get("status", 0)
+
+        # A delete that is gone on Google only counts as sent when an earlier
+        # attempt of ours may have removed it; otherwise it never existed
+        # there or someone else deleted it, which is reported below
+        already_applied = (write.op == "create" and status == 409) or (
+            write.op == "delete" and status in (404, 410) and write.attempted
+        )
+        if result["success"] or already_applied:
+            self.journal.complete(write.seqs)
+            return "sent"
+
+        if status in self.TRANSIENT_STATUSES:
+            self.journal.record_failure(write.seqs, result["error"])
+            return "retry"
+
+        print(
+            f"✗ Google rejected queued {write.op} of event {write.event_id}: "
+            f"{result['error']}"
+        )
+        self.journal.complete(write.seqs)
+        return "dropped"
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = self.FLUSH_INTERVAL
+            if self._failures:
+                delay = min(
+                    self.MAX_RETRY_DELAY, self.FLUSH_INTERVAL * 2**self._failures
+                )
+            self._wake.wait(delay)
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+
+            try:
+                stats = self.flush()
+                self._failures = self._failures + 1 if stats["retry"] else 0
+            except Exception as e:
+                # e.g. no network at all; everything stays journaled
+                print(f"Error flushing calendar writes: {e}")
+                self._failures += 1
+
+
+def default_journal_path() -> str:
+    """
+    Journal location in the user's data directory, so running from a
+    checkout leaves no database in the working tree.
+    """
+    if os.name == "nt":
+        base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    else:
+        base = os.getenv("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    directory = os.path.join(base, "ai-calendar-assistant")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, "write_journal.db")
+
+
+def coalesce(mutations: List[Mutation]) -> List[PendingWrite]:
+    """
+    Fold the mutations of each event into one pending write, in order.
+
+    create+patch -> create, patch+patch -> patch, patch+delete -> delete, and
+    create+delete -> nothing, unless the insert may already have reached
+    Google (it was attempted before), in which case a delete is sent.
+    """
+    writes: "OrderedDict[tuple, PendingWrite]" = OrderedDict()
+    for mutation in mutations:
+        key = (mutation.calendar_id, mutation.event_id)
+        write = writes.get(key)
+        if write is None:
+            writes[key] = PendingWrite(
+                mutation.op,
+                mutation.calendar_id,
+                mutation.event_id,
+                dict(mutation.payload),
+                [mutation.seq],
+                mutation.attempts > 0,
+            )
+            continue
+
+        write.seqs.append(mutation.seq)
+        write.attempted = write.attempted or mutation.attempts > 0
+        if mutation.op == "delete":
+            write.op = (
+                "noop" if write.op == "create" and not write.attempted else "delete"
+            )
+            write.payload = {}
+        elif mutation.op == "patch" and write.op in ("create", "patch"):
+            write.payload.update(mutation.payload)
+        elif mutation.op == "create":
+            write.op = "create"
+            write.payload = dict(mutation.payload)
+
+    return list(writes.values())
+
+
+def _encode_value(value: Any) -> Dict[str, str]:
+    """
+    JSON form of the dates and datetimes that event payloads may hold.
+
+    Tagged so they are read back as the same type: an all-day date must not
+    come back as a string that parses as midnight, and a datetime keeps its
+    IANA zone, which recurring events repeat in.
+    """
+    if isinstance(value, datetime):
+        encoded = {"__datetime__": value.isoformat()}
+        zone_key = getattr(value.tzinfo, "key", None)
+        if zone_key:
+            encoded["zone"] = zone_key
+        return encoded
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_value(value: Dict[str, Any]) -> Any:
+    """Inverse of ``_encode_value`` (an object_hook for json.loads)."""
+    if "__datetime__" in value:
+        decoded = datetime.fromisoformat(value["__datetime__"])
+        if value.get("zone"):
+            decoded = decoded.astimezone(ZoneInfo(value["zone"]))
+        return decoded
+    if "__date__" in value:
+        return date.fromisoformat(value["__date__"])
+    return value
+
+
+def _patched(event: CalendarEvent, google_patch: Dict[str, Any]) -> CalendarEvent:
+    """Apply a Google-format PATCH body to a local event copy."""
+    patched = CalendarEvent.from_google(
+        {"id": event.id, **google_patch}, event.calendar_id
+    )
+    updates = {}
+    for google_key, attribute in (
+        ("summary", "title"),
+        ("description", "description"),
+        ("location", "location"),
+        ("attendees", "attendees"),
+        ("start", "start"),
+        ("end", "end"),
+    ):
+        if google_key in google_patch:
+            updates[attribute] = getattr(patched, attribute)
+    return dataclasses.replace(event, **updates)
@@ -177,11 +177,24 @@ Available Tools:
 - `get_google_calendar_events_for_date_range`: Fetches events for a specified date range (YYYY-MM-DD format for start and end dates).
 - `get_google_calendar_month_events`: Fetches all events for a specific month from Google Calendar.
   - Optional: year (defaults to current year), month (1-12, defaults to current month).
+- `check_google_calendar_availability`: Checks whether the user is free between two times (YYYY-MM-DDTHH:MM:SS).
+  - Use this for "am I free at ...?" questions instead of listing events.
+- `find_google_calendar_free_slot`: Finds the earliest free period of duration_minutes.
+  - Optional: earliest_start (defaults to now), latest_end (defaults to 14 days later), both YYYY-MM-DDTHH:MM:SS.
+  - Use this to suggest a new time after a conflict or for "when am I free for ...?" questions.
+- `get_google_calendar_busy_stats`: Summarizes how busy the user is between start_date and end_date (YYYY-MM-DD, inclusive).
+  - Optional: start_date (defaults to today), end_date (defaults to 6 days later).
+  - Use this for "how busy am I ...?" questions instead of listing and counting events yourself.
+- `import_google_calendar_ics`: Imports all events from an .ics file (file_path) in one call.
+  - Use this instead of creating the file's events one by one; re-importing the same file skips existing events.
+- `export_google_calendar_ics`: Writes events between start_date and end_date (YYYY-MM-DD, inclusive) to an .ics file (file_path).
 - `update_google_calendar_event`: Updates an existing event in Google Calendar.
   - Requires: event_id (Google Calendar event ID from retrieved events).
+  - Pass calendar_id too when the retrieved event lists a calendar other than primary.
   - Optional: title, start_time, end_time, description, location, attendees (only update fields that are provided).
 - `delete_google_calendar_event`: Deletes an event from Google Calendar.
   - Requires: event_id (Google Calendar event ID from retrieved events).
+  - Pass calendar_id too when the retrieved event lists a calendar other than primary.
   - WARNING: This action cannot be undone.
 
 CONVERSATIONAL CONTEXT & INTENT RECOGNITION:
@@ -283,6 +296,16 @@ Your goal is to be a helpful, efficient, and proactive Google Calendar assistant
 # No few-shot examples for this one yet, as the LLM should be guided by the detailed system prompt and tool descriptions.
 SUPERVISOR_GOOGLE_CALENDAR_FEW_SHOT_EXAMPLES = """"""
 
+# Used to answer a repeated request from re-run tool calls, without the agent loop
+TOOL_RESULTS_SUMMARY_SYSTEM_PROMPT = """
+You are a helpful Google Calendar assistant. The user's request has already been answered by calling calendar tools; their results are given below.
+
+Reply to the user's request using only these results, in the same style you would use after calling the tools yourself:
+- Keep event titles, dates, times, time zones and event IDs exactly as the tools report them.
+- Do not invent events or details that are not in the results.
+- If a tool reported an error, tell the user briefly.
+"""
+
 
 def get_prompt(agent_type, include_examples=True):
     """Get the full prompt for a specific agent type, optionally including examples."""
@@ -293,6 +316,7 @@ def get_prompt(agent_type, include_examples=True):
             SUPERVISOR_GOOGLE_CALENDAR_SYSTEM_PROMPT,
             SUPERVISOR_GOOGLE_CALENDAR_FEW_SHOT_EXAMPLES,
         ),
+        "tool_results_summary": (TOOL_RESULTS_SUMMARY_SYSTEM_PROMPT, ""),
     }
 
     if agent_type not in prompts:
@@ -308,4 +332,9 @@ def get_prompt(agent_type, include_examples=True):
 
 def list_available_agent_types():
     """List all available agent types with prompts."""
-    return ["supervisor", "crud", "supervisor_google_calendar"]
+    return [
+        "supervisor",
+        "crud",
+        "supervisor_google_calendar",
+        "tool_results_summary",
+    ]
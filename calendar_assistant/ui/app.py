@@ -1,14 +1,15 @@
 # app.py
 
 import traceback
-import asyncio
+import time
 from textual.app import App
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Header, Footer, Input, Static
 from textual.binding import Binding
-from datetime import datetime
-from typing import List, Dict, Any
+from typing import List
 
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.timezone_service import timezone_service
 from calendar_assistant.ui.widgets.message import MessageWidget
 from calendar_assistant.ui.widgets.event_list import EventList
 from calendar_assistant.ui.widgets.calendar_display import CalendarDisplay
@@ -23,11 +24,14 @@ class CalendarApp(App):
         Binding("q", "quit", "Quit"),
     ]
 
-    def __init__(self, controller):
+    def __init__(self, controller, started_at=None):
         super().__init__()
         self.controller = controller
         self.events = []
         self.conversation_history = []  # Store conversation history for context
+        # perf_counter() timestamp of process start, used to measure cold start
+        self.started_at = started_at
+        self.cold_start_ms = None
 
     async def on_mount(self):
         """Initialize UI and apply theme."""
@@ -37,35 +41,37 @@ class CalendarApp(App):
             print(f"Error focusing input: {e}")
 
     async def on_ready(self):
-        """App is ready — load data."""
-        await self.load_events()
+        """App is ready — record cold start, then warm up and load data."""
+        if self.started_at is not None:
+            self.cold_start_ms = (time.perf_counter() - self.started_at) * 1000
+            self.log(f"Cold start (first frame): {self.cold_start_ms:.0f} ms")
+
+        # None of these blocks the UI: the Google service and the agent are
+        # built on worker threads while the first frame is already visible.
+        # Textual's workers keep a reference to each task (the event loop
+        # alone would not) and cancel them when the app exits.
+        self.run_worker(self.controller.warm_up(), exit_on_error=False)
+        self.run_worker(self.load_events(), exit_on_error=False)
+        # Refresh when Google reports changes made elsewhere (if configured)
+        self.run_worker(
+            self.controller.start_push_notifications(self.load_events),
+            exit_on_error=False,
+        )
 
     async def load_events(self):
         """Load upcoming events and update UI."""
         try:
-            current_time = datetime.now()
+            current_time = timezone_service.now()
             all_month_events = await self.controller.get_events_for_month(current_time)
             self.events = all_month_events  # For CalendarDisplay
 
-            today_date = current_time.date()
-            upcoming_events = []
-            for event in all_month_events:
-                start_time_obj = event.get("start_time")
-                # Handle both string and datetime objects
-                if isinstance(start_time_obj, datetime):
-                    if start_time_obj.date() >= today_date:
-                        upcoming_events.append(event)
-                elif isinstance(start_time_obj, str):
-                    try:
-                        # Parse ISO format datetime string
-                        parsed_dt = datetime.fromisoformat(
-                            start_time_obj.replace("Z", "+00:00")
-                        )
-                        if parsed_dt.date() >= today_date:
-                            upcoming_events.append(event)
-                    except ValueError:
-                        # If parsing fails, include the event to be safe
-                        upcoming_events.append(event)
+            today_date = timezone_service.now().date()
+            upcoming_events = [
+                event
+                for event in all_month_events
+                if event.start is not None
+                and timezone_service.local_date(event.start) >= today_date
+            ]
 
             self._update_ui_with_events(upcoming_events_for_list=upcoming_events)
 
@@ -78,7 +84,7 @@ class CalendarApp(App):
             traceback.print_exc()
             self.events = []
 
-    def _update_ui_with_events(self, upcoming_events_for_list: List[Dict[str, Any]]):
+    def _update_ui_with_events(self, upcoming_events_for_list: List[CalendarEvent]):
         try:
             calendar_display = self.query_one(CalendarDisplay)
             if calendar_display:
@@ -137,8 +143,10 @@ class CalendarApp(App):
 
     def _schedule_ai_processing(self):
         """Schedule AI processing as a separate task after UI refresh."""
-        # Create a separate background task for AI processing
-        asyncio.create_task(self._process_ai_response(self._last_user_input))
+        # A separate worker for AI processing, so the input stays responsive
+        self.run_worker(
+            self._process_ai_response(self._last_user_input), exit_on_error=False
+        )
 
     async def _process_ai_response(self, user_input: str):
         """Process AI response in a separate task."""
@@ -148,10 +156,33 @@ class CalendarApp(App):
             # Add current user input to conversation history
             self.conversation_history.append({"role": "user", "content": user_input})
 
-            # Get AI response with conversation history for context
-            assistant_text = await self.controller.process_chat_with_history(
+            # Show the reply as it streams in instead of after the whole run
+            assistant_msg = MessageWidget("Assistant", "")
+            assistant_msg.set_status("Thinking...")
+            chat_container.mount(assistant_msg)
+            chat_container.scroll_end(animate=False)
+
+            assistant_text = ""
+            async for event in self.controller.stream_chat_with_history(
                 user_input, self.conversation_history
-            )
+            ):
+                if event["type"] == "token":
+                    if assistant_msg.status:
+                        assistant_msg.set_status("")
+                    assistant_msg.append(event["text"])
+                    chat_container.scroll_end(animate=False)
+                elif event["type"] == "tool_start":
+                    # Text before a tool call was not the reply
+                    assistant_msg.set_content("")
+                    assistant_msg.set_status(self._tool_status(event["tool"]))
+                elif event["type"] == "tool_end":
+                    assistant_msg.set_status("Thinking...")
+                elif event["type"] == "done":
+                    assistant_text = event["text"]
+
+            assistant_msg.set_status("")
+            assistant_msg.set_content(assistant_text)
+            chat_container.scroll_end(animate=False)
 
             # Add assistant response to conversation history
             self.conversation_history.append(
@@ -162,11 +193,6 @@ class CalendarApp(App):
             if len(self.conversation_history) > 20:
                 self.conversation_history = self.conversation_history[-20:]
 
-            # Add assistant message to UI
-            assistant_msg = MessageWidget("Assistant", assistant_text)
-            chat_container.mount(assistant_msg)
-            chat_container.scroll_end(animate=False)
-
             # Reload events in case a new event was created
             await self.load_events()
 
@@ -178,3 +204,8 @@ class CalendarApp(App):
             )
             chat_container.mount(error_msg)
             chat_container.scroll_end(animate=False)
+
+    def _tool_status(self, tool_name: str) -> str:
+        """Progress line for a running tool, e.g. "Running: get today events..."."""
+        action = tool_name.replace("google_calendar_", "").replace("_", " ")
+        return f"🔧 Running: {action}..."
@@ -2,13 +2,16 @@
 Calendar display widget for the Calendar Assistant UI.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from calendar import monthrange
 from textual.widgets import Static
 from textual.containers import Grid
 from rich.table import Table
 from rich.text import Text
 
+from calendar_assistant.models.event_columns import EventColumns
+from calendar_assistant.models.timezone_service import timezone_service
+
 
 class CalendarDisplay(Static):
     """Widget for displaying a calendar view."""
@@ -16,10 +19,12 @@ class CalendarDisplay(Static):
     def __init__(self, events=None, date=None):
         """Initialize the calendar display."""
         super().__init__()
-        self.current_date = date or datetime.now()
+        self.current_date = date or timezone_service.now()
         self.view_type = "month"  # month, week, day
         self.events = events or []
         self.highlighted_events = {}
+        # Columnar copy of the events for per-day counts, rebuilt when they change
+        self._columns = EventColumns(self.events)
 
     def on_mount(self):
         """Handle the widget mount event."""
@@ -51,6 +56,9 @@ class CalendarDisplay(Static):
         # Calculate the weekday of the first day (0 is Monday in our display)
         first_weekday = first_day.weekday()
 
+        today = timezone_service.now().date()
+        day_counts = self._columns.day_counts(first_day.date(), num_days)
+
         # Generate the calendar grid
         day = 1
         for week in range(6):  # Max 6 weeks in a month view
@@ -68,14 +76,11 @@ class CalendarDisplay(Static):
 
                     # Highlight current day
                     is_today = (
-                        day == datetime.now().day
-                        and month == datetime.now().month
-                        and year == datetime.now().year
+                        day == today.day and month == today.month and year == today.year
                     )
 
-                    # Check for events on this day and count them
-                    day_events = self._get_events_for_day(year, month, day)
-                    event_count = len(day_events)
+                    # Number of events starting on this day
+                    event_count = int(day_counts[day - 1])
 
                     # Apply styling based on priority: today > events > weekend
                     if is_today:
@@ -114,50 +119,6 @@ class CalendarDisplay(Static):
 
         return table
 
-    def _get_events_for_day(self, year, month, day):
-        """Get events for a specific day."""
-        day_start_dt = datetime(year, month, day, 0, 0, 0)
-        day_end_exclusive_dt = datetime(year, month, day) + timedelta(days=1)
-
-        events_for_day = []
-        for e in self.events:
-            event_start_time = e.get("start_time")
-
-            # Handle both string (ISO format) and datetime objects
-            if isinstance(event_start_time, datetime):
-                event_dt = event_start_time
-            elif isinstance(event_start_time, str):
-                try:
-                    # Parse ISO format string (with or without timezone)
-                    if event_start_time.endswith("Z"):
-                        event_dt = datetime.fromisoformat(
-                            event_start_time.replace("Z", "+00:00")
-                        )
-                    elif "+" in event_start_time or event_start_time.count("-") > 2:
-                        event_dt = datetime.fromisoformat(event_start_time)
-                    else:
-                        # Assume UTC if no timezone
-                        event_dt = datetime.fromisoformat(event_start_time)
-
-                    # Convert to local timezone for comparison if timezone-aware
-                    if event_dt.tzinfo is not None:
-                        # Convert to local timezone for day comparison
-                        local_tz = datetime.now().astimezone().tzinfo
-                        event_dt = event_dt.astimezone(local_tz).replace(tzinfo=None)
-
-                except (ValueError, TypeError):
-                    # Skip events with invalid datetime formats
-                    continue
-            else:
-                # Skip events without valid start time
-                continue
-
-            # Check if event falls on this day
-            if day_start_dt <= event_dt < day_end_exclusive_dt:
-                events_for_day.append(e)
-
-        return events_for_day
-
     def set_view(self, view_type):
         """Set the calendar view type."""
         if view_type in ["month", "week", "day"]:
@@ -196,4 +157,5 @@ class CalendarDisplay(Static):
     def highlight_events(self, events):
         """Highlight events on the calendar."""
         self.events = events
+        self._columns = EventColumns(events)
         self.update()
@@ -10,6 +10,8 @@ from rich.text import Text
 from datetime import datetime
 from typing import Optional
 
+from calendar_assistant.models.timezone_service import timezone_service
+
 
 class EventList(VerticalScroll):
     """Widget for displaying calendar events using direct Static widgets."""
@@ -37,7 +39,7 @@ class EventList(VerticalScroll):
         """Update the displayed events."""
         try:
             print(f"EventList.update_events() called with {len(events)} events")
-            self.events = sorted(events, key=lambda e: e.get("start_time", ""))
+            self.events = sorted(events, key=lambda e: e.sort_key())
 
             # Remove all existing widgets
             for widget in self.event_widgets:
@@ -67,7 +69,7 @@ class EventList(VerticalScroll):
                     event_widget = self._create_event_widget(event, i)
                     self.mount(event_widget)
                     self.event_widgets.append(event_widget)
-                    print(f"Added event widget {i + 1}: {event.get('title')}")
+                    print(f"Added event widget {i + 1}: {event.title}")
                 except Exception as e:
                     print(f"Error adding event widget: {e}")
                     error_widget = Static(f"Error: {str(e)}", classes="error")
@@ -90,35 +92,12 @@ class EventList(VerticalScroll):
 
     def _create_event_widget(self, event, index):
         """Create a static widget for an event."""
-        title = event.get("title", "Untitled Event")
-
-        # Handle both string and datetime objects for start/end times
-        event_start_dt = event.get("start_time")
-        event_end_dt = event.get("end_time")
-
-        # Parse string datetimes to datetime objects for processing
-        parsed_start_dt = None
-        parsed_end_dt = None
-
-        if isinstance(event_start_dt, str):
-            try:
-                parsed_start_dt = datetime.fromisoformat(
-                    event_start_dt.replace("Z", "+00:00")
-                )
-            except ValueError:
-                pass
-        elif isinstance(event_start_dt, datetime):
-            parsed_start_dt = event_start_dt
-
-        if isinstance(event_end_dt, str):
-            try:
-                parsed_end_dt = datetime.fromisoformat(
-                    event_end_dt.replace("Z", "+00:00")
-                )
-            except ValueError:
-                pass
-        elif isinstance(event_end_dt, datetime):
-            parsed_end_dt = event_end_dt
+        title = event.title or "Untitled Event"
+        # Shown in the user's local time
+        parsed_start_dt = (
+            timezone_service.to_local(event.start) if event.start else None
+        )
+        parsed_end_dt = timezone_service.to_local(event.end) if event.end else None
 
         # Smart time formatting - show only time for end if same day
         display_start_time = self._format_time(parsed_start_dt)
@@ -134,14 +113,14 @@ class EventList(VerticalScroll):
             # Different day or missing date - show full format
             display_end_time = self._format_time(parsed_end_dt)
 
-        description = event.get("description", "")
+        description = event.description
 
         # Determine panel border style and time text style
         panel_border_style = "blue"  # Default
         time_text_style = "bold blue"  # Default
 
-        if parsed_start_dt:  # Check if we have a valid parsed datetime
-            if parsed_start_dt.date() == datetime.now().date():
+        if parsed_start_dt:  # Check if we have a start time
+            if parsed_start_dt.date() == timezone_service.now().date():
                 panel_border_style = "green"  # Today's event
                 time_text_style = "bold green"  # Today's event
 
@@ -158,18 +137,11 @@ class EventList(VerticalScroll):
         panel = Panel(event_text, border_style=panel_border_style)
 
         # Create widget with unique ID
-        widget_id = f"event-{event.get('id', index)}"
+        widget_id = f"event-{event.id or index}"
         return Static(panel, id=widget_id, classes="event-item")
 
     def _format_time(self, time_obj):
         """Format a datetime object for display, or return a placeholder string."""
         if isinstance(time_obj, datetime):
             return time_obj.strftime("%Y-%m-%d %H:%M")
-        elif isinstance(time_obj, str):
-            try:
-                # Try to parse string and format it
-                parsed_dt = datetime.fromisoformat(time_obj.replace("Z", "+00:00"))
-                return parsed_dt.strftime("%Y-%m-%d %H:%M")
-            except ValueError:
-                return time_obj  # Return the string as-is if parsing fails
-        return "N/A"  # Return placeholder if time_obj is None or unexpected type
+        return "N/A"  # Return placeholder if time_obj is None
@@ -18,14 +18,35 @@ class MessageWidget(Static):
         self.content = content
         self.timestamp = timestamp or datetime.now().isoformat()
         self.is_user = sender == "User"
+        # Progress shown under a reply that is still being written
+        self.status = ""
         # First add the common message class
         self.add_class("message")
         # Then add the user/assistant specific class
         self.add_class("user" if self.is_user else "assistant")
 
+    def append(self, text):
+        """Add streamed text to the end of the message."""
+        self.content += text
+        self.refresh(layout=True)
+
+    def set_content(self, content):
+        """Replace the message text, e.g. with the complete streamed reply."""
+        self.content = content
+        self.refresh(layout=True)
+
+    def set_status(self, status):
+        """Show progress (such as the tool being run) under the message."""
+        self.status = status
+        self.refresh(layout=True)
+
     def render(self):
         """Render the message widget."""
         content_text = Text(self.content)
+        if self.status:
+            if self.content:
+                content_text.append("\n")
+            content_text.append(self.status, style="dim italic")
         timestamp_str = self.format_timestamp()
 
         # Create a panel that's narrower than the full container
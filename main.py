@@ -3,19 +3,57 @@
 Entry point of the Calendar Assistant application.
 """
 
+import time
+
+# Taken before the heavy imports below so the cold-start figure includes them
+STARTUP_STARTED = time.perf_counter()
+
+import json
+import os
 import sys
+from datetime import datetime
 from dotenv import load_dotenv
 from calendar_assistant.ui.app import CalendarApp
 from calendar_assistant.controller.app_controller import AppController
 
 
+def record_cold_start(app: CalendarApp, controller: AppController):
+    """Report the measured cold-start time and optionally append it to a log."""
+    if app.cold_start_ms is None:
+        return
+
+    print(
+        f"✓ Cold start: {app.cold_start_ms:.0f} ms "
+        f"(startup mode: {controller.startup_mode})"
+    )
+
+    # Set CALENDAR_STARTUP_METRICS_FILE to track cold starts across runs
+    metrics_file = os.getenv("CALENDAR_STARTUP_METRICS_FILE")
+    if metrics_file:
+        with open(metrics_file, "a") as f:
+            f.write(
+                json.dumps(
+                    {
+                        "timestamp": datetime.now().isoformat(),
+                        "startup_mode": controller.startup_mode,
+                        "cold_start_ms": round(app.cold_start_ms, 1),
+                    }
+                )
+                + "\n"
+            )
+
+
 def main():
     """Main entry point of the application."""
     try:
         load_dotenv()
         controller = AppController()
-        app = CalendarApp(controller=controller)
-        app.run()
+        app = CalendarApp(controller=controller, started_at=STARTUP_STARTED)
+        try:
+            app.run()
+        finally:
+            controller.shutdown()
+        record_cold_start(app, controller)
 
     except Exception as e:
         print(f"Error starting application: {e}")
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Calendar Sync Benchmark
+
+Measures throughput and latency of GoogleCalendarModel's sync paths against
+the local fake Calendar API (fake_google_calendar.py), so results are
+reproducible offline and comparable between changes.
+
+    python -m scripts.benchmark_sync --events 5000 --latency 0.05 --repeat 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Any, List
+
+from calendar_assistant.models.async_google_calendar_model import (
+    AsyncGoogleCalendarModel,
+)
+from calendar_assistant.models.google_calendar_model import GoogleCalendarModel
+from calendar_assistant.models.request_scheduler import RequestScheduler
+from scripts.fake_google_calendar import FakeCalendarServer, generate_events
+
+
+def make_model(server: FakeCalendarServer, qps: float) -> GoogleCalendarModel:
+    """A fresh model (empty caches and stores) pointed at the fake server."""
+    model = GoogleCalendarModel(api_root=server.url)
+    model.scheduler = RequestScheduler(rate=qps, burst=qps, base_delay=0.05)
+    return model
+
+
+def measure(
+    name: str,
+    server: FakeCalendarServer,
+    repeat: int,
+    setup: Callable[[], Any],
+    run: Callable[[Any], int],
+) -> Dict[str, Any]:
+    """
+    Time ``run(setup())`` ``repeat`` times; ``run`` returns the item count.
+
+    Only ``run`` is timed. HTTP requests are counted on the server.
+    """
+    timings: List[float] = []
+    items = 0
+    requests = 0
+    for _ in range(repeat):
+        state = setup()
+        before = server.stats()["requests"]
+        started = time.perf_counter()
+        items = run(state)
+        timings.append(time.perf_counter() - started)
+        requests = server.stats()["requests"] - before
+
+    median = statistics.median(timings)
+    return {
+        "name": name,
+        "median": median,
+        "best": min(timings),
+        "items": items,
+        "rate": items / median if median else 0.0,
+        "requests": requests,
+    }
+
+
+def run_benchmarks(args) -> List[Dict[str, Any]]:
+    server = FakeCalendarServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    now = datetime.now(timezone.utc)
+    lookback = timedelta(days=GoogleCalendarModel.SYNC_LOOKBACK_DAYS)
+    for event in generate_events(args.events, now - lookback, 120, seed=args.seed):
+        server.put_event("primary", event)
+    for index in range(1, args.calendars):
+        calendar_id = f"calendar{index}@example.com"
+        server.add_calendar(calendar_id)
+        for event in generate_events(
+            args.events // args.calendars, now - lookback, 120, seed=index
+        ):
+            server.put_event(calendar_id, event)
+
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    month_end = (month_start + timedelta(days=32)).replace(day=1)
+    results = []
+
+    def synced_model():
+        model = make_model(server, args.qps)
+        model.sync_events("primary")
+        return model
+
+    def change_events(model):
+        # Another client edits a few events between two syncs
+        for event in server.events("primary")[: args.changes]:
+            server.put_event("primary", {**event, "summary": "Changed"})
+        return model
+
+    def month_list(model):
+        return len(
+            model.get_events(
+                start_date=month_start.isoformat(),
+                end_date=month_end.isoformat(),
+                max_results=None,
+                detail="summary",
+            )
+        )
+
+    def listed_model():
+        model = make_model(server, args.qps)
+        month_list(model)
+        return model
+
+    def batch_create(model):
+        results = model.batch_create_events(
+            [
+                {
+                    "title": f"Benchmark {index}",
+                    "start_time": now + timedelta(hours=index),
+                    "end_time": now + timedelta(hours=index, minutes=30),
+                }
+                for index in range(args.batch)
+            ]
+        )
+        return sum(result["success"] for result in results)
+
+    ics_dir = tempfile.TemporaryDirectory()
+    ics_path = os.path.join(ics_dir.name, "benchmark.ics")
+    imports = iter(range(1, 1_000_000))
+
+    def export_ics(model):
+        return model.export_ics(
+            ics_path,
+            "primary",
+            (now - lookback).isoformat(),
+            (now + timedelta(days=120)).isoformat(),
+        )["exported"]
+
+    def import_target():
+        # A new calendar every time, so no event is a duplicate
+        calendar_id = f"import{next(imports)}@example.com"
+        server.add_calendar(calendar_id)
+        return make_model(server, args.qps), calendar_id
+
+    def import_ics(state):
+        model, calendar_id = state
+        return model.import_ics(ics_path, calendar_id)["imported"]
+
+    def multi_calendar(model):
+        calendar = AsyncGoogleCalendarModel(model)
+        try:
+            return len(
+                asyncio.run(calendar.get_synced_events_multi(month_start, month_end))
+            )
+        finally:
+            calendar.shutdown()
+
+    with server, ics_dir:
+        results.append(
+            measure(
+                "full sync",
+                server,
+                args.repeat,
+                lambda: make_model(server, args.qps),
+                lambda model: model.sync_events("primary")["changed"],
+            )
+        )
+        results.append(
+            measure(
+                "incremental sync, no changes",
+                server,
+                args.repeat,
+                synced_model,
+                lambda model: model.sync_events("primary")["changed"],
+            )
+        )
+        results.append(
+            measure(
+                f"incremental sync, {args.changes} changes",
+                server,
+                args.repeat,
+                lambda: change_events(synced_model()),
+                lambda model: model.sync_events("primary")["changed"],
+            )
+        )
+        results.append(
+            measure(
+                "month list",
+                server,
+                args.repeat,
+                lambda: make_model(server, args.qps),
+                month_list,
+            )
+        )
+        results.append(
+            measure(
+                "month list, revalidated (304)",
+                server,
+                args.repeat,
+                listed_model,
+                month_list,
+            )
+        )
+        results.append(
+            measure(
+                f"batch create {args.batch}",
+                server,
+                args.repeat,
+                lambda: make_model(server, args.qps),
+                batch_create,
+            )
+        )
+        results.append(
+            measure(
+                f"month, {args.calendars} calendars concurrently",
+                server,
+                args.repeat,
+                lambda: make_model(server, args.qps),
+                multi_calendar,
+            )
+        )
+        results.append(
+            measure(
+                "ics export (streamed pages)",
+                server,
+                args.repeat,
+                lambda: make_model(server, args.qps),
+                export_ics,
+            )
+        )
+        results.append(
+            measure(
+                "ics import (chunked batches)",
+                server,
+                args.repeat,
+                import_target,
+                import_ics,
+            )
+        )
+
+    return results
+
+
+def print_results(results: List[Dict[str, Any]]):
+    print(
+        f"{'benchmark':<38} {'median':>9} {'best':>9} {'items':>7} "
+        f"{'items/s':>10} {'requests':>9}"
+    )
+    print("-" * 87)
+    for result in results:
+        print(
+            f"{result['name']:<38} {result['median'] * 1000:>7.1f}ms "
+            f"{result['best'] * 1000:>7.1f}ms {result['items']:>7} "
+            f"{result['rate']:>10.0f} {result['requests']:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--events", type=int, default=2000, help="events to seed")
+    parser.add_argument("--calendars", type=int, default=3)
+    parser.add_argument("--changes", type=int, default=25)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="seconds per request"
+    )
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--qps", type=float, default=1000.0, help="client rate limit")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("⏱️  Calendar sync benchmark")
+    print(
+        f"   {args.events} events, {args.calendars} calendars, "
+        f"{args.latency * 1000:.0f}ms latency, {args.error_rate:.0%} errors\n"
+    )
+    print_results(run_benchmarks(args))
+
+
+if __name__ == "__main__":
+    main()
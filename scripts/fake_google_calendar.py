@@ -0,0 +1,937 @@
+#!/usr/bin/env python3
+"""
+Fake Google Calendar Server
+
+A local stand-in for the Google Calendar v3 REST API, for exercising
+GoogleCalendarModel without a Google account and for reproducible offline
+benchmarks (see benchmark_sync.py).
+
+Run it standalone and point the app at it:
+
+    python -m scripts.fake_google_calendar --port 8088 --events 500
+    GOOGLE_CALENDAR_API_ROOT=http://127.0.0.1:8088 python main.py
+
+or start it in-process:
+
+    with FakeCalendarServer(latency=0.05) as server:
+        model = GoogleCalendarModel(api_root=server.url)
+"""
+
+import argparse
+import email.parser
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from calendar_assistant.models.push_notifications import FakeNotifier
+from calendar_assistant.models.recurrence import RecurringSeries
+
+# (status, headers, body) of one API response
+Response = Tuple[int, Dict[str, str], bytes]
+
+# Google's error "reason" for the statuses the fake can return
+ERROR_REASONS = {
+    400: "badRequest",
+    403: "forbidden",
+    404: "notFound",
+    409: "duplicate",
+    410: "deleted",
+    412: "conditionNotMet",
+    429: "rateLimitExceeded",
+    500: "internalError",
+    503: "backendError",
+}
+
+# Client-assigned event IDs must use base32hex characters
+EVENT_ID_PATTERN = re.compile(r"^[a-v0-9]{5,1024}$")
+
+
+class FakeCalendarServer:
+    """
+    In-memory Calendar v3 API served over HTTP on a background thread.
+
+    Supports what GoogleCalendarModel uses: the calendar list, event
+    list/get/insert/update/patch/delete/quickAdd, freebusy, watch channels
+    and the batch endpoint. Event lists honour timeMin/timeMax, orderBy,
+    maxResults with page tokens, and sync tokens: every write bumps a
+    change sequence, deletes leave "cancelled" tombstones, and a sync token
+    returns everything changed after it. Reads carry ETags and answer
+    ``If-None-Match`` with 304. Field masks (``fields=``) are accepted but
+    full resources are always returned. Recurring masters (events with
+    ``recurrence``) are listed as they are, or expanded into instances with
+    ``singleEvents=true``; stored exception events replace the instances
+    with their IDs.
+
+    ``latency`` (plus up to ``jitter``) seconds are added to every HTTP
+    request, and ``error_rate`` of API calls fail with ``error_status``;
+    ``inject_errors`` queues deterministic failures. Pass ``seed`` to make
+    the random parts reproducible.
+    """
+
+    API_PREFIX = "/calendar/v3"
+    BATCH_PATH = "/batch/calendar/v3"
+    PRIMARY_ID = "primary@example.com"
+    DEFAULT_PAGE_SIZE = 250
+    MAX_PAGE_SIZE = 2500
+    MAX_BATCH_SIZE = 50
+    # How far open-ended listings expand recurring series
+    EXPANSION_HORIZON = timedelta(days=730)
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+
+        self._lock = threading.RLock()
+        self._calendars: Dict[str, Dict[str, Any]] = {}
+        self._events: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Change sequence number of every stored event, for sync tokens
+        self._event_seqs: Dict[str, Dict[str, int]] = {}
+        self._seq = 0
+        # Bumped by expire_sync_tokens; tokens from older generations get 410
+        self._token_generation = 0
+        self._channels: Dict[str, Dict[str, Any]] = {}
+        self._injected: List[Dict[str, Any]] = []
+        self._stats = {
+            "requests": 0,
+            "api_calls": 0,
+            "batches": 0,
+            "not_modified": 0,
+            "errors": 0,
+        }
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.add_calendar(self.PRIMARY_ID, summary="Primary", primary=True)
+
+    @property
+    def url(self) -> str:
+        """API root to pass to ``GoogleCalendarModel(api_root=...)``."""
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self) -> "FakeCalendarServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Start serving on a background thread."""
+        if self._server is not None:
+            return
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, like the real API, so clients reuse connections
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this,
+            # Nagle's algorithm adds ~40ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def _dispatch(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, headers, payload = fake.handle_http(
+                    self.command, self.path, dict(self.headers.items()), body
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        # Port 0 picks a free port; report the real one
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-calendar", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+    # Test and benchmark controls (no latency or injected errors)
+
+    def add_calendar(
+        self,
+        calendar_id: str,
+        summary: Optional[str] = None,
+        primary: bool = False,
+        time_zone: str = "UTC",
+        selected: bool = True,
+    ) -> Dict[str, Any]:
+        """Add a calendar to the user's calendar list."""
+        with self._lock:
+            calendar = {
+                "kind": "calendar#calendarListEntry",
+                "id": calendar_id,
+                "summary": summary or calendar_id,
+                "timeZone": time_zone,
+                "accessRole": "owner",
+                "backgroundColor": "#9fe1e7",
+                "selected": selected,
+                "primary": primary,
+            }
+            self._calendars[calendar_id] = calendar
+            self._events.setdefault(calendar_id, {})
+            self._event_seqs.setdefault(calendar_id, {})
+            return calendar
+
+    def put_event(self, calendar_id: str, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert or replace an event, as if changed by another client."""
+        with self._lock:
+            calendar_id = self._resolve(calendar_id)
+            resource = dict(resource)
+            resource.setdefault("id", uuid.uuid4().hex)
+            return self._store(calendar_id, resource)
+
+    def remove_event(self, calendar_id: str, event_id: str) -> bool:
+        """Delete an event, as if deleted by another client."""
+        with self._lock:
+            calendar_id = self._resolve(calendar_id)
+            event = self._events.get(calendar_id, {}).get(event_id)
+            if event is None or event["status"] == "cancelled":
+                return False
+            self._cancel(calendar_id, event)
+            return True
+
+    def events(self, calendar_id: str = "primary") -> List[Dict[str, Any]]:
+        """Copies of a calendar's live (not cancelled) events."""
+        with self._lock:
+            calendar_id = self._resolve(calendar_id)
+            return [
+                dict(event)
+                for event in self._events.get(calendar_id, {}).values()
+                if event["status"] != "cancelled"
+            ]
+
+    def inject_errors(
+        self,
+        status: int,
+        count: int = 1,
+        path: str = "",
+        reason: Optional[str] = None,
+    ):
+        """Fail the next ``count`` API calls whose path contains ``path``."""
+        with self._lock:
+            self._injected.append(
+                {
+                    "status": status,
+                    "remaining": count,
+                    "path": path,
+                    "reason": reason or ERROR_REASONS.get(status, "unknown"),
+                }
+            )
+
+    def expire_sync_tokens(self):
+        """Invalidate every sync token issued so far (next use gets 410)."""
+        with self._lock:
+            self._token_generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for HTTP requests, API calls, batches, 304s and errors."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self):
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+    # Request handling
+
+    def handle_http(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Response:
+        """Handle one HTTP request (a single API call or a batch)."""
+        self._count("requests")
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+        path = urlsplit(target).path
+        if path == self.BATCH_PATH and method == "POST":
+            self._count("batches")
+            return self._handle_batch(headers, body)
+        return self.handle_call(method, target, headers, body)
+
+    def handle_call(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Response:
+        """Handle one API call, whether sent on its own or inside a batch."""
+        self._count("api_calls")
+        parts = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        headers = {name.lower(): value for name, value in headers.items()}
+
+        injected = self._injected_error(parts.path)
+        if injected is not None:
+            return injected
+
+        if not parts.path.startswith(self.API_PREFIX + "/"):
+            return _error(404, "Not Found")
+
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return _error(400, "Parse Error")
+
+        route = parts.path[len(self.API_PREFIX) :]
+        segments = [unquote(segment) for segment in route.strip("/").split("/")]
+        try:
+            with self._lock:
+                status, result = self._route(method, segments, query, data)
+        except _ApiError as e:
+            return _error(e.status, e.message, e.reason)
+
+        if status == 204:
+            return 204, {}, b""
+
+        etag = result.get("etag", "")
+        if etag and method == "GET" and headers.get("if-none-match") == etag:
+            self._count("not_modified")
+            return 304, {"ETag": etag}, b""
+
+        response_headers = {"Content-Type": "application/json; charset=UTF-8"}
+        if etag:
+            response_headers["ETag"] = etag
+        return status, response_headers, json.dumps(result).encode("utf-8")
+
+    def _route(
+        self,
+        method: str,
+        segments: List[str],
+        query: Dict[str, str],
+        data: Dict[str, Any],
+    ) -> Tuple[int, Dict[str, Any]]:
+        if segments == ["users", "me", "calendarList"] and method == "GET":
+            return 200, self._list_calendars()
+        if segments == ["freeBusy"] and method == "POST":
+            return 200, self._free_busy(data)
+        if segments == ["channels", "stop"] and method == "POST":
+            if self._channels.pop(data.get("id", ""), None) is None:
+                raise _ApiError(404, "Channel not found")
+            return 204, {}
+
+        if len(segments) < 3 or segments[0] != "calendars" or segments[2] != "events":
+            raise _ApiError(404, "Not Found")
+        calendar_id = self._resolve(segments[1])
+        if calendar_id not in self._calendars:
+            raise _ApiError(404, "Not Found")
+
+        if len(segments) == 3:
+            if method == "GET":
+                return 200, self._list_events(calendar_id, query)
+            if method == "POST":
+                return 200, self._insert_event(calendar_id, data)
+        elif len(segments) == 4 and method == "POST":
+            if segments[3] == "quickAdd":
+                return 200, self._quick_add(calendar_id, query.get("text", ""))
+            if segments[3] == "watch":
+                return 200, self._watch(calendar_id, data)
+        elif len(segments) == 4:
+            return self._event_call(method, calendar_id, segments[3], data)
+
+        raise _ApiError(404, "Not Found")
+
+    def _list_calendars(self) -> Dict[str, Any]:
+        items = [dict(calendar) for calendar in self._calendars.values()]
+        return _with_etag({"kind": "calendar#calendarList", "items": items})
+
+    def _list_events(self, calendar_id: str, query: Dict[str, str]) -> Dict[str, Any]:
+        events = self._events[calendar_id]
+        seqs = self._event_seqs[calendar_id]
+
+        page_token = query.get("pageToken")
+        offset, snapshot = _parse_page_token(page_token) if page_token else (0, None)
+        if offset is None:
+            raise _ApiError(400, "Invalid page token")
+
+        single_events = query.get("singleEvents") == "true"
+        time_min = time_max = None
+        sync_token = query.get("syncToken")
+        if sync_token:
+            for param in ("timeMin", "timeMax", "orderBy", "updatedMin", "q"):
+                if param in query:
+                    raise _ApiError(400, f"syncToken cannot be combined with {param}")
+            since = self._parse_sync_token(sync_token)
+            if since is None:
+                raise _ApiError(
+                    410, "Sync token is no longer valid", "fullSyncRequired"
+                )
+            items = [event for event in events.values() if seqs[event["id"]] > since]
+        else:
+            show_deleted = query.get("showDeleted") == "true"
+            time_min = _parse_time(query.get("timeMin"))
+            time_max = _parse_time(query.get("timeMax"))
+            items = []
+            for event in events.values():
+                if event["status"] == "cancelled" and not show_deleted:
+                    # Google always lists the cancelled instances of a live
+                    # series, unless it is expanding the series itself
+                    master = events.get(event.get("recurringEventId", ""))
+                    if single_events or not master or master["status"] == "cancelled":
+                        continue
+                if event.get("recurrence"):
+                    if _recurs_between(event, time_min, time_max):
+                        items.append(event)
+                    continue
+                start, end = _event_bounds(event)
+                if time_min and end is not None and end <= time_min:
+                    continue
+                if time_max and start is not None and start >= time_max:
+                    continue
+                items.append(event)
+
+        # Pages after the first only show events as of the first page, so a
+        # listing that races with writes neither skips nor repeats events.
+        snapshot = self._seq if snapshot is None else snapshot
+        items = [event for event in items if seqs[event["id"]] <= snapshot]
+        if single_events:
+            items = self._expand_recurring(items, events, time_min, time_max)
+
+        if query.get("orderBy") == "startTime":
+            if not single_events:
+                raise _ApiError(400, "orderBy=startTime requires singleEvents")
+            items.sort(key=lambda event: _event_bounds(event)[0] or _EARLIEST)
+        else:
+            # Instances sort with their master
+            items.sort(
+                key=lambda event: seqs.get(event["id"])
+                or seqs[event["recurringEventId"]]
+            )
+
+        page_size = int(query.get("maxResults", self.DEFAULT_PAGE_SIZE))
+        page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        page = items[offset : offset + page_size]
+
+        response = {
+            "kind": "calendar#events",
+            "summary": self._calendars[calendar_id]["summary"],
+            "timeZone": self._calendars[calendar_id]["timeZone"],
+            "items": [dict(event) for event in page],
+        }
+        if offset + page_size < len(items):
+            response["nextPageToken"] = f"p{offset + page_size}.{snapshot}"
+        else:
+            response["nextSyncToken"] = f"s{self._token_generation}.{snapshot}"
+        return _with_etag(response)
+
+    def _expand_recurring(
+        self,
+        items: List[Dict[str, Any]],
+        events: Dict[str, Dict[str, Any]],
+        time_min: Optional[datetime],
+        time_max: Optional[datetime],
+    ) -> List[Dict[str, Any]]:
+        """Replace recurring masters with their instances, as singleEvents does."""
+        expanded = []
+        for event in items:
+            if not event.get("recurrence") or event["status"] == "cancelled":
+                expanded.append(event)
+                continue
+
+            window_start = time_min or _event_bounds(event)[0]
+            window_end = time_max or window_start + self.EXPANSION_HORIZON
+            time_zone = event["start"].get("timeZone")
+            series = RecurringSeries.from_google(event)
+            for instance in series.expand(window_start, window_end):
+                if instance.id in events:
+                    # Edited, moved or cancelled: stored as its own event
+                    continue
+                if instance.all_day:
+                    start = {"date": f"{instance.start:%Y-%m-%d}"}
+                    end = {"date": f"{instance.end:%Y-%m-%d}"}
+                else:
+                    start = {"dateTime": _format_time(instance.start)}
+                    end = {"dateTime": _format_time(instance.end)}
+                    if time_zone:
+                        start["timeZone"] = end["timeZone"] = time_zone
+                resource = {
+                    key: value for key, value in event.items() if key != "recurrence"
+                }
+                resource.update(
+                    id=instance.id,
+                    recurringEventId=event["id"],
+                    originalStartTime=dict(start),
+                    start=start,
+                    end=end,
+                )
+                expanded.append(resource)
+        return expanded
+
+    def _event_call(
+        self, method: str, calendar_id: str, event_id: str, data: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, Any]]:
+        event = self._events[calendar_id].get(event_id)
+        if event is None:
+            raise _ApiError(404, "Not Found")
+
+        if method == "GET":
+            return 200, dict(event)
+        if event["status"] == "cancelled":
+            raise _ApiError(
+                410 if method == "DELETE" else 404, "Resource has been deleted"
+            )
+
+        if method == "DELETE":
+            self._cancel(calendar_id, event)
+            return 204, {}
+        if method == "PUT":
+            return 200, self._store(calendar_id, {**data, "id": event_id}, event)
+        if method == "PATCH":
+            return 200, self._store(
+                calendar_id, {**event, **data, "id": event_id}, event
+            )
+        raise _ApiError(404, "Not Found")
+
+    def _insert_event(self, calendar_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        event_id = data.get("id") or uuid.uuid4().hex
+        if not EVENT_ID_PATTERN.match(event_id):
+            raise _ApiError(400, "Invalid resource id value")
+        if event_id in self._events[calendar_id]:
+            raise _ApiError(409, "The requested identifier already exists")
+        if "start" not in data or "end" not in data:
+            raise _ApiError(400, "Missing end time")
+        return self._store(calendar_id, {**data, "id": event_id})
+
+    def _quick_add(self, calendar_id: str, text: str) -> Dict[str, Any]:
+        if not text:
+            raise _ApiError(400, "Required parameter: text")
+        start = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        ) + timedelta(hours=1)
+        return self._store(
+            calendar_id,
+            {
+                "id": uuid.uuid4().hex,
+                "summary": text,
+                "start": {"dateTime": _format_time(start)},
+                "end": {"dateTime": _format_time(start + timedelta(hours=1))},
+            },
+        )
+
+    def _watch(self, calendar_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data.get("id") or not data.get("address"):
+            raise _ApiError(400, "Channel id and address are required")
+        ttl = int(data.get("params", {}).get("ttl", 7 * 24 * 3600))
+        expiration = int((time.time() + ttl) * 1000)
+        channel = {
+            "kind": "api#channel",
+            "id": data["id"],
+            "resourceId": hashlib.sha1(calendar_id.encode("utf-8")).hexdigest()[:20],
+            "resourceUri": f"{self.url}{self.API_PREFIX}/calendars/{calendar_id}/events",
+            "expiration": str(expiration),
+        }
+        self._channels[data["id"]] = {
+            **channel,
+            "calendar_id": calendar_id,
+            "address": data["address"],
+            "token": data.get("token", ""),
+        }
+        return channel
+
+    def _free_busy(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        time_min = _parse_time(data.get("timeMin"))
+        time_max = _parse_time(data.get("timeMax"))
+        if time_min is None or time_max is None:
+            raise _ApiError(400, "timeMin and timeMax are required")
+
+        calendars = {}
+        for item in data.get("items", []):
+            calendar_id = self._resolve(item.get("id", ""))
+            if calendar_id not in self._calendars:
+                calendars[item.get("id", "")] = {
+                    "busy": [],
+                    "errors": [{"domain": "global", "reason": "notFound"}],
+                }
+                continue
+
+            busy = []
+            for event in self._events[calendar_id].values():
+                if event["status"] == "cancelled" or event.get("transparency") == (
+                    "transparent"
+                ):
+                    continue
+                start, end = _event_bounds(event)
+                if start is None or end is None or end <= time_min or start >= time_max:
+                    continue
+                busy.append(
+                    {
+                        "start": _format_time(max(start, time_min)),
+                        "end": _format_time(min(end, time_max)),
+                    }
+                )
+            busy.sort(key=lambda interval: interval["start"])
+            calendars[item.get("id", "")] = {"busy": busy}
+
+        return {
+            "kind": "calendar#freeBusy",
+            "timeMin": data["timeMin"],
+            "timeMax": data["timeMax"],
+            "calendars": calendars,
+        }
+
+    def _handle_batch(self, headers: Dict[str, str], body: bytes) -> Response:
+        """Run every call of a multipart/mixed batch and answer in kind."""
+        content_type = next(
+            (v for k, v in headers.items() if k.lower() == "content-type"), ""
+        )
+        if not content_type.startswith("multipart/mixed"):
+            return _error(400, "Batch requests must be multipart/mixed")
+
+        message = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body
+        )
+        parts = message.get_payload()
+        if not isinstance(parts, list) or not parts:
+            return _error(400, "Empty batch")
+        if len(parts) > self.MAX_BATCH_SIZE:
+            return _error(400, "Too many requests in batch")
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        chunks = []
+        for part in parts:
+            method, target, call_headers, call_body = _parse_http_part(
+                part.get_payload()
+            )
+            status, response_headers, payload = self.handle_call(
+                method, target, call_headers, call_body
+            )
+
+            lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+            lines += [f"{name}: {value}" for name, value in response_headers.items()]
+            lines.append(f"Content-Length: {len(payload)}")
+            content_id = part.get("Content-ID", "<>")[1:-1]
+            chunks.append(
+                (
+                    f"--{boundary}\r\n"
+                    "Content-Type: application/http\r\n"
+                    f"Content-ID: <response-{content_id}>\r\n\r\n"
+                    + "\r\n".join(lines)
+                    + "\r\n\r\n"
+                ).encode("utf-8")
+                + payload
+                + b"\r\n"
+            )
+        chunks.append(f"--{boundary}--\r\n".encode("utf-8"))
+
+        return (
+            200,
+            {"Content-Type": f"multipart/mixed; boundary={boundary}"},
+            b"".join(chunks),
+        )
+
+    # Storage
+
+    def _resolve(self, calendar_id: str) -> str:
+        return self.PRIMARY_ID if calendar_id == "primary" else calendar_id
+
+    def _store(
+        self,
+        calendar_id: str,
+        resource: Dict[str, Any],
+        previous: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Save an event as a new change and return a copy of it."""
+        self._seq += 1
+        now = _format_time(datetime.now(timezone.utc))
+        event = {
+            # A cancelled instance of a recurring event may be stored directly
+            "status": "confirmed",
+            **resource,
+            "kind": "calendar#event",
+            "etag": f'"{self._seq}"',
+            "htmlLink": f"{self.url}/event?eid={resource['id']}",
+            "created": previous["created"] if previous else now,
+            "updated": now,
+        }
+        self._events[calendar_id][event["id"]] = event
+        self._event_seqs[calendar_id][event["id"]] = self._seq
+        self._notify_watchers(calendar_id)
+        return dict(event)
+
+    def _cancel(self, calendar_id: str, event: Dict[str, Any]):
+        """Replace an event with the tombstone sync tokens report."""
+        self._seq += 1
+        self._events[calendar_id][event["id"]] = {
+            "kind": "calendar#event",
+            "id": event["id"],
+            "status": "cancelled",
+            "etag": f'"{self._seq}"',
+            "created": event.get("created", ""),
+            "updated": _format_time(datetime.now(timezone.utc)),
+        }
+        self._event_seqs[calendar_id][event["id"]] = self._seq
+        self._notify_watchers(calendar_id)
+
+    def _parse_sync_token(self, token: str) -> Optional[int]:
+        """Change sequence a sync token was issued at, or None if expired."""
+        match = re.fullmatch(r"s(\d+)\.(\d+)", token)
+        if not match or int(match.group(1)) != self._token_generation:
+            return None
+        return int(match.group(2))
+
+    def _notify_watchers(self, calendar_id: str):
+        """Send a push notification to every channel watching the calendar."""
+        for channel in self._channels.values():
+            if channel["calendar_id"] != calendar_id:
+                continue
+            threading.Thread(
+                target=_deliver,
+                args=(
+                    channel["address"],
+                    {
+                        "id": channel["id"],
+                        "resource_id": channel["resourceId"],
+                        "token": channel["token"],
+                    },
+                ),
+                daemon=True,
+            ).start()
+
+    def _injected_error(self, path: str) -> Optional[Response]:
+        with self._lock:
+            for injected in self._injected:
+                if injected["path"] in path:
+                    injected["remaining"] -= 1
+                    if injected["remaining"] <= 0:
+                        self._injected.remove(injected)
+                    self._stats["errors"] += 1
+                    return _error(
+                        injected["status"], "Injected error", injected["reason"]
+                    )
+
+            if self.error_rate and self._random.random() < self.error_rate:
+                self._stats["errors"] += 1
+                return _error(self.error_status, "Injected error")
+        return None
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, message: str, reason: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.reason = reason or ERROR_REASONS.get(status, "unknown")
+
+
+_EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _error(status: int, message: str, reason: Optional[str] = None) -> Response:
+    """A Google-style JSON error response."""
+    reason = reason or ERROR_REASONS.get(status, "unknown")
+    body = {
+        "error": {
+            "code": status,
+            "message": message,
+            "errors": [{"domain": "global", "reason": reason, "message": message}],
+        }
+    }
+    return (
+        status,
+        {"Content-Type": "application/json; charset=UTF-8"},
+        json.dumps(body).encode("utf-8"),
+    )
+
+
+def _with_etag(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Add an ETag derived from the response content."""
+    digest = hashlib.sha1(
+        json.dumps(response, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return {**response, "etag": f'"{digest[:16]}"'}
+
+
+def _parse_page_token(token: str) -> Tuple[Optional[int], Optional[int]]:
+    match = re.fullmatch(r"p(\d+)\.(\d+)", token)
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 3339 timestamp (or a date) into an aware datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise _ApiError(400, f"Bad time value: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _format_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _event_bounds(
+    event: Dict[str, Any],
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Start and end of an event; all-day dates are taken as UTC midnight."""
+    bounds = []
+    for key in ("start", "end"):
+        value = event.get(key, {})
+        bounds.append(_parse_time(value.get("dateTime") or value.get("date")))
+    return bounds[0], bounds[1]
+
+
+def _recurs_between(
+    event: Dict[str, Any], time_min: Optional[datetime], time_max: Optional[datetime]
+) -> bool:
+    """Whether a recurring master has an instance overlapping the window."""
+    start, _ = _event_bounds(event)
+    if time_max and start is not None and start >= time_max:
+        return False
+    if time_min is None:
+        return True
+    window_end = time_max or time_min + FakeCalendarServer.EXPANSION_HORIZON
+    series = RecurringSeries.from_google(event)
+    return next(series.expand(time_min, window_end), None) is not None
+
+
+def _parse_http_part(text: str) -> Tuple[str, str, Dict[str, str], bytes]:
+    """Split one application/http batch part into method, target, headers, body."""
+    request_line, _, rest = text.lstrip().partition("\n")
+    method, target, _ = request_line.strip().split(" ", 2)
+    message = email.parser.Parser().parsestr(rest)
+    body = message.get_payload() or ""
+    return method, target, dict(message.items()), body.encode("utf-8")
+
+
+def _deliver(address: str, channel: Dict[str, Any]):
+    try:
+        FakeNotifier(address).notify(channel)
+    except OSError:
+        # Nobody listening; a real channel would just drop the message too
+        pass
+
+
+def generate_events(
+    count: int,
+    start: datetime,
+    days: int,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    ``count`` events spread over ``days`` days from ``start``, for seeding.
+
+    About one in ten is all-day; the rest start on a quarter hour between
+    07:00 and 19:00 UTC and last 30 to 120 minutes.
+    """
+    rng = random.Random(seed)
+    start = start.astimezone(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    events = []
+    for index in range(count):
+        day = start + timedelta(days=rng.randrange(days))
+        event = {
+            "id": f"seed{index:06d}",
+            "summary": f"Event {index}",
+            "location": rng.choice(["", "Office", "Room 4", "Online"]),
+            "description": "Generated by the fake calendar server",
+        }
+        if rng.random() < 0.1:
+            event["start"] = {"date": day.date().isoformat()}
+            event["end"] = {"date": (day + timedelta(days=1)).date().isoformat()}
+        else:
+            event_start = day + timedelta(minutes=7 * 60 + 15 * rng.randrange(48))
+            event_end = event_start + timedelta(minutes=30 * rng.randint(1, 4))
+            event["start"] = {"dateTime": _format_time(event_start)}
+            event["end"] = {"dateTime": _format_time(event_end)}
+        events.append(event)
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--events", type=int, default=200, help="events to seed")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds per request"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="extra random seconds"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeCalendarServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    now = datetime.now(timezone.utc)
+    for event in generate_events(
+        args.events, now - timedelta(days=30), 90, seed=args.seed
+    ):
+        server.put_event("primary", event)
+
+    server.start()
+    print(f"🧪 Fake Google Calendar API at {server.url}")
+    print(f"   GOOGLE_CALENDAR_API_ROOT={server.url} python main.py")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
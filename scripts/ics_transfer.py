@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+iCalendar Import/Export
+
+Streams events between .ics files and Google Calendar through the batch
+endpoint and reports the throughput.
+
+    python -m scripts.ics_transfer import holidays.ics
+    python -m scripts.ics_transfer export backup.ics --start 2025-01-01 --end 2025-12-31
+
+Set GOOGLE_CALENDAR_API_ROOT to run against the fake server instead.
+"""
+
+import argparse
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from calendar_assistant.models.google_calendar_model import GoogleCalendarModel
+from calendar_assistant.models.timezone_service import timezone_service
+
+
+def import_file(model: GoogleCalendarModel, args):
+    print(f"📥 Importing {args.path} into {args.calendar}...")
+    result = model.import_ics(args.path, args.calendar, args.chunk_size)
+    print(
+        f"✓ Imported {result['imported']} events in {result['seconds']:.1f}s "
+        f"({result['events_per_sec']:.0f} events/sec)"
+    )
+    if result["duplicates"]:
+        print(f"   Skipped {result['duplicates']} events that already exist")
+    if result["failed"]:
+        print(f"✗ {result['failed']} events failed, e.g.:")
+        for error in result["errors"]:
+            print(f"   - {error}")
+
+
+def export_range(start_arg: Optional[str] = None, end_arg: Optional[str] = None):
+    """
+    The [start, end) range to export. An --end given as a date includes
+    that whole day, as export_google_calendar_ics treats its end date.
+    """
+    start = timezone_service.localize(
+        datetime.fromisoformat(start_arg) if start_arg else timezone_service.now()
+    )
+    if not end_arg:
+        return start, start + timedelta(days=365)
+    try:
+        last_day = date.fromisoformat(end_arg)
+    except ValueError:
+        # A date and time: export up to that moment
+        return start, timezone_service.localize(datetime.fromisoformat(end_arg))
+    return start, timezone_service.localize(
+        datetime.combine(last_day + timedelta(days=1), time())
+    )
+
+
+def export_file(model: GoogleCalendarModel, args):
+    start, end = export_range(args.start, args.end)
+    last = end - timedelta(microseconds=1)
+    print(f"📤 Exporting {args.calendar} from {start:%Y-%m-%d} to {last:%Y-%m-%d}...")
+    result = model.export_ics(
+        args.path, args.calendar, start.isoformat(), end.isoformat()
+    )
+    print(
+        f"✓ Exported {result['exported']} events to {args.path} in "
+        f"{result['seconds']:.1f}s ({result['events_per_sec']:.0f} events/sec)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("action", choices=["import", "export"])
+    parser.add_argument("path", help=".ics file to read or write")
+    parser.add_argument("--calendar", default="primary", help="calendar ID")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=GoogleCalendarModel.IMPORT_CHUNK_SIZE,
+        help="events read before each round of batch requests",
+    )
+    parser.add_argument("--start", help="export from this date (default: now)")
+    parser.add_argument("--end", help="export through this date (default: a year on)")
+    args = parser.parse_args()
+
+    model = GoogleCalendarModel()
+    if not model.service:
+        print("✗ Google Calendar service is not available")
+        return
+
+    try:
+        if args.action == "import":
+            import_file(model, args)
+        else:
+            export_file(model, args)
+    finally:
+        model.shutdown()
+
+
+if __name__ == "__main__":
+    main()
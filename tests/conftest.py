@@ -0,0 +1,29 @@
+import os
+
+# Fixed before the app modules read them, so results do not depend on the host
+os.environ.setdefault("CALENDAR_TIMEZONE", "Europe/Stockholm")
+os.environ.setdefault("GOOGLE_CALENDAR_API_ROOT", "")
+
+import pytest
+
+from calendar_assistant.models.google_calendar_model import GoogleCalendarModel
+from calendar_assistant.models.request_scheduler import RequestScheduler
+from scripts.fake_google_calendar import FakeCalendarServer
+
+
+@pytest.fixture
+def fake_server():
+    """A fake Calendar API server, stopped after the test."""
+    with FakeCalendarServer() as server:
+        yield server
+
+
+@pytest.fixture
+def model(fake_server):
+    """A GoogleCalendarModel talking to the fake server without throttling."""
+    calendar_model = GoogleCalendarModel(api_root=fake_server.url)
+    calendar_model.scheduler = RequestScheduler(
+        rate=100000, burst=100000, base_delay=0.01
+    )
+    yield calendar_model
+    calendar_model.shutdown()
@@ -0,0 +1,27 @@
+from datetime import date
+
+from calendar_assistant.models.agent_cache import AgentCache, normalize_request
+
+
+def test_plan_lookup_is_not_a_hit_until_replay_succeeds():
+    cache = AgentCache()
+    day = date(2026, 10, 17)
+    request = normalize_request("What's on today?")
+    cache.put_plan(request, day, [("get_events_tool", {"date": "today"})])
+
+    assert cache.get_plan(request, day) == [("get_events_tool", {"date": "today"})]
+    assert cache.get_stats()["plan_hits"] == 0
+
+    cache.record_plan_hit()
+    assert cache.get_stats()["plan_hits"] == 1
+
+
+def test_answers_are_keyed_on_state_version():
+    cache = AgentCache()
+    day = date(2026, 10, 17)
+    cache.put_answer("what's on today", day, 1, "Nothing today.")
+
+    assert cache.get_answer("what's on today", day, 1) == "Nothing today."
+    assert cache.get_answer("what's on today", day, 2) is None
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
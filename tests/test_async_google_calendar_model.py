@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from calendar_assistant.models.async_google_calendar_model import (
+    AsyncGoogleCalendarModel,
+)
+from scripts.fake_google_calendar import generate_events
+
+
+def test_iter_events_multi_merges_pages_in_start_order(fake_server, model):
+    start = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    fake_server.add_calendar("work@example.com")
+    for index, event in enumerate(generate_events(60, start, days=20, seed=1)):
+        calendar_id = "primary" if index % 2 else "work@example.com"
+        fake_server.put_event(calendar_id, event)
+
+    async def collect():
+        calendar = AsyncGoogleCalendarModel(model)
+        try:
+            return [
+                event
+                async for event in calendar.iter_events_multi(
+                    [fake_server.PRIMARY_ID, "work@example.com"],
+                    chunk_size=7,
+                    start_date=start.isoformat(),
+                    end_date=(start + timedelta(days=30)).isoformat(),
+                    page_size=10,
+                )
+            ]
+        finally:
+            calendar.shutdown()
+
+    events = asyncio.run(collect())
+
+    assert len(events) == 60
+    assert {event.calendar_id for event in events} == {
+        fake_server.PRIMARY_ID,
+        "work@example.com",
+    }
+    starts = [event.sort_key() for event in events]
+    assert starts == sorted(starts)
+
+
+def test_iter_events_multi_stops_fetching_when_closed_early(fake_server, model):
+    start = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    for event in generate_events(50, start, days=10, seed=2):
+        fake_server.put_event("primary", event)
+
+    async def first_event():
+        calendar = AsyncGoogleCalendarModel(model)
+        try:
+            events = calendar.iter_events_multi(
+                ["primary"],
+                chunk_size=5,
+                start_date=start.isoformat(),
+                end_date=(start + timedelta(days=10)).isoformat(),
+                page_size=5,
+            )
+            event = await anext(events)
+            await events.aclose()
+            return event
+        finally:
+            calendar.shutdown()
+
+    fake_server.reset_stats()
+    assert asyncio.run(first_event()) is not None
+    # Only the first page was needed
+    assert fake_server.stats()["api_calls"] == 1
@@ -0,0 +1,122 @@
+import json
+import os
+import stat
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from calendar_assistant.models import credential_manager
+from calendar_assistant.models.credential_manager import CredentialManager
+
+
+def _utcnow():
+    # google-auth keeps expiry as naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class FakeCredentials(Credentials):
+    """Credentials whose refresh hands out a new token without a request."""
+
+    def __init__(self, expires_in: timedelta, fail: bool = False):
+        super().__init__(
+            token="token-0",
+            refresh_token="refresh",
+            token_uri="https://oauth2.example.com/token",
+            client_id="client",
+            client_secret="secret",
+            expiry=_utcnow() + expires_in,
+        )
+        self.fail = fail
+        self.refreshes = 0
+
+    def refresh(self, request):
+        if self.fail:
+            raise RuntimeError("network down")
+        time.sleep(0.05)
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.expiry = _utcnow() + timedelta(hours=1)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    token_file = tmp_path / "token.json"
+    token_file.write_text('{"token": "old"}')
+    return CredentialManager(str(token_file), str(tmp_path / "credentials.json"), [])
+
+
+def _saved_token(manager):
+    with open(manager.token_file) as token:
+        return json.load(token)["token"]
+
+
+def test_refreshes_only_within_the_margin_before_expiry(manager):
+    manager.credentials = FakeCredentials(expires_in=timedelta(minutes=10))
+
+    assert timedelta(minutes=4) < manager.time_to_refresh() <= timedelta(minutes=5)
+    assert manager.refresh() is True
+    assert manager.credentials.refreshes == 0
+    assert _saved_token(manager) == "old"
+
+    manager.credentials.expiry = _utcnow() + manager.REFRESH_MARGIN / 2
+    assert manager.refresh() is True
+    assert manager.credentials.refreshes == 1
+    assert _saved_token(manager) == "token-1"
+
+
+def test_concurrent_callers_share_one_refresh(manager):
+    manager.credentials = FakeCredentials(expires_in=timedelta(minutes=1))
+
+    threads = [threading.Thread(target=manager.refresh) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert manager.credentials.refreshes == 1
+
+
+def test_token_file_is_replaced_atomically(manager, monkeypatch):
+    manager.credentials = FakeCredentials(expires_in=timedelta(0))
+    directory = os.path.dirname(manager.token_file)
+
+    def crash(source, target):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(credential_manager.os, "replace", crash)
+    # A failed save keeps the refreshed token in memory
+    assert manager.refresh() is True
+    assert _saved_token(manager) == "old"
+    assert os.listdir(directory) == ["token.json"]
+
+    monkeypatch.undo()
+    assert manager.refresh(force=True) is True
+    assert _saved_token(manager) == "token-2"
+    assert stat.S_IMODE(os.stat(manager.token_file).st_mode) == 0o600
+    assert os.listdir(directory) == ["token.json"]
+
+
+def test_failed_refresh_is_reported(manager):
+    manager.credentials = FakeCredentials(expires_in=timedelta(0), fail=True)
+
+    assert manager.refresh() is False
+    assert manager.last_error == "network down"
+    assert _saved_token(manager) == "old"
+
+
+def test_background_thread_refreshes_before_expiry(manager):
+    manager.credentials = FakeCredentials(expires_in=timedelta(minutes=2))
+
+    manager.start()
+    try:
+        deadline = time.monotonic() + 5
+        while manager.credentials.refreshes == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        manager.stop()
+
+    assert manager.credentials.refreshes == 1
+    assert manager.time_to_refresh() > timedelta(minutes=50)
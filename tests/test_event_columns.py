@@ -0,0 +1,145 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.event_columns import EventColumns
+from calendar_assistant.models.timezone_service import timezone_service
+
+
+def _random_events(start: datetime, days: int, count: int, seed: int):
+    rng = random.Random(seed)
+    events = []
+    for index in range(count):
+        begin = start + timedelta(minutes=rng.randrange(days * 24 * 60))
+        events.append(
+            CalendarEvent(
+                id=f"event{index}",
+                title=f"Event {index}",
+                start=begin,
+                end=begin + timedelta(minutes=rng.randrange(0, 300)),
+                calendar_id=rng.choice(["primary", "work"]),
+                transparent=rng.random() < 0.2,
+            )
+        )
+    return events
+
+
+def _busy_minutes(events, start: datetime, end: datetime, busy_only=True):
+    """Every busy minute of [start, end) as a POSIX time, one by one."""
+    minutes = set()
+    for event in events:
+        if busy_only and event.transparent:
+            continue
+        # POSIX seconds: aware datetime arithmetic is wall-clock arithmetic
+        begin = int(max(event.start, start).timestamp())
+        finish = int(min(event.end, end).timestamp())
+        minutes.update(range(begin, finish, 60))
+    return minutes
+
+
+# Europe/Stockholm springs forward on March 29th 2026 and falls back on
+# October 25th 2026
+@pytest.mark.parametrize("first_day", [datetime(2026, 3, 27), datetime(2026, 10, 23)])
+def test_busy_hours_match_brute_force_across_dst(first_day):
+    start = timezone_service.localize(first_day)
+    end = start + timedelta(days=5)
+    events = _random_events(start - timedelta(hours=6), 6, 60, seed=first_day.month)
+    # One event through the change itself, 01:30 to 03:30 local time
+    change = timezone_service.localize(
+        first_day + timedelta(days=2, hours=1, minutes=30)
+    )
+    events.append(
+        CalendarEvent(
+            id="change",
+            title="Change",
+            start=change,
+            end=timezone_service.localize(
+                first_day + timedelta(days=2, hours=3, minutes=30)
+            ),
+        )
+    )
+
+    expected = np.zeros((7, 24))
+    for minute in _busy_minutes(events, start, end):
+        local = datetime.fromtimestamp(minute, timezone_service.tz)
+        expected[local.weekday(), local.hour] += 1 / 60
+
+    hourly = EventColumns(events).busy_hours(start, end)
+
+    np.testing.assert_allclose(hourly, expected, atol=1e-9)
+    # Spring forward skips 02:00-03:00 on Sunday; falling back repeats it
+    assert hourly[6, 2] == (0 if first_day.month == 3 else 2)
+
+
+def test_busy_time_and_counts_match_brute_force():
+    start = timezone_service.localize(datetime(2026, 11, 2))
+    end = start + timedelta(days=7)
+    events = _random_events(start - timedelta(days=1), 9, 120, seed=3)
+    columns = EventColumns(events)
+
+    for busy_only in (True, False):
+        assert columns.busy_seconds(start, end, busy_only) == 60 * len(
+            _busy_minutes(events, start, end, busy_only)
+        )
+
+    expected_calendars = {"primary": 0, "work": 0}
+    for event in events:
+        overlap = min(event.end, end) - max(event.start, start)
+        expected_calendars[event.calendar_id] += max(int(overlap.total_seconds()), 0)
+    assert columns.calendar_seconds(start, end) == expected_calendars
+
+    assert columns.count_between(start, end) == sum(
+        event.start < end and (event.end > start or event.start >= start)
+        for event in events
+    )
+
+    first_day = start.date()
+    expected_days = [
+        sum(
+            timezone_service.local_date(event.start) == first_day + timedelta(days=day)
+            for event in events
+        )
+        for day in range(7)
+    ]
+    assert columns.day_counts(first_day, 7).tolist() == expected_days
+
+
+def test_overlapping_events_count_once():
+    start = timezone_service.localize(datetime(2026, 11, 2, 9))
+    events = [
+        CalendarEvent(id="a", title="A", start=start, end=start + timedelta(hours=2)),
+        CalendarEvent(
+            id="b",
+            title="B",
+            start=start + timedelta(hours=1),
+            end=start + timedelta(hours=3),
+        ),
+        # Touching, not overlapping
+        CalendarEvent(
+            id="c",
+            title="C",
+            start=start + timedelta(hours=3),
+            end=start + timedelta(hours=4),
+        ),
+        CalendarEvent(
+            id="d",
+            title="D",
+            start=start + timedelta(hours=5),
+            end=start + timedelta(hours=6),
+            transparent=True,
+        ),
+    ]
+    columns = EventColumns(events)
+    day_end = start + timedelta(hours=15)
+
+    assert columns.busy_seconds(start, day_end) == 4 * 3600
+    assert columns.busy_seconds(start, day_end, busy_only=False) == 5 * 3600
+    stats = columns.busy_stats(start, day_end)
+    assert stats["events"] == 4
+    assert stats["busy_hours"] == 4
+    assert stats["peak_hour"] == (0, 9)
+    assert stats["hourly"][0, 9:13].tolist() == [1, 1, 1, 1]
+    assert stats["hourly"].sum() == 4
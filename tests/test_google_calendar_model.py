@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+from scripts.fake_google_calendar import generate_events
+
+
+def _seed(fake_server, count, start, days=20, calendar_id="primary"):
+    for event in generate_events(count, start, days=days, seed=count):
+        fake_server.put_event(calendar_id, event)
+
+
+def test_get_events_follows_pages(fake_server, model):
+    start = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    _seed(fake_server, 120, start)
+
+    fake_server.reset_stats()
+    events = model.get_events(
+        start_date=start.isoformat(),
+        end_date=(start + timedelta(days=30)).isoformat(),
+        max_results=None,
+        page_size=25,
+    )
+
+    assert len(events) == 120
+    assert len({event.id for event in events}) == 120
+    assert [event.sort_key() for event in events] == sorted(
+        event.sort_key() for event in events
+    )
+    assert fake_server.stats()["api_calls"] == 5
+
+
+def test_unchanged_pages_are_revalidated_with_etags(fake_server, model):
+    start = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    _seed(fake_server, 30, start)
+    query = {
+        "start_date": start.isoformat(),
+        "end_date": (start + timedelta(days=30)).isoformat(),
+        "max_results": None,
+        "page_size": 10,
+    }
+
+    first = model.get_events(**query)
+    fake_server.reset_stats()
+    second = model.get_events(**query)
+
+    assert [event.id for event in second] == [event.id for event in first]
+    assert fake_server.stats()["not_modified"] == 3
+
+    # A change anywhere in the listing makes the pages download again
+    fake_server.remove_event("primary", first[0].id)
+    fake_server.reset_stats()
+    third = model.get_events(**query)
+    assert len(third) == 29
+    assert fake_server.stats()["not_modified"] < 3
+
+
+def test_expired_sync_token_triggers_full_resync(fake_server, model):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    _seed(fake_server, 20, start, days=5)
+
+    assert model.sync_events("primary")["mode"] == "full"
+    first_token = model._sync_tokens["primary"]
+    assert model.sync_events("primary") == {
+        "mode": "incremental",
+        "changed": 0,
+        "deleted": 0,
+    }
+
+    removed = fake_server.events("primary")[0]["id"]
+    fake_server.remove_event("primary", removed)
+    fake_server.expire_sync_tokens()
+    result = model.sync_events("primary")
+
+    assert result["mode"] == "full"
+    assert model._sync_tokens["primary"] != first_token
+    store = model.get_event_store("primary")
+    assert len(store) == 19
+    assert removed not in store
+
+
+def test_batches_are_split_at_fifty_operations(fake_server, model):
+    start = datetime(2026, 3, 2, 9, tzinfo=timezone.utc)
+    events_data = [
+        {
+            "title": f"Event {index}",
+            "start_time": start + timedelta(hours=index),
+            "end_time": start + timedelta(hours=index, minutes=30),
+        }
+        for index in range(120)
+    ]
+
+    fake_server.reset_stats()
+    results = model.batch_create_events(events_data)
+
+    assert all(result["success"] for result in results)
+    assert [result["event"].title for result in results] == [
+        f"Event {index}" for index in range(120)
+    ]
+    stats = fake_server.stats()
+    assert stats["batches"] == 3
+    assert stats["api_calls"] == 120
+    assert len(fake_server.events("primary")) == 120
+
+    fake_server.reset_stats()
+    deleted = model.batch_delete_events([result["event"].id for result in results])
+    assert all(result["success"] for result in deleted)
+    assert fake_server.stats()["batches"] == 3
+    assert fake_server.events("primary") == []
+
+
+def test_synced_events_keep_descriptions_for_the_event_list(fake_server, model):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    _seed(fake_server, 5, start, days=2)
+
+    assert "description" in model._list_fields(model.SYNC_DETAIL)
+    events = model.get_synced_events(
+        start - timedelta(days=1), start + timedelta(days=3)
+    )
+    assert len(events) == 5
+    assert all(event.description for event in events)
@@ -0,0 +1,154 @@
+import io
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.ics import (
+    MAX_LINE_OCTETS,
+    _escape,
+    _fold,
+    _unescape,
+    read_ics,
+    write_ics,
+)
+from calendar_assistant.models.recurrence import RecurringSeries
+from calendar_assistant.models.timezone_service import timezone_service
+
+STOCKHOLM = ZoneInfo("Europe/Stockholm")
+
+
+def _calendar(*events: str) -> io.StringIO:
+    body = "".join(f"BEGIN:VEVENT\r\n{event}END:VEVENT\r\n" for event in events)
+    return io.StringIO(f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n{body}END:VCALENDAR\r\n")
+
+
+def test_overridden_occurrence_is_imported_once(model):
+    override = (
+        "UID:standup\r\n"
+        "RECURRENCE-ID;TZID=Europe/Stockholm:20261109T090000\r\n"
+        "DTSTART;TZID=Europe/Stockholm:20261109T100000\r\n"
+        "DTEND;TZID=Europe/Stockholm:20261109T103000\r\n"
+        "SUMMARY:Standup (moved)\r\n"
+    )
+    master = (
+        "UID:standup\r\n"
+        "DTSTART;TZID=Europe/Stockholm:20261102T090000\r\n"
+        "DTEND;TZID=Europe/Stockholm:20261102T093000\r\n"
+        "RRULE:FREQ=WEEKLY;COUNT=4\r\n"
+        "SUMMARY:Standup\r\n"
+    )
+    single = (
+        "UID:lunch\r\n"
+        "DTSTART;TZID=Europe/Stockholm:20261103T120000\r\n"
+        "DTEND;TZID=Europe/Stockholm:20261103T130000\r\n"
+        "SUMMARY:Lunch\r\n"
+    )
+
+    # The override comes first, as files written by other clients allow
+    events = list(read_ics(_calendar(override, master, single)))
+
+    assert [event["title"] for event in events] == [
+        "Lunch",
+        "Standup",
+        "Standup (moved)",
+    ]
+    _, series_data, moved = events
+    series = RecurringSeries.from_google(model._dict_to_google_event(series_data))
+    window_start = datetime(2026, 11, 1, tzinfo=timezone.utc)
+    starts = [
+        instance.start
+        for instance in series.expand(window_start, window_start + timedelta(days=30))
+    ] + [moved["start_time"]]
+
+    assert sorted(starts) == [
+        datetime(2026, 11, 2, 9, tzinfo=STOCKHOLM),
+        datetime(2026, 11, 9, 10, tzinfo=STOCKHOLM),
+        datetime(2026, 11, 16, 9, tzinfo=STOCKHOLM),
+        datetime(2026, 11, 23, 9, tzinfo=STOCKHOLM),
+    ]
+    assert moved["id"] != series_data["id"]
+
+
+def test_long_lines_fold_at_75_octets_without_splitting_characters():
+    line = "DESCRIPTION:" + "Fika på torget, med kanelbullar och kaffe ☕ " * 4
+
+    folded = _fold(line)
+
+    pieces = folded.split("\r\n")
+    assert all(len(piece.encode("utf-8")) <= MAX_LINE_OCTETS for piece in pieces)
+    assert all(piece.startswith(" ") for piece in pieces[1:])
+    assert "".join(piece[1:] if i else piece for i, piece in enumerate(pieces)) == line
+    assert _fold("SUMMARY:Short") == "SUMMARY:Short"
+
+
+def test_text_escaping_round_trips():
+    text = "Notes; with, commas\\backslashes\nand two\r\nlines"
+
+    escaped = _escape(text)
+
+    assert escaped == "Notes\\; with\\, commas\\\\backslashes\\nand two\\nlines"
+    assert _unescape(escaped) == text.replace("\r\n", "\n")
+    assert _unescape("A\\Nb\\:c") == "A\nb:c"
+
+
+def test_written_events_read_back_unchanged():
+    start = datetime(2026, 11, 2, 9, tzinfo=STOCKHOLM)
+    events = [
+        CalendarEvent(
+            id="abc",
+            title="Planning; Q1, Q2",
+            start=start,
+            end=start + timedelta(hours=1),
+            description="Agenda:\n" + "- a very long line about the roadmap " * 5,
+            location="Room ☕ 4",
+            attendees="ann@example.com, bo@example.com",
+        ),
+        CalendarEvent(
+            id="day",
+            title="Offsite",
+            start=timezone_service.localize(datetime(2026, 11, 3)),
+            end=timezone_service.localize(datetime(2026, 11, 4)),
+            all_day=True,
+        ),
+    ]
+    target = io.StringIO(newline="")
+
+    assert write_ics(events, target, "Work") == 2
+    target.seek(0)
+    timed, all_day = read_ics(target)
+
+    assert timed["title"] == "Planning; Q1, Q2"
+    assert timed["description"] == events[0].description
+    assert timed["location"] == "Room ☕ 4"
+    assert timed["attendees"] == "ann@example.com, bo@example.com"
+    assert timed["start_time"] == start
+    assert timed["end_time"] == start + timedelta(hours=1)
+    assert (all_day["start_time"], all_day["end_time"]) == (
+        date(2026, 11, 3),
+        date(2026, 11, 4),
+    )
+
+
+def test_folded_lines_quoted_params_and_nested_components_are_read():
+    source = _calendar(
+        "UID:meeting\r\n"
+        "DTSTART;TZID=America/New_York:20261102T090000\r\n"
+        "DURATION:PT1H30M\r\n"
+        "SUMMARY:A summary that was fol\r\n"
+        " ded over\r\n"
+        "\tthree lines\r\n"
+        'ATTENDEE;CN="Doe; Jane":mailto:jane@example.com\r\n'
+        "BEGIN:VALARM\r\n"
+        "SUMMARY:Alarm text\r\n"
+        "END:VALARM\r\n"
+    )
+
+    (event,) = read_ics(source)
+
+    assert event["title"] == "A summary that was folded overthree lines"
+    assert event["attendees"] == "jane@example.com"
+    start = datetime(2026, 11, 2, 9, tzinfo=ZoneInfo("America/New_York"))
+    assert (event["start_time"], event["end_time"]) == (
+        start,
+        start + timedelta(hours=1, minutes=30),
+    )
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from calendar_assistant.models.timezone_service import timezone_service
+from scripts.ics_transfer import export_range
+
+
+def test_end_date_includes_that_whole_day():
+    start, end = export_range("2025-01-01", "2025-12-31")
+
+    assert start == timezone_service.localize(datetime(2025, 1, 1))
+    assert end == timezone_service.localize(datetime(2026, 1, 1))
+
+
+def test_end_with_a_time_is_used_as_is():
+    _, end = export_range("2025-01-01", "2025-12-31T12:00")
+
+    assert end == timezone_service.localize(datetime(2025, 12, 31, 12))
@@ -0,0 +1,101 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from calendar_assistant.models.async_google_calendar_model import (
+    AsyncGoogleCalendarModel,
+)
+from calendar_assistant.models.intent_router import IntentRouter
+from calendar_assistant.models.timezone_service import timezone_service
+from calendar_assistant.models.write_queue import OfflineWriteQueue
+
+
+@pytest.fixture
+def calendar(model, tmp_path):
+    """The async model with offline writes on, as in the default config."""
+    write_queue = OfflineWriteQueue(model, journal_path=str(tmp_path / "journal.db"))
+    async_model = AsyncGoogleCalendarModel(model, write_queue=write_queue)
+    yield async_model
+    async_model.shutdown()
+    write_queue.journal.close()
+
+
+def test_create_goes_through_the_write_queue_without_the_agent(fake_server, calendar):
+    router = IntentRouter(calendar)
+
+    response = asyncio.run(router.route("create Dentist tomorrow at 3pm"))
+
+    assert response is not None
+    assert response.startswith("✅ Successfully created Google Calendar event")
+    assert router.get_stats()["local_share"] == 1.0
+
+    tomorrow = timezone_service.now().date() + timedelta(days=1)
+    expected_start = timezone_service.localize(datetime.combine(tomorrow, time(15)))
+    pending = calendar.write_queue.journal.pending()
+    assert [m.payload["title"] for m in pending] == ["Dentist"]
+
+    assert calendar.write_queue.flush()["sent"] == 1
+    (stored,) = fake_server.events("primary")
+    assert stored["summary"] == "Dentist"
+    assert datetime.fromisoformat(stored["start"]["dateTime"]) == expected_start
+
+
+def test_ambiguous_requests_fall_back_to_the_agent(calendar):
+    router = IntentRouter(calendar)
+
+    assert asyncio.run(router.route("create meeting at 4")) is None
+    assert asyncio.run(router.route("add it tomorrow at 5pm")) is None
+    assert router.get_stats() == {
+        "total": 2,
+        "create": 0,
+        "list": 0,
+        "delete": 0,
+        "local": 0,
+        "local_share": 0.0,
+    }
+
+
+# Saturday, October 17th 2026
+NOW = timezone_service.localize(datetime(2026, 10, 17, 8, 0))
+
+
+@pytest.mark.parametrize(
+    "when, expected",
+    [
+        ("today", date(2026, 10, 17)),
+        ("tonight", date(2026, 10, 17)),
+        ("tomorrow", date(2026, 10, 18)),
+        ("day after tomorrow", date(2026, 10, 19)),
+        ("on tuesday", date(2026, 10, 20)),
+        ("this friday", date(2026, 10, 23)),
+        ("next friday", date(2026, 10, 23)),
+        ("on 2026-11-03", date(2026, 11, 3)),
+        ("on december 5", date(2026, 12, 5)),
+        ("dec. 5th", date(2026, 12, 5)),
+        ("nov 21st", date(2026, 11, 21)),
+        ("5 december", date(2026, 12, 5)),
+        ("5th of december", date(2026, 12, 5)),
+        ("21st of may", date(2027, 5, 21)),
+        ("3 of march", date(2027, 3, 3)),
+        ("on 2nd of jan", date(2027, 1, 2)),
+    ],
+)
+def test_day_phrases_resolve_to_the_day_that_was_said(when, expected):
+    router = IntentRouter(None)
+
+    intent = router.parse(f"create Dentist {when} at 9am", now=NOW)
+
+    assert intent is not None
+    assert intent.start == timezone_service.localize(
+        datetime.combine(expected, time(9))
+    )
+
+
+@pytest.mark.parametrize(
+    "when", ["on saturday", "february 30", "30th of february", "on 2026-02-30"]
+)
+def test_ambiguous_or_impossible_days_are_not_parsed(when):
+    router = IntentRouter(None)
+
+    assert router.parse(f"create Dentist {when} at 9am", now=NOW) is None
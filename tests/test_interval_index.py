@@ -0,0 +1,97 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from calendar_assistant.models.calendar_event import CalendarEvent
+from calendar_assistant.models.interval_index import IntervalIndex
+
+BASE = datetime(2026, 11, 2, tzinfo=timezone.utc)
+
+
+def _events(count: int, seed: int):
+    rng = random.Random(seed)
+    events = []
+    for index in range(count):
+        start = BASE + timedelta(minutes=15 * rng.randrange(400))
+        # Some zero-length events, some long ones that span many others
+        length = rng.choice([0, 15, 30, 60, 90, 600, 3000])
+        events.append(
+            CalendarEvent(
+                id=f"event{index}",
+                title=f"Event {index}",
+                start=start,
+                end=start + timedelta(minutes=length),
+            )
+        )
+    return events
+
+
+def _overlapping(events, start, end):
+    """Events overlapping [start, end), by checking every one."""
+    if start >= end:
+        return []
+    return [
+        event.id
+        for event in sorted(events, key=CalendarEvent.sort_key)
+        if event.start < end and (event.end > start)
+    ]
+
+
+def _queries(seed: int, count: int = 200):
+    rng = random.Random(seed)
+    for _ in range(count):
+        start = BASE + timedelta(minutes=rng.randrange(-600, 7000))
+        yield start, start + timedelta(minutes=rng.choice([0, 1, 15, 60, 240, 2000]))
+
+
+# Sizes around powers of two, where the implicit tree is incomplete
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 7, 8, 9, 31, 33, 100, 255, 257])
+# Level 0 walks the tree all the way down instead of scanning the leaves
+@pytest.mark.parametrize("scan_level", [0, IntervalIndex.SCAN_LEVEL])
+def test_overlap_queries_match_brute_force(monkeypatch, count, scan_level):
+    monkeypatch.setattr(IntervalIndex, "SCAN_LEVEL", scan_level)
+    events = _events(count, seed=count)
+    index = IntervalIndex(events)
+    by_id = {event.id: event for event in events}
+
+    for start, end in _queries(seed=count):
+        expected = _overlapping(events, start, end)
+        assert [event.id for event in index.overlapping(start, end)] == expected
+        assert [event.id for event in index.overlapping(start, end, limit=2)] == (
+            expected[:2]
+        )
+        assert index.is_free(start, end) == (not expected)
+        assert [event.id for event in index.containing(start, end)] == [
+            event_id
+            for event_id in expected
+            if by_id[event_id].start <= start and by_id[event_id].end >= end
+        ]
+        assert [event.id for event in index.within(start, end)] == [
+            event.id
+            for event in sorted(events, key=CalendarEvent.sort_key)
+            if start <= event.start < end and event.end <= end
+        ]
+        assert index.busy_until(start, end) == max(
+            (by_id[event_id].end for event_id in expected), default=None
+        )
+
+
+def test_next_free_slot_matches_brute_force():
+    events = _events(60, seed=1)
+    index = IntervalIndex(events)
+    duration = timedelta(hours=1)
+
+    for after, _ in _queries(seed=2, count=50):
+        # Free starts come right at ``after`` or right after an event ends
+        candidates = sorted(
+            {after} | {event.end for event in events if event.end > after}
+        )
+        expected = next(
+            candidate
+            for candidate in candidates
+            if not _overlapping(events, candidate, candidate + duration)
+        )
+        assert index.next_free_slot(duration, after) == expected
+
+    assert index.next_free_slot(timedelta(days=30), BASE, BASE + duration) is None
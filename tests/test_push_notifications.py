@@ -0,0 +1,84 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+from calendar_assistant.models.push_notifications import (
+    FakeNotifier,
+    NotificationReceiver,
+)
+
+CHANNEL = {
+    "id": "channel-1",
+    "resource_id": "resource-1",
+    "calendar_id": "primary",
+    "token": "secret",
+    "expiration": None,
+}
+
+
+def _event(event_id: str, start: datetime) -> dict:
+    return {
+        "id": event_id,
+        "summary": event_id,
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+    }
+
+
+def test_change_notification_triggers_sync(fake_server, model):
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+    fake_server.put_event("primary", _event("before", start))
+    model.sync_events("primary")
+    first_token = model._sync_tokens["primary"]
+
+    synced = threading.Event()
+    results = []
+
+    def on_change(calendar_id):
+        results.append((calendar_id, model.sync_events(calendar_id)))
+        synced.set()
+
+    receiver = NotificationReceiver(on_change, port=0)
+    receiver.start()
+    try:
+        receiver.register(CHANNEL)
+        notifier = FakeNotifier(receiver.url)
+
+        # The "sync" message sent when a channel opens is not a change
+        assert notifier.open_channel(CHANNEL) == 200
+        assert not synced.is_set()
+
+        fake_server.put_event("primary", _event("after", start))
+        assert notifier.notify(CHANNEL) == 200
+        assert synced.wait(5)
+    finally:
+        receiver.stop()
+
+    calendar_id, sync_result = results[0]
+    assert calendar_id == "primary"
+    assert sync_result["mode"] == "incremental"
+    assert sync_result["changed"] == 1
+    assert model._sync_tokens["primary"] != first_token
+    assert "after" in model.get_event_store("primary")
+    assert receiver.stats() == {
+        "received": 2,
+        "changes": 1,
+        "ignored": 1,
+        "rejected": 0,
+    }
+
+
+def test_notifications_for_unknown_channels_or_tokens_are_rejected():
+    changes = []
+    receiver = NotificationReceiver(changes.append, port=0)
+    receiver.start()
+    try:
+        receiver.register(CHANNEL)
+        notifier = FakeNotifier(receiver.url)
+
+        assert notifier.notify({**CHANNEL, "token": "wrong"}) == 403
+        assert notifier.notify({**CHANNEL, "id": "unknown"}) == 404
+    finally:
+        receiver.stop()
+
+    assert changes == []
+    assert receiver.stats()["rejected"] == 2
@@ -0,0 +1,147 @@
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from calendar_assistant.models.recurrence import (
+    RecurringSeries,
+    _normalize_until,
+    instance_id,
+    parse_instance_id,
+)
+from calendar_assistant.models.timezone_service import timezone_service
+
+STOCKHOLM = ZoneInfo("Europe/Stockholm")
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def _series(start, end, rules, time_zone=""):
+    if isinstance(start, date) and not isinstance(start, datetime):
+        times = {"start": {"date": start.isoformat()}, "end": {"date": end.isoformat()}}
+    else:
+        times = {
+            "start": {"dateTime": start.isoformat(), "timeZone": time_zone},
+            "end": {"dateTime": end.isoformat(), "timeZone": time_zone},
+        }
+    return RecurringSeries.from_google(
+        {"id": "series", "summary": "Standup", "recurrence": rules, **times}
+    )
+
+
+def test_until_is_normalized_to_the_form_dtstart_needs():
+    rule = "RRULE:FREQ=DAILY;UNTIL=20261105;BYDAY=MO"
+
+    assert _normalize_until(rule, aware=True) == (
+        "RRULE:FREQ=DAILY;UNTIL=20261105T235959Z;BYDAY=MO"
+    )
+    assert _normalize_until(rule, aware=False) == rule
+    assert _normalize_until("RRULE:FREQ=DAILY;UNTIL=20261105T090000Z", False) == (
+        "RRULE:FREQ=DAILY;UNTIL=20261105T090000"
+    )
+    assert _normalize_until("RRULE:FREQ=DAILY;UNTIL=20261105T090000", True) == (
+        "RRULE:FREQ=DAILY;UNTIL=20261105T090000Z"
+    )
+    assert _normalize_until("RRULE:FREQ=DAILY;COUNT=3", True) == (
+        "RRULE:FREQ=DAILY;COUNT=3"
+    )
+
+
+def test_date_until_includes_the_last_day():
+    start = datetime(2026, 11, 2, 9, tzinfo=STOCKHOLM)
+    series = _series(
+        start, start + timedelta(minutes=15), ["RRULE:FREQ=DAILY;UNTIL=20261104"]
+    )
+
+    instances = list(series.expand(start, start + timedelta(days=10)))
+
+    assert [instance.start.day for instance in instances] == [2, 3, 4]
+
+
+def test_instance_ids_match_google():
+    start = datetime(2026, 11, 2, 9, tzinfo=STOCKHOLM)
+
+    assert instance_id("series", start, all_day=False) == "series_20261102T080000Z"
+    assert (
+        instance_id("series", timezone_service.localize(datetime(2026, 11, 2)), True)
+        == "series_20261102"
+    )
+    assert parse_instance_id("series_20261102T080000Z") == ("series", start)
+    assert parse_instance_id("series_20261102") == (
+        "series",
+        timezone_service.localize(datetime(2026, 11, 2)),
+    )
+    assert parse_instance_id("series") is None
+    assert parse_instance_id("my_event") is None
+
+
+def test_timed_series_keeps_its_wall_clock_time_across_dst():
+    # New York falls back on November 1st 2026
+    start = datetime(2026, 10, 29, 9, tzinfo=NEW_YORK)
+    series = _series(
+        start,
+        start + timedelta(minutes=30),
+        ["RRULE:FREQ=DAILY;COUNT=5"],
+        "America/New_York",
+    )
+
+    instances = list(series.expand(start, start + timedelta(days=10)))
+
+    assert [instance.start.astimezone(NEW_YORK).hour for instance in instances] == [
+        9
+    ] * 5
+    assert [instance.id for instance in instances] == [
+        "series_20261029T130000Z",
+        "series_20261030T130000Z",
+        "series_20261031T130000Z",
+        "series_20261101T140000Z",
+        "series_20261102T140000Z",
+    ]
+    assert all(
+        instance.end - instance.start == timedelta(minutes=30) for instance in instances
+    )
+
+
+def test_expand_windows_exceptions_and_exdates():
+    start = datetime(2026, 11, 2, 9, tzinfo=STOCKHOLM)
+    series = _series(
+        start,
+        start + timedelta(hours=1),
+        [
+            "RRULE:FREQ=WEEKLY;BYDAY=MO,WE",
+            "EXDATE;TZID=Europe/Stockholm:20261104T090000",
+        ],
+        "Europe/Stockholm",
+    )
+    moved = datetime(2026, 11, 9, 9, tzinfo=STOCKHOLM)
+
+    # The window starts mid-instance, which still overlaps it
+    instances = series.expand(
+        start + timedelta(minutes=30),
+        datetime(2026, 11, 16, tzinfo=STOCKHOLM),
+        skip={moved.astimezone(timezone.utc)},
+    )
+
+    assert [instance.start for instance in instances] == [
+        start,
+        datetime(2026, 11, 11, 9, tzinfo=STOCKHOLM),
+    ]
+
+
+def test_all_day_series_repeats_on_local_dates():
+    series = _series(
+        date(2026, 10, 24), date(2026, 10, 25), ["RRULE:FREQ=DAILY;COUNT=3"]
+    )
+
+    instances = list(
+        series.expand(
+            timezone_service.localize(datetime(2026, 10, 1)),
+            timezone_service.localize(datetime(2026, 11, 1)),
+        )
+    )
+
+    assert [instance.id for instance in instances] == [
+        "series_20261024",
+        "series_20261025",
+        "series_20261026",
+    ]
+    assert [
+        timezone_service.to_local(instance.start).hour for instance in instances
+    ] == [0, 0, 0]
@@ -0,0 +1,163 @@
+import json
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from calendar_assistant.models import request_scheduler
+from calendar_assistant.models.request_scheduler import RequestScheduler, TokenBucket
+
+
+class FakeClock:
+    """Stands in for time.monotonic and time.sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(request_scheduler.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(request_scheduler.time, "sleep", fake.sleep)
+    return fake
+
+
+def _http_error(status, reason=None):
+    content = b""
+    if reason:
+        content = json.dumps(
+            {"error": {"code": status, "errors": [{"reason": reason}]}}
+        ).encode()
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+class Request:
+    """A request that fails with the given errors, then succeeds."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"ok": True}
+
+
+def test_bucket_allows_a_burst_then_refills_at_the_rate(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    clock.now += 1
+    assert [bucket.acquire() for _ in range(2)] == [0, 0]
+    assert bucket.acquire(2) == pytest.approx(1.0)
+    # Never more than the capacity, however long it sat idle
+    clock.now += 100
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.acquire() > 0
+
+
+def test_backoff_is_exponential_with_full_jitter_and_a_cap(monkeypatch):
+    monkeypatch.setattr(request_scheduler.random, "uniform", lambda low, high: high)
+    scheduler = RequestScheduler(rate=10, burst=10, base_delay=0.5, max_delay=4)
+
+    assert [scheduler.backoff_delay(attempt) for attempt in range(5)] == [
+        0.5,
+        1,
+        2,
+        4,
+        4,
+    ]
+    monkeypatch.setattr(request_scheduler.random, "uniform", lambda low, high: low)
+    assert scheduler.backoff_delay(3) == 0
+
+
+@pytest.mark.parametrize(
+    "error, rate_limited",
+    [
+        (_http_error(429), True),
+        (_http_error(403, "rateLimitExceeded"), True),
+        (_http_error(403, "userRateLimitExceeded"), True),
+        (_http_error(403, "forbidden"), False),
+        (_http_error(403), False),
+        (_http_error(500), False),
+    ],
+)
+def test_rate_limit_classification(error, rate_limited):
+    assert RequestScheduler.is_rate_limited(error) is rate_limited
+
+
+@pytest.mark.parametrize(
+    "error, idempotent, retried",
+    [
+        (_http_error(429), False, True),
+        (_http_error(403, "rateLimitExceeded"), False, True),
+        (_http_error(503), True, True),
+        # A failed insert may still have been applied
+        (_http_error(503), False, False),
+        (ConnectionError(), True, True),
+        (ConnectionError(), False, False),
+        (_http_error(400), True, False),
+        (_http_error(403, "forbidden"), True, False),
+    ],
+)
+def test_retry_classification(clock, error, idempotent, retried):
+    scheduler = RequestScheduler(rate=100, burst=100)
+    request = Request(error)
+
+    if retried:
+        assert scheduler.execute(request, idempotent=idempotent) == {"ok": True}
+        assert request.calls == 2
+        assert scheduler.stats()["retried"] == 1
+    else:
+        with pytest.raises(type(error)):
+            scheduler.execute(request, idempotent=idempotent)
+        assert request.calls == 1
+        assert scheduler.stats()["failed"] == 1
+
+
+def test_gives_up_after_max_retries(clock):
+    scheduler = RequestScheduler(rate=100, burst=100, max_retries=3)
+    request = Request(*[_http_error(429) for _ in range(10)])
+
+    with pytest.raises(HttpError):
+        scheduler.execute(request)
+
+    assert request.calls == 4
+    assert scheduler.stats()["rate_limited"] == 4
+    assert scheduler.stats()["retried"] == 3
+    assert scheduler.stats()["failed"] == 1
+
+
+def test_not_modified_is_raised_without_retrying(clock):
+    scheduler = RequestScheduler(rate=100, burst=100)
+    request = Request(_http_error(304))
+
+    with pytest.raises(HttpError):
+        scheduler.execute(request)
+
+    assert request.calls == 1
+    assert scheduler.stats()["not_modified"] == 1
+    assert scheduler.stats()["failed"] == 0
+
+
+def test_requests_wait_for_tokens(clock):
+    scheduler = RequestScheduler(rate=1, burst=2)
+
+    for _ in range(4):
+        scheduler.execute(Request())
+
+    assert scheduler.stats()["calls"] == 4
+    assert scheduler.stats()["throttled"] == 2
+    assert sum(clock.slept) == pytest.approx(2)
@@ -0,0 +1,135 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.agents import AgentAction
+from langchain_core.messages import AIMessageChunk
+
+from calendar_assistant.models.agent_cache import AgentCache
+
+try:
+    from calendar_assistant.models import supervisor_model
+except ImportError:
+    # Needs the AgentExecutor of the langchain versions in requirements.txt
+    pytest.skip("langchain.agents.AgentExecutor is missing", allow_module_level=True)
+
+TOOL = "get_google_calendar_today_events"
+
+
+class FakeExecutor:
+    """Replays ``astream_events`` v2 events of one agent run."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.runs = 0
+
+    async def astream_events(self, inputs, version):
+        assert version == "v2"
+        assert "User request: what's on today?" in inputs["input"]
+        self.runs += 1
+        root = {"run_id": "root", "parent_ids": []}
+        child = {"parent_ids": ["root"]}
+
+        yield {"event": "on_chain_start", "name": "AgentExecutor", "data": {}, **root}
+        yield _token("Let me check.")
+        # Function-call chunks carry no text
+        yield _token("")
+        yield {"event": "on_tool_start", "name": TOOL, "data": {}, **child}
+        if self.fail:
+            raise RuntimeError("tool crashed")
+        yield {"event": "on_tool_end", "name": TOOL, "data": {}, **child}
+        # Nested chains end too; only the root's output is the reply
+        yield {
+            "event": "on_chain_end",
+            "name": "RunnableSequence",
+            "data": {"output": {"output": "not the reply"}},
+            **child,
+        }
+        yield _token("You have ")
+        yield _token("Standup.")
+        yield {
+            "event": "on_chain_end",
+            "name": "AgentExecutor",
+            "data": {
+                "output": {
+                    "output": "You have Standup.",
+                    "intermediate_steps": [
+                        (AgentAction(TOOL, {}, ""), "Standup at 09:00")
+                    ],
+                }
+            },
+            **root,
+        }
+
+
+def _token(text):
+    return {
+        "event": "on_chat_model_stream",
+        "name": "ChatOpenAI",
+        "data": {"chunk": AIMessageChunk(content=text)},
+        "parent_ids": ["root"],
+    }
+
+
+def _supervisor(executor, cache=None):
+    supervisor = supervisor_model.SupervisorModel.__new__(
+        supervisor_model.SupervisorModel
+    )
+    supervisor.agent_executor = executor
+    supervisor.cache = cache
+    supervisor.model = None
+    supervisor.tools = {}
+    supervisor.google_calendar_model = SimpleNamespace(state_version=1)
+    return supervisor
+
+
+def _stream(supervisor, text="what's on today?"):
+    async def collect():
+        return [
+            event async for event in supervisor.stream_message(text, cache_key=text)
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_stream_yields_tokens_tools_and_the_reply_last():
+    events = _stream(_supervisor(FakeExecutor()))
+
+    assert events == [
+        {"type": "token", "text": "Let me check."},
+        {"type": "tool_start", "tool": TOOL},
+        {"type": "tool_end", "tool": TOOL},
+        {"type": "token", "text": "You have "},
+        {"type": "token", "text": "Standup."},
+        {"type": "done", "text": "You have Standup."},
+    ]
+
+
+def test_streamed_reply_is_cached_for_the_same_request():
+    executor = FakeExecutor()
+    cache = AgentCache()
+    supervisor = _supervisor(executor, cache)
+
+    _stream(supervisor)
+    events = _stream(supervisor)
+
+    assert events == [{"type": "done", "text": "You have Standup."}]
+    assert executor.runs == 1
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_failure_mid_stream_ends_with_an_error_reply():
+    cache = AgentCache()
+    cache.put_answer("other request", None, 1, "stale")
+    events = _stream(_supervisor(FakeExecutor(fail=True), cache))
+
+    assert events[-1]["type"] == "done"
+    assert "tool crashed" in events[-1]["text"]
+    assert [event["type"] for event in events[:-1]] == ["token", "tool_start"]
+    assert len(cache) == 0
+
+
+def test_stream_without_an_agent_only_reports_done():
+    events = _stream(_supervisor(None))
+
+    assert [event["type"] for event in events] == ["done"]
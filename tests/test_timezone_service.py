@@ -0,0 +1,70 @@
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from calendar_assistant.models import timezone_service as timezone_module
+from calendar_assistant.models.timezone_service import TimezoneService
+
+
+@pytest.fixture
+def environment(monkeypatch):
+    """No zone configured anywhere; tests set the sources they need."""
+    monkeypatch.delenv("CALENDAR_TIMEZONE", raising=False)
+    monkeypatch.delenv("TZ", raising=False)
+    monkeypatch.setattr(timezone_module, "_system_zone_name", lambda: None)
+    return monkeypatch
+
+
+def test_zone_is_resolved_in_order(environment):
+    environment.setattr(timezone_module, "_system_zone_name", lambda: "Asia/Tokyo")
+    assert TimezoneService().name == "Asia/Tokyo"
+
+    environment.setenv("TZ", ":America/New_York")
+    assert TimezoneService().name == "America/New_York"
+
+    environment.setenv("CALENDAR_TIMEZONE", "Europe/Stockholm")
+    assert TimezoneService().name == "Europe/Stockholm"
+
+    assert TimezoneService("Australia/Sydney").name == "Australia/Sydney"
+
+
+def test_unknown_names_fall_through_to_the_next_source(environment):
+    environment.setenv("CALENDAR_TIMEZONE", "Not/AZone")
+    environment.setenv("TZ", "")
+    environment.setattr(timezone_module, "_system_zone_name", lambda: "Asia/Tokyo")
+
+    assert TimezoneService("../etc/passwd").name == "Asia/Tokyo"
+
+
+def test_no_known_zone_keeps_the_system_offset(environment):
+    service = TimezoneService()
+
+    assert service.name == "UTC"
+    assert service.tz.utcoffset(None) == datetime.now().astimezone().utcoffset()
+
+
+def test_configure_switches_zone_and_clears_cached_dates(environment):
+    service = TimezoneService("Europe/Stockholm")
+    late_evening = datetime(2026, 11, 2, 23, 30, tzinfo=timezone.utc)
+    assert service.local_date(late_evening) == date(2026, 11, 3)
+
+    service.configure("America/New_York")
+
+    assert service.name == "America/New_York"
+    assert service.local_date(late_evening) == date(2026, 11, 2)
+
+
+def test_conversions_follow_the_zone(environment):
+    service = TimezoneService("Europe/Stockholm")
+    stockholm = ZoneInfo("Europe/Stockholm")
+
+    assert service.localize(datetime(2026, 7, 1, 9)) == datetime(
+        2026, 7, 1, 9, tzinfo=stockholm
+    )
+    aware = datetime(2026, 7, 1, 9, tzinfo=timezone.utc)
+    assert service.localize(aware) is aware
+    assert service.to_local(aware).hour == 11
+    assert service.utc_offset(datetime(2026, 7, 1, 12)) == "+02:00"
+    assert service.utc_offset(datetime(2026, 1, 1, 12)) == "+01:00"
+    assert service.now().tzinfo is service.tz
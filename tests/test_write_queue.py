@@ -0,0 +1,179 @@
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from calendar_assistant.models.write_queue import (
+    OfflineWriteQueue,
+    default_journal_path,
+)
+
+
+@pytest.fixture
+def queue(model, tmp_path):
+    write_queue = OfflineWriteQueue(model, journal_path=str(tmp_path / "journal.db"))
+    yield write_queue
+    write_queue.journal.close()
+
+
+def test_create_accepts_datetimes_and_dates(fake_server, queue):
+    start = datetime(2026, 11, 2, 9, 30, tzinfo=ZoneInfo("America/New_York"))
+    timed = queue.create_event(
+        {
+            "title": "Standup",
+            "start_time": start,
+            "end_time": start + timedelta(hours=1),
+        }
+    )
+    all_day = queue.create_event(
+        {
+            "title": "Offsite",
+            "start_time": date(2026, 11, 3),
+            "end_time": date(2026, 11, 4),
+        }
+    )
+
+    # Journaled values come back with their types and zones
+    payloads = {m.event_id: m.payload for m in queue.journal.pending()}
+    assert payloads[timed.id]["start_time"] == start
+    assert payloads[timed.id]["start_time"].tzinfo.key == "America/New_York"
+    assert payloads[all_day.id]["start_time"] == date(2026, 11, 3)
+
+    assert queue.flush() == {"sent": 2, "dropped": 0, "retry": 0}
+    stored = {event["id"]: event for event in fake_server.events("primary")}
+    assert stored[timed.id]["start"]["timeZone"] == "America/New_York"
+    assert datetime.fromisoformat(stored[timed.id]["start"]["dateTime"]) == start
+    assert stored[all_day.id]["start"] == {"date": "2026-11-03"}
+
+
+def test_patch_of_unknown_event_is_rejected(queue):
+    assert queue.patch_event("doesnotexist", {"title": "Renamed"}) is None
+    assert queue.pending_count() == 0
+
+
+def test_patch_of_server_event_is_queued(fake_server, queue):
+    start = datetime(2026, 11, 2, 9, tzinfo=ZoneInfo("Europe/Stockholm"))
+    fake_server.put_event(
+        "primary",
+        {
+            "id": "existing",
+            "summary": "Review",
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+        },
+    )
+
+    patched = queue.patch_event("existing", {"title": "Design review"})
+    assert patched.title == "Design review"
+    assert patched.start == start
+
+    assert queue.flush()["sent"] == 1
+    assert fake_server.events("primary")[0]["summary"] == "Design review"
+
+
+def test_full_sync_keeps_pending_writes(fake_server, model, queue):
+    start = datetime.now(ZoneInfo("Europe/Stockholm")).replace(
+        microsecond=0
+    ) + timedelta(days=1)
+    for event_id in ("kept", "renamed", "deleted"):
+        fake_server.put_event(
+            "primary",
+            {
+                "id": event_id,
+                "summary": event_id,
+                "start": {"dateTime": start.isoformat()},
+                "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+            },
+        )
+    model.sync_events("primary")
+
+    created = queue.create_event(
+        {"title": "New", "start_time": start, "end_time": start + timedelta(hours=1)}
+    )
+    queue.patch_event("renamed", {"title": "Renamed"})
+    queue.delete_event("deleted")
+
+    # A resync from scratch must not bring back the server's old state
+    fake_server.expire_sync_tokens()
+    fake_server.put_event(
+        "primary",
+        {
+            "id": "other",
+            "summary": "other",
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+        },
+    )
+    assert model.sync_events("primary")["mode"] == "full"
+
+    events = {
+        event.id: event.title
+        for event in model.get_synced_events(
+            start - timedelta(hours=1), start + timedelta(hours=2), "primary"
+        )
+    }
+    assert events == {
+        "kept": "kept",
+        "renamed": "Renamed",
+        created.id: "New",
+        "other": "other",
+    }
+
+
+def test_default_journal_is_outside_the_working_tree(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    monkeypatch.delenv("CALENDAR_WRITE_JOURNAL", raising=False)
+    assert default_journal_path() == str(
+        tmp_path / "ai-calendar-assistant" / "write_journal.db"
+    )
+
+
+def test_queued_patch_of_a_summary_copy_is_not_served_as_full(fake_server, queue):
+    start = datetime(2026, 11, 2, 9, tzinfo=ZoneInfo("Europe/Stockholm"))
+    fake_server.put_event(
+        "primary",
+        {
+            "id": "existing",
+            "summary": "Review",
+            "description": "Agenda in the doc",
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+        },
+    )
+    model = queue.google_calendar_model
+    model.get_event("existing", detail="summary")
+
+    queue.patch_event("existing", {"title": "Design review"})
+    assert model.get_cached_event("existing").title == "Design review"
+    assert model.get_cached_event("existing", detail="full") is None
+
+    # Full details still come from the server
+    fake_server.reset_stats()
+    assert model.get_event("existing", detail="full").description == (
+        "Agenda in the doc"
+    )
+    assert fake_server.stats()["api_calls"] == 1
+
+
+def test_delete_of_unknown_event_is_rejected(queue):
+    assert queue.delete_event("doesnotexist") is False
+    assert queue.pending_count() == 0
+
+
+def test_delete_of_event_gone_from_the_server_is_not_reported_sent(fake_server, queue):
+    start = datetime(2026, 11, 2, 9, tzinfo=ZoneInfo("Europe/Stockholm"))
+    fake_server.put_event(
+        "primary",
+        {
+            "id": "existing",
+            "summary": "Review",
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+        },
+    )
+
+    assert queue.delete_event("existing") is True
+    fake_server.remove_event("primary", "existing")
+
+    assert queue.flush() == {"sent": 0, "dropped": 1, "retry": 0}
+    assert queue.pending_count() == 0